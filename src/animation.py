@@ -0,0 +1,54 @@
+class AnimationClock:
+    def __init__(self):
+        """
+        Single time source every animation reads its current frame from
+
+        Frames are a function of elapsed time, not of how often animate() ran, so
+        animations keep their speed at any frame rate and entities that are not
+        drawn do no animation work at all: their frame is worked out when they
+        are drawn again. Lookups are cached per (start, fps, frame count) until
+        the clock moves, so entities in the same phase share one computation.
+        """
+        self.time = 0.0  # Milliseconds
+        self.lookups = {}
+
+        # Stats for the current time
+        self.computed = 0
+        self.shared = 0
+
+    def set(self, time_ms):
+        """
+        Move the clock, e.g. to the render time of the current frame
+
+        :param time_ms: Animation time in milliseconds
+        """
+        if time_ms != self.time:
+            self.time = time_ms
+            self.lookups.clear()
+            self.computed = self.shared = 0
+
+    def frame(self, start, fps, frame_count, loop=True):
+        """
+        Get the frame index of an animation
+
+        :param start: Clock time (ms) the animation started at
+        :param fps: Animation frames per second
+        :param frame_count: Frames in the animation
+        :param loop: Wrap around (otherwise hold the last frame)
+        :return: Frame index
+        """
+        key = (start, fps, frame_count, loop)
+        index = self.lookups.get(key)
+        if index is not None:
+            self.shared += 1
+            return index
+
+        index = max(0, int((self.time - start) * fps / 1000))
+        index = index % frame_count if loop else min(index, frame_count - 1)
+        self.lookups[key] = index
+        self.computed += 1
+        return index
+
+
+# Shared by every animated entity
+animation_clock = AnimationClock()
@@ -0,0 +1,51 @@
+import json
+import os
+
+import pygame
+
+DEFAULT_INDEX = 'assets/atlas/atlas.json'
+
+
+class TextureAtlas:
+    def __init__(self, pages, entries):
+        """
+        Pre-scaled frames packed into a few large images
+
+        :param pages: List of page surfaces
+        :param entries: Dict of key -> (page, x, y, width, height)
+        """
+        self.pages = pages
+        self.entries = entries
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Get the frame stored under a key as a subsurface of its page
+        """
+        page, x, y, width, height = self.entries[key]
+        return self.pages[page].subsurface((x, y, width, height))
+
+    @classmethod
+    def load(cls, index_path=DEFAULT_INDEX):
+        """
+        Load an atlas written by build_atlas.py
+
+        :param index_path: Path of the JSON index; pages are resolved next to it
+        :return: TextureAtlas, or None if no atlas has been baked
+        """
+        if not os.path.exists(index_path):
+            return None
+
+        with open(index_path) as file:
+            index = json.load(file)
+
+        directory = os.path.dirname(index_path)
+        pages = [pygame.image.load(os.path.join(directory, page)).convert_alpha()
+                 for page in index['pages']]
+        entries = {key: tuple(entry) for key, entry in index['entries'].items()}
+        return cls(pages, entries)
@@ -0,0 +1,346 @@
+"""
+Headless performance scenarios
+
+Run from the project root, e.g.:
+    python src/benchmark.py horde --enemies 1000 --steps 300
+    python src/benchmark.py render --enemies 1000 --steps 300
+    python src/benchmark.py world --steps 600
+    python src/benchmark.py server --steps 300
+    python src/benchmark.py projectiles --enemies 250 --steps 300
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+
+def setup_display(width=800, height=600):
+    """
+    Create a hidden display so images can be converted like in the game
+    """
+    pygame.init()
+    return pygame.display.set_mode((width, height))
+
+
+def report(name, samples):
+    """
+    Print mean and tail timings for a list of per-step durations in seconds
+    """
+    samples = sorted(samples)
+    mean = statistics.mean(samples) * 1000
+    p95 = samples[int(len(samples) * 0.95) - 1] * 1000
+    worst = samples[-1] * 1000
+    print(f"{name:<28} mean {mean:7.3f} ms   p95 {p95:7.3f} ms   max {worst:7.3f} ms")
+
+
+def spawn_horde(count, center, radius, seed):
+    """
+    Create enemies scattered on a disc around a point
+    """
+    from enemy import Enemy
+
+    rng = random.Random(seed)
+    enemies = []
+    for _ in range(count):
+        x = center[0] + rng.uniform(-radius, radius)
+        y = center[1] + rng.uniform(-radius, radius)
+        enemies.append(Enemy((x, y)))
+    return enemies
+
+
+def make_player():
+    """
+    Create a player that survives the whole run
+    """
+    from sprite import AnimatedSprite
+    from game import Game
+
+    player = AnimatedSprite((400, 300), Game.PLAYER_SPRITESHEET_CONFIG)
+    player.health = float('inf')
+    return player
+
+
+def bench_horde(args):
+    """
+    Compare the per-sprite enemy update with the vectorized EnemyManager pass
+    """
+    from enemy_manager import EnemyManager
+    from flow_field import FlowField
+
+    setup_display()
+    player = make_player()
+
+    print(f"horde: {args.enemies} enemies, {args.steps} steps")
+
+    enemies = spawn_horde(args.enemies, player.rect.center, 1500, args.seed)
+    legacy = pygame.sprite.Group(enemies)
+    samples = []
+    for step in range(args.steps):
+        start = time.perf_counter()
+        for enemy in legacy:
+            enemy.update(player)
+            enemy.attack_player(player)
+        samples.append(time.perf_counter() - start)
+    report("per-sprite update", samples)
+
+    variants = (
+        ("EnemyManager.update", 0, False, False),
+        ("  + crowd separation", 1.5, False, False),
+        ("  + separation, flow field", 1.5, True, False),
+        ("  + separation, flow, LOD", 1.5, True, True),
+    )
+    for name, strength, use_flow_field, use_lod in variants:
+        enemies = spawn_horde(args.enemies, player.rect.center, 1500, args.seed)
+        manager = EnemyManager(enemies, separation_strength=strength)
+        view = pygame.Rect(0, 0, 800, 600)
+        if use_flow_field:
+            manager.flow_field = FlowField()
+        samples = []
+        for step in range(args.steps):
+            # Walk the player so the flow field has to follow it
+            player.rect.x += 5 if (step // 60) % 2 == 0 else -5
+            start = time.perf_counter()
+            if manager.flow_field:
+                manager.flow_field.set_targets([player.rect.center])
+            view.center = player.rect.center
+            manager.update(player, current_time=step * 16, view=view if use_lod else None)
+            samples.append(time.perf_counter() - start)
+        report(name, samples)
+        if use_lod:
+            print(f"{'':<28} LOD tiers at end: {manager.tier_counts}")
+
+
+def bench_projectiles(args):
+    """
+    Compare end-position overlap, substeps and swept tests for fast projectiles
+    """
+    from enemy_manager import EnemyManager
+    from projectile_registry import ProjectileRegistry
+    from weapons.projectile import Ammo
+
+    setup_display()
+    player = make_player()
+    manager = EnemyManager(spawn_horde(args.enemies, player.rect.center, 600, args.seed))
+    registry = ProjectileRegistry()
+    rng = random.Random(args.seed)
+    print(f"projectiles: {registry.max_active} Ammo at {Ammo.SPEED} px/step, {args.enemies} enemies, "
+          f"{args.steps} steps")
+
+    def fire():
+        # A fresh volley every step, each bullet one step into its flight
+        for projectile in list(registry):
+            projectile.expire()
+        registry.spawn_from([(Ammo, player.rect.centerx + rng.uniform(-700, 700),
+                              player.rect.centery + rng.uniform(-700, 700), rng.uniform(0, 360), None)
+                             for _ in range(registry.max_active)])
+        for projectile in registry:
+            projectile.previous_position = projectile.rect.topleft
+        registry.update()
+
+    def substeps(count):
+        hits = 0
+        for projectile in registry:
+            end = projectile.rect.topleft
+            start = projectile.previous_position
+            for step in range(1, count + 1):
+                projectile.rect.topleft = (start[0] + (end[0] - start[0]) * step / count,
+                                           start[1] + (end[1] - start[1]) * step / count)
+                if pygame.sprite.spritecollideany(projectile, manager):
+                    hits += 1
+                    break
+            projectile.rect.topleft = end
+        return hits
+
+    variants = (
+        ("end position groupcollide", lambda: len(pygame.sprite.groupcollide(registry.active, manager, False, False))),
+        ("4 substeps", lambda: substeps(4)),
+        ("swept grid traversal", lambda: len(registry.find_hits(manager))),
+    )
+    for name, detect in variants:
+        rng.seed(args.seed)
+        samples = []
+        hits = 0
+        for _ in range(args.steps):
+            fire()
+            start = time.perf_counter()
+            hits += detect()
+            samples.append(time.perf_counter() - start)
+        report(name, samples)
+        print(f"{'':<28} {hits} hits")
+
+
+def compare_render(label, sprites, camera, renderer, steps):
+    """
+    Time one set of sprites drawn per-blit and through a RenderQueue
+    """
+    from render_queue import RenderQueue
+
+    samples = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        renderer.begin_frame(camera.offset(0.5))
+        for sprite in sprites:
+            renderer.blit(sprite.image, camera.apply(sprite, 0.5))
+        samples.append(time.perf_counter() - start)
+    report(f"{label}: per-sprite blit", samples)
+
+    queue = RenderQueue()
+    samples = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        camera_offset = camera.offset(0.5)
+        renderer.begin_frame(camera_offset)
+        for sprite in sprites:
+            queue.add_sprite(sprite, queue.ENTITIES)
+        queue.flush(renderer, camera_offset, 0.5)
+        samples.append(time.perf_counter() - start)
+    report(f"{label}: RenderQueue", samples)
+
+
+def bench_render(args):
+    """
+    Compare camera.apply() + blit per sprite with the batched RenderQueue
+
+    Enemy frames are fill-rate bound; small projectiles show the per-call overhead.
+    """
+    from camera import Camera
+    from dirty_renderer import DirtyRectRenderer
+    from weapons.projectile import FlameParticle
+
+    screen = setup_display()
+    player = make_player()
+    camera = Camera(800, 600, target=player)
+    camera.update()
+    renderer = DirtyRectRenderer(screen)
+    print(f"render: {args.enemies} sprites, {args.steps} frames")
+
+    # Keep everyone on screen so both paths draw the same number of pixels
+    enemies = spawn_horde(args.enemies, player.rect.center, 250, args.seed)
+    compare_render("enemies", enemies, camera, renderer, args.steps)
+
+    rng = random.Random(args.seed)
+    projectiles = [FlameParticle(player.rect.centerx + rng.uniform(-350, 350),
+                                 player.rect.centery + rng.uniform(-250, 250),
+                                 rng.uniform(0, 360))
+                   for _ in range(args.enemies)]
+    compare_render("projectiles", projectiles, camera, renderer, args.steps)
+
+
+def bench_world(args):
+    """
+    Compare blitting every visible tile with drawing pre-rendered chunks while panning
+    """
+    from world import World
+
+    screen = setup_display()
+    world = World(seed=args.seed)
+    size = world.tile_size
+    tiles = world.tileset.tiles
+    print(f"world: {args.steps} frames panning diagonally")
+
+    samples = []
+    for step in range(args.steps):
+        offset_x, offset_y = step * 7, step * 3
+        start = time.perf_counter()
+        first_col, first_row = offset_x // size, offset_y // size
+        for row in range(first_row, first_row + screen.get_height() // size + 2):
+            for col in range(first_col, first_col + screen.get_width() // size + 2):
+                tile = tiles[hash((col, row)) % len(tiles)]
+                screen.blit(tile, (col * size - offset_x, row * size - offset_y))
+        samples.append(time.perf_counter() - start)
+    report("per-tile blit", samples)
+
+    samples = []
+    for step in range(args.steps):
+        offset = (step * 7, step * 3)
+        start = time.perf_counter()
+        world.stream(pygame.Rect(offset, screen.get_size()))
+        world.draw(screen, offset)
+        samples.append(time.perf_counter() - start)
+    report("chunks + streaming", samples)
+    print(f"{'':<28} {world.builds} chunks built, {world.evictions} evicted, "
+          f"{len(world.chunks)} cached at end")
+
+
+def bench_server(args):
+    """
+    Compare pickling a snapshot per client with encoding once and fanning it out
+    """
+    import pickle
+    import socket
+    from protocol import Broadcaster, Subscriber
+
+    rng = random.Random(args.seed)
+    for clients in (8, 32, 128):
+        snapshot = {client_id: {'position': (rng.uniform(0, 2000), rng.uniform(0, 2000)),
+                                'animation': 'walk', 'kills': rng.randrange(100),
+                                'coins': rng.randrange(1000), 'rtt': rng.uniform(10, 90)}
+                    for client_id in range(1, clients + 1)}
+        pairs = [socket.socketpair() for _ in range(clients)]
+        for server_end, client_end in pairs:
+            server_end.setblocking(False)
+            client_end.setblocking(False)
+
+        def drain():
+            for _, client_end in pairs:
+                try:
+                    while client_end.recv(1 << 20):
+                        pass
+                except BlockingIOError:
+                    pass
+
+        print(f"server: {clients} clients, {args.steps} ticks")
+        samples = []
+        for _ in range(args.steps):
+            start = time.perf_counter()
+            for server_end, _ in pairs:
+                server_end.sendall(pickle.dumps(snapshot))
+            samples.append(time.perf_counter() - start)
+            drain()
+        report("pickle + sendall per client", samples)
+
+        broadcaster = Broadcaster()
+        subscribers = [Subscriber(server_end, client_id)
+                       for client_id, (server_end, _) in enumerate(pairs, 1)]
+        samples = []
+        for _ in range(args.steps):
+            start = time.perf_counter()
+            broadcaster.broadcast(subscribers, snapshot)
+            samples.append(time.perf_counter() - start)
+            drain()
+        report("encode once + fan-out", samples)
+        print(f"{'':<28} {broadcaster.last_size} byte snapshot")
+
+        for server_end, client_end in pairs:
+            server_end.close()
+            client_end.close()
+
+
+SCENARIOS = {
+    'horde': bench_horde,
+    'render': bench_render,
+    'world': bench_world,
+    'server': bench_server,
+    'projectiles': bench_projectiles,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a headless performance scenario")
+    parser.add_argument('scenario', choices=sorted(SCENARIOS))
+    parser.add_argument('--enemies', type=int, default=1000)
+    parser.add_argument('--steps', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    SCENARIOS[args.scenario](args)
+
+
+if __name__ == "__main__":
+    main()
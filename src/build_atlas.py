@@ -0,0 +1,113 @@
+"""
+Offline asset bake: packs every frame the game loads into a few atlas pages
+
+Run from the project root:
+    python src/build_atlas.py --output assets/atlas
+
+At runtime Game attaches the atlas to the image cache, so enemies, players and
+weapons read pre-scaled frames from the pages instead of opening and scaling
+dozens of individual PNGs (each a separate fetch in the web build).
+"""
+import argparse
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+PADDING = 1
+
+
+def collect_frames():
+    """
+    Run every runtime loader once and return the surfaces they produced
+
+    :return: Dict of atlas key -> surface
+    """
+    from enemy import Enemy
+    from game import Game
+    from image_cache import images
+    from weapons.registry import default_registry
+
+    images.atlas = None
+    images.clear()
+
+    for dino_type in Enemy.DINOSAUR_TYPES:
+        for action, frame_count in Enemy.ACTION_FRAME_COUNTS.items():
+            images.frames(Enemy.sheet_path(dino_type, action), frame_count, 2)
+
+    for config in Game.PLAYER_SPRITESHEET_CONFIG.values():
+        images.frames(config['file'], config['frame_count'], 2,
+                      (config['frame_width'], config['frame_height']))
+
+    registry = default_registry()
+    for name in registry.names:
+        registry.create(name, None)
+
+    return {key: image for key, image in images.images.items() if key not in images.sheet_keys}
+
+
+def pack(frames, page_size):
+    """
+    Shelf-pack frames into square pages, tallest first
+
+    :param frames: Dict of key -> surface
+    :param page_size: Page width and height in pixels
+    :return: (pages, entries) where entries maps key -> (page, x, y, width, height)
+    """
+    pages = []
+    entries = {}
+    x = y = shelf_height = 0
+
+    ordered = sorted(frames.items(), key=lambda item: (-item[1].get_height(), -item[1].get_width()))
+    for key, image in ordered:
+        width, height = image.get_size()
+        if width > page_size or height > page_size:
+            raise ValueError(f"{key} ({width}x{height}) does not fit a {page_size}px page")
+
+        if x + width > page_size:
+            x = 0
+            y += shelf_height + PADDING
+            shelf_height = 0
+
+        if not pages or y + height > page_size:
+            pages.append(pygame.Surface((page_size, page_size), pygame.SRCALPHA))
+            x = y = shelf_height = 0
+
+        pages[-1].blit(image, (x, y))
+        entries[key] = (len(pages) - 1, x, y, width, height)
+
+        x += width + PADDING
+        shelf_height = max(shelf_height, height)
+
+    return pages, entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake runtime frames into a texture atlas")
+    parser.add_argument('--output', default='assets/atlas', help="Directory for pages and index")
+    parser.add_argument('--page-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    frames = collect_frames()
+    pages, entries = pack(frames, args.page_size)
+
+    os.makedirs(args.output, exist_ok=True)
+    page_names = []
+    for i, page in enumerate(pages):
+        name = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(args.output, name))
+        page_names.append(name)
+
+    with open(os.path.join(args.output, 'atlas.json'), 'w') as file:
+        json.dump({'pages': page_names, 'entries': entries}, file, separators=(',', ':'))
+
+    print(f"Packed {len(entries)} frames into {len(pages)} page(s) in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
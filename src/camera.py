@@ -1,5 +1,7 @@
 import pygame
 
+from timestep import lerp_position
+
 class Camera:
     def __init__(self, width, height, target=None, smoothing=0.1):
         """
@@ -11,6 +13,7 @@ class Camera:
         :param smoothing: Camera movement smoothing factor (0-1, lower is smoother)
         """
         self.camera = pygame.math.Vector2(0, 0)
+        self.previous_camera = pygame.math.Vector2(0, 0)
         self.screen_width = width
         self.screen_height = height
         self.target = target
@@ -28,6 +31,8 @@ class Camera:
         """
         Update camera position smoothly following the target
         """
+        self.previous_camera.update(self.camera)
+
         if not self.target:
             return
 
@@ -39,20 +44,53 @@ class Camera:
         self.camera.x += (target_x - self.camera.x) * self.smoothing
         self.camera.y += (target_y - self.camera.y) * self.smoothing
 
-    def apply(self, entity):
+    def view_rect(self):
+        """
+        Get the area of the world currently on screen
+
+        :return: Rect in world coordinates
+        """
+        return pygame.Rect(int(self.camera.x), int(self.camera.y), self.screen_width, self.screen_height)
+
+    def offset(self, alpha=None):
+        """
+        Get the camera offset, optionally blended between the last two simulation steps
+
+        :param alpha: Interpolation factor (None uses the current position)
+        :return: Integer (x, y) offset
+        """
+        if alpha is None:
+            return int(self.camera.x), int(self.camera.y)
+
+        x, y = lerp_position(self.previous_camera, self.camera, alpha)
+        return int(x), int(y)
+
+    def apply(self, entity, alpha=None):
         """
         Apply camera offset to an entity's position
 
         :param entity: Sprite to adjust
+        :param alpha: Optional interpolation factor between the entity's previous
+                      and current simulation positions
         :return: Adjusted rect for drawing
         """
-        return entity.rect.move(-int(self.camera.x), -int(self.camera.y))
+        offset_x, offset_y = self.offset(alpha)
+        rect = entity.rect
+
+        previous = getattr(entity, 'previous_position', None)
+        if alpha is not None and previous is not None:
+            x, y = lerp_position(previous, rect.topleft, alpha)
+            return pygame.Rect(round(x) - offset_x, round(y) - offset_y, rect.width, rect.height)
+
+        return rect.move(-offset_x, -offset_y)
 
-    def apply_rect(self, rect):
+    def apply_rect(self, rect, alpha=None):
         """
         Apply camera offset to a rect
 
         :param rect: Pygame rect to adjust
+        :param alpha: Optional interpolation factor for the camera offset
         :return: Adjusted rect
         """
-        return rect.move(-int(self.camera.x), -int(self.camera.y))
\ No newline at end of file
+        offset_x, offset_y = self.offset(alpha)
+        return rect.move(-offset_x, -offset_y)
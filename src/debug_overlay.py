@@ -0,0 +1,58 @@
+import pygame
+
+from hud import TextCache
+
+
+class DebugOverlay:
+    def __init__(self, font=None, position=(10, 80), enabled=False):
+        """
+        Profiling overlay listing named stats, toggled in game with F3
+
+        Systems publish values with set() every frame; nothing is rendered
+        while the overlay is disabled.
+
+        :param font: Font used for the stat lines (defaults to a small system font)
+        :param position: Top-left screen position of the first line
+        :param enabled: Whether the overlay starts visible
+        """
+        self.font = font or pygame.font.Font(None, 22)
+        self.text = TextCache(self.font, (255, 255, 0))
+        self.position = position
+        self.enabled = enabled
+        self.stats = {}
+
+    def toggle(self):
+        """
+        Show or hide the overlay
+        """
+        self.enabled = not self.enabled
+
+    def set(self, name, value):
+        """
+        Publish a stat for the current frame
+
+        :param name: Label shown in the overlay
+        :param value: Anything with a readable str()
+        """
+        self.stats[name] = value
+
+    def lines(self):
+        """
+        Get the overlay text, one "name: value" line per stat
+        """
+        return [f"{name}: {value}" for name, value in self.stats.items()]
+
+    def draw(self, surface):
+        """
+        Draw the stat lines on the given surface
+
+        :param surface: Pygame surface to draw on
+        """
+        if not self.enabled:
+            return
+
+        x, y = self.position
+        for name, line in zip(self.stats, self.lines()):
+            text = self.text.get(name, line)
+            surface.blit(text, (x, y))
+            y += text.get_height() + 2
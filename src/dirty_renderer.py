@@ -0,0 +1,118 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen, background=(0, 0, 0), enabled=False, scroll_threshold=2,
+                 max_dirty_fraction=0.5, backdrop=None):
+        """
+        Frame presenter that can update only the screen regions that changed
+
+        Every draw goes through blit(), which records the rect it touched. In dirty
+        mode the previous frame's rects are cleared instead of the whole screen, and
+        only old + new rects are passed to pygame.display.update(). It falls back to a
+        full clear and flip when the camera scrolled further than scroll_threshold
+        (the background moves) or when the dirty area would cover most of the screen.
+        With a backdrop any camera movement counts as a scroll, since the ground moves.
+
+        :param screen: Display surface
+        :param background: Clear color
+        :param enabled: Start in dirty-rect mode (otherwise always full redraws)
+        :param scroll_threshold: Camera movement in pixels that forces a full redraw
+        :param max_dirty_fraction: Dirty area (fraction of the screen) above which a
+                                   full flip is used instead
+        :param backdrop: Optional object with draw(surface, camera_offset, clip=None)
+                         painted instead of the background color (e.g. World)
+        """
+        self.screen = screen
+        self.background = background
+        self.enabled = enabled
+        self.scroll_threshold = scroll_threshold
+        self.max_dirty_fraction = max_dirty_fraction
+        self.backdrop = backdrop
+
+        self.previous_rects = []
+        self.current_rects = []
+        self.last_offset = None
+        self.full_redraw = True
+
+        # Stats
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_update_area = 0
+
+    def toggle(self):
+        """
+        Switch between dirty-rect and full redraw mode
+        """
+        self.enabled = not self.enabled
+        self.last_offset = None
+
+    def begin_frame(self, camera_offset=(0, 0)):
+        """
+        Clear what needs clearing for a new frame
+
+        :param camera_offset: Camera offset used for this frame
+        """
+        threshold = 0 if self.backdrop else self.scroll_threshold
+        scrolled = (self.last_offset is None or
+                    abs(camera_offset[0] - self.last_offset[0]) > threshold or
+                    abs(camera_offset[1] - self.last_offset[1]) > threshold)
+        self.last_offset = camera_offset
+        self.full_redraw = not self.enabled or scrolled
+        self.current_rects = []
+
+        if self.full_redraw:
+            if self.backdrop:
+                self.backdrop.draw(self.screen, camera_offset)
+            else:
+                self.screen.fill(self.background)
+        else:
+            screen_rect = self.screen.get_rect()
+            for rect in self.previous_rects:
+                if self.backdrop:
+                    rect = rect.clip(screen_rect)
+                    if rect.width and rect.height:
+                        self.backdrop.draw(self.screen, camera_offset, rect)
+                else:
+                    self.screen.fill(self.background, rect)
+
+    def blit(self, source, dest, area=None):
+        """
+        Draw onto the screen and remember the touched region (Surface.blit signature)
+
+        :return: Rect that was drawn
+        """
+        rect = self.screen.blit(source, dest, area)
+        self.current_rects.append(rect)
+        return rect
+
+    def blits(self, sequence):
+        """
+        Draw many (surface, dest) pairs in one call, recording rects only in dirty mode
+
+        :param sequence: Iterable of (surface, dest) pairs
+        """
+        if self.enabled:
+            self.current_rects.extend(self.screen.blits(sequence))
+        else:
+            self.screen.blits(sequence, doreturn=False)
+
+    def end_frame(self):
+        """
+        Present the frame, updating only dirty regions when possible
+        """
+        screen_rect = self.screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in self.previous_rects + self.current_rects]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        area = sum(rect.width * rect.height for rect in dirty)
+
+        if self.full_redraw or area > screen_rect.width * screen_rect.height * self.max_dirty_fraction:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_update_area = screen_rect.width * screen_rect.height
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+            self.last_update_area = area
+
+        self.previous_rects = self.current_rects
@@ -1,6 +1,9 @@
 import pygame
 import random
 
+from animation import animation_clock
+from image_cache import images
+
 class Enemy(pygame.sprite.Sprite):
     DINOSAUR_TYPES = [
         "cole", "kira", "kuro", "loki",
@@ -13,25 +16,88 @@ class Enemy(pygame.sprite.Sprite):
         'move': 6
     }
 
-    def __init__(self, position, health=100):
+    ATTACK_RANGE = 30
+    ATTACK_DAMAGE = 10
+
+    # Animation frames per second, and how many phase offsets looping animations use
+    ANIMATION_FPS = 12
+    ANIMATION_PHASES = 4
+
+    # dino type -> mirrored animations, shared by every enemy of that type
+    _flipped_animations = {}
+
+    def __init__(self, position, health=100, dino_type=None):
         super().__init__()
-        self.dino_type = random.choice(self.DINOSAUR_TYPES)  # Randomize dinosaur type
+
+        # Set while the enemy is owned by an EnemyManager
+        self.manager = None
+        self.slot = None
+
+        self.dino_type = dino_type or random.choice(self.DINOSAUR_TYPES)  # Randomize dinosaur type
         self.animations = self.load_animations()  # Load animations based on type
+        self.flipped_animations = self.flipped(self.dino_type, self.animations)
 
-        self.image = self.animations['idle'][0]  # Start with idle animation
-        self.rect = self.image.get_rect(topleft=position)
+        self.rect = self.animations['idle'][0].get_rect(topleft=position)
         self.health = health
-        self.speed = 2
+        # Pixels per step; the game used to update every enemy twice a frame at speed 2
+        self.speed = 4
 
         self.attack_cooldown = 1000
         self.last_attack_time = 0
 
-        # Animation settings
+        # Animation state; the frame itself comes from the shared clock when drawn.
+        # Looping animations run in one of a few phases, so the horde doesn't move
+        # in lockstep but enemies in the same phase still share frame lookups
         self.current_animation = 'idle'
-        self.frame_index = 0
-        self.animation_speed = 0.2
+        self.animation_phase = random.randrange(self.ANIMATION_PHASES) * 1000 / self.ANIMATION_FPS
+        self.animation_start = -self.animation_phase
         self.player = None
 
+    @property
+    def health(self):
+        """
+        Current health, stored in the manager's arrays while the enemy is managed
+        """
+        if self.manager is not None:
+            return self.manager.health[self.slot]
+        return self._health
+
+    @health.setter
+    def health(self, value):
+        if self.manager is not None:
+            self.manager.health[self.slot] = value
+        else:
+            self._health = value
+
+    @classmethod
+    def sheet_path(cls, dino_type, action):
+        """
+        Path of the sprite sheet for one dinosaur action
+        """
+        return f"assets/sprites/dinosaurs/{dino_type}/base/{action}.png"
+
+    @classmethod
+    def preload(cls, dino_type):
+        """
+        Load every animation of a dinosaur type into the image cache, and mirror it
+        """
+        animations = {action: images.frames(cls.sheet_path(dino_type, action), frame_count, 2)
+                      for action, frame_count in cls.ACTION_FRAME_COUNTS.items()}
+        cls.flipped(dino_type, animations)
+
+    @classmethod
+    def flipped(cls, dino_type, animations):
+        """
+        Get a dinosaur type's mirrored animations, built once per type
+        """
+        flipped = cls._flipped_animations.get(dino_type)
+        if flipped is None:
+            flipped = cls._flipped_animations[dino_type] = {
+                action: [pygame.transform.flip(frame, True, False) for frame in frames]
+                for action, frames in animations.items()
+            }
+        return flipped
+
     def load_animations(self):
         """
         Load animation frames for the selected dinosaur type.
@@ -41,43 +107,34 @@ class Enemy(pygame.sprite.Sprite):
         scale_factor = 2
 
         for action, frame_count in self.ACTION_FRAME_COUNTS.items():
-            path = f"assets/sprites/dinosaurs/{self.dino_type}/base/{action}.png"
-            spritesheet = pygame.image.load(path).convert_alpha()
-
-            frame_width = spritesheet.get_width() // frame_count
-            frame_height = spritesheet.get_height()
-
-            frames = []
-            for i in range(frame_count):
-                frame = spritesheet.subsurface((i * frame_width, 0, frame_width, frame_height))
-
-                # Scale the frame
-                scaled_frame = pygame.transform.scale(
-                    frame,
-                    (frame_width * scale_factor, frame_height * scale_factor)
-                )
-                frames.append(scaled_frame)
-
-            animations[action] = frames
+            path = self.sheet_path(self.dino_type, action)
+            animations[action] = images.frames(path, frame_count, scale_factor)
         return animations
 
-    def animate(self):
+    @property
+    def image(self):
         """
-        Handle animation cycling.
+        Current frame, worked out from the animation clock only when something reads it
         """
-        frames = self.animations[self.current_animation]
-        self.frame_index += self.animation_speed
-
-        if self.frame_index >= len(frames):
-            self.frame_index = 0
+        facing_right = self.player is None or self.rect.x < self.player.rect.x
+        frames = (self.animations if facing_right else self.flipped_animations)[self.current_animation]
+        loop = self.current_animation != 'bite'
+        return frames[animation_clock.frame(self.animation_start, self.ANIMATION_FPS, len(frames), loop)]
 
-        self.image = frames[int(self.frame_index)]
+    def set_animation(self, name, restart=False):
+        """
+        Switch animation; looping animations keep the enemy's phase
 
-        # Flip the image if moving to the left (direction.x < 0)
-        if self.rect.x < self.player.rect.x:  # Player is to the right
-            self.image = pygame.transform.flip(frames[int(self.frame_index)], False, False)
-        else:  # Player is to the left
-            self.image = pygame.transform.flip(frames[int(self.frame_index)], True, False)
+        :param name: Animation name
+        :param restart: Start from the first frame now (e.g. each bite)
+        """
+        if restart:
+            self.animation_start = animation_clock.time
+        elif name == self.current_animation:
+            return
+        else:
+            self.animation_start = -self.animation_phase
+        self.current_animation = name
 
     def take_damage(self, amount):
         self.health -= amount
@@ -106,24 +163,20 @@ class Enemy(pygame.sprite.Sprite):
         # Set current animation to "move"
 
         if direction.x != 0 and direction.y != 0:
-            self.current_animation = 'move'
-
-        self.animate()
+            self.set_animation('move')
 
     def attack_player(self, player):
         """
         Deal damage to the player if within attack range and cooldown allows.
         """
         current_time = pygame.time.get_ticks()
-        attack_range = 30
-
+        attack_range = self.ATTACK_RANGE
 
         if self.rect.colliderect(player.rect.inflate(attack_range, attack_range)):
             if current_time - self.last_attack_time >= self.attack_cooldown:
-                player.take_damage(10)
+                player.take_damage(self.ATTACK_DAMAGE)
                 self.last_attack_time = current_time
 
                 # Set current animation to "bite" when attacking
-                self.current_animation = 'bite'
-                self.frame_index = 0  # Reset animation frame index
+                self.set_animation('bite', restart=True)
 
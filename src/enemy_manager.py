@@ -0,0 +1,253 @@
+import numpy as np
+import pygame
+
+from enemy import Enemy
+from spatial_grid import NeighbourGrid
+
+
+class EnemyManager(pygame.sprite.Group):
+    def __init__(self, *sprites, capacity=256, separation_radius=40, separation_strength=1.5,
+                 lod_near_margin=200, lod_far_interval=4, animation_margin=200):
+        """
+        Sprite group that keeps enemy simulation state in NumPy arrays
+
+        Positions, speeds, health and attack cooldowns live in flat arrays indexed
+        by a per-enemy slot, so chasing, movement, attack-range checks and cooldowns
+        for the whole horde run as one vectorized pass. Sprites only mirror their
+        slot's position into rect for rendering and collisions.
+
+        :param sprites: Initial enemies
+        :param capacity: Initial number of slots (grows on demand)
+        :param separation_radius: Enemies closer than this push each other apart
+        :param separation_strength: Maximum push per step in pixels (0 disables crowd separation)
+        :param lod_near_margin: Enemies within this many pixels of the camera view are
+                                simulated every step and animated
+        :param lod_far_interval: Far enemies move once every this many steps (with a
+                                 proportionally larger step) and are not animated
+        :param animation_margin: Near enemies also get animation state updates only
+                                 within this many pixels of the view (rendering only,
+                                 never changes movement)
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.slots = []  # slot index -> enemy sprite
+
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)  # rect topleft
+        self.sizes = np.zeros((capacity, 2), dtype=np.float64)
+        self.speeds = np.zeros(capacity, dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.float64)
+        self.attack_cooldowns = np.zeros(capacity, dtype=np.int64)
+        self.last_attack_times = np.zeros(capacity, dtype=np.int64)
+
+        # Crowd separation only looks at enemies in neighbouring grid cells
+        self.separation_radius = separation_radius
+        self.separation_strength = separation_strength
+        self.neighbour_grid = NeighbourGrid(cell_size=separation_radius)
+
+        # Distance-based level of detail
+        self.lod_near_margin = lod_near_margin
+        self.animation_margin = animation_margin
+        self.lod_far_interval = lod_far_interval
+        self.tier_counts = {'near': 0, 'far': 0}
+        self.step_count = 0
+
+        # Optional shared FlowField; enemies outside it chase the player directly
+        self.flow_field = None
+
+        super().__init__(*sprites)
+
+    def _grow(self):
+        """
+        Double the capacity of every state array
+        """
+        self.capacity *= 2
+        for name in ('positions', 'sizes', 'speeds', 'health',
+                     'attack_cooldowns', 'last_attack_times'):
+            array = getattr(self, name)
+            grown = np.zeros((self.capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Assign the enemy a slot and copy its state into the arrays
+        """
+        super().add_internal(sprite, layer)
+
+        if self.count == self.capacity:
+            self._grow()
+
+        slot = self.count
+        self.count += 1
+        self.slots.append(sprite)
+
+        self.positions[slot] = sprite.rect.topleft
+        self.sizes[slot] = sprite.rect.size
+        self.speeds[slot] = sprite.speed
+        self.health[slot] = sprite.health
+        self.attack_cooldowns[slot] = sprite.attack_cooldown
+        self.last_attack_times[slot] = sprite.last_attack_time
+
+        sprite.manager = self
+        sprite.slot = slot
+
+    def remove_internal(self, sprite):
+        """
+        Release the enemy's slot by moving the last enemy into it
+        """
+        super().remove_internal(sprite)
+
+        slot = sprite.slot
+        sprite.manager = None
+        sprite.slot = None
+        sprite.health = float(self.health[slot])
+        sprite.last_attack_time = int(self.last_attack_times[slot])
+
+        last = self.count - 1
+        if slot != last:
+            for array in (self.positions, self.sizes, self.speeds, self.health,
+                          self.attack_cooldowns, self.last_attack_times):
+                array[slot] = array[last]
+            moved = self.slots[last]
+            self.slots[slot] = moved
+            moved.slot = slot
+
+        self.slots.pop()
+        self.count = last
+
+    def nudge(self, enemy, dx, dy):
+        """
+        Move an enemy by an offset outside of the vectorized pass (e.g. collision push-back)
+
+        :param enemy: Enemy sprite owned by this manager
+        :param dx: Horizontal offset in pixels
+        :param dy: Vertical offset in pixels
+        """
+        self.positions[enemy.slot] += (dx, dy)
+        enemy.rect.topleft = self.positions[enemy.slot]
+
+    def lod_step_scale(self, centers, view):
+        """
+        Work out how far each enemy moves this step based on its LOD tier
+
+        :param centers: (N, 2) enemy centers
+        :param view: Camera view rect in world space (None treats every enemy as near)
+        :return: (near, step_scale) where step_scale is 1 for near enemies, the far
+                 interval for far enemies whose turn it is, and 0 otherwise
+        """
+        n = len(centers)
+        if view is None:
+            near = np.ones(n, dtype=bool)
+        else:
+            near_rect = view.inflate(self.lod_near_margin * 2, self.lod_near_margin * 2)
+            near = ((centers[:, 0] >= near_rect.left) & (centers[:, 0] < near_rect.right) &
+                    (centers[:, 1] >= near_rect.top) & (centers[:, 1] < near_rect.bottom))
+
+        # Stagger far updates across steps so they don't all land on the same frame
+        interval = self.lod_far_interval
+        far_turn = (np.arange(n) + self.step_count) % interval == 0
+        step_scale = np.where(near, 1.0, np.where(far_turn, float(interval), 0.0))
+
+        far = n - int(np.count_nonzero(near))
+        self.tier_counts['near'] = n - far
+        self.tier_counts['far'] = far
+        return near, step_scale
+
+    def update(self, player, current_time=None, view=None):
+        """
+        Chase, move, attack and animate every enemy in one pass
+
+        :param player: Player sprite to chase and attack
+        :param current_time: Game time in milliseconds (defaults to pygame ticks)
+        :param view: Camera view rect in world space, used for level of detail
+        :return: Number of attacks that landed this step
+        """
+        self.step_count += 1
+        n = self.count
+        if n == 0:
+            self.tier_counts['near'] = self.tier_counts['far'] = 0
+            return 0
+
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+
+        positions = self.positions[:n]
+        sizes = self.sizes[:n]
+
+        # Direction from each enemy's center to the player's center
+        delta = np.array(player.rect.center, dtype=np.float64) - (positions + sizes * 0.5)
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        safe_distance = np.where(distance > 0, distance, 1.0)
+        direction = delta / safe_distance[:, None]
+
+        # Steer along the shared flow field where it covers the enemy
+        if self.flow_field is not None:
+            field_direction, on_field = self.flow_field.sample(positions + sizes * 0.5)
+            direction[on_field] = field_direction[on_field]
+
+        centers = positions + sizes * 0.5
+        near, step_scale = self.lod_step_scale(centers, view)
+
+        # Animation state only needs to be current for enemies about to be drawn
+        animated = near
+        if view is not None and self.animation_margin < self.lod_near_margin:
+            animate_rect = view.inflate(self.animation_margin * 2, self.animation_margin * 2)
+            animated = near & ((centers[:, 0] >= animate_rect.left) & (centers[:, 0] < animate_rect.right) &
+                               (centers[:, 1] >= animate_rect.top) & (centers[:, 1] < animate_rect.bottom))
+
+        step = direction * (self.speeds[:n] * step_scale)[:, None]
+
+        # Spread the horde out so enemies don't stack on the same pixel
+        # (only among enemies that move this step, so idle far enemies cost nothing)
+        active = step_scale > 0
+        if self.separation_strength > 0 and np.count_nonzero(active) > 1:
+            push = self.neighbour_grid.separation(centers[active], self.separation_radius)
+            # Every overlapping neighbour adds to the push; cap its length at 1 so
+            # the push never exceeds separation_strength in a crowd
+            length = np.hypot(push[:, 0], push[:, 1])
+            push /= np.maximum(length, 1.0)[:, None]
+            length = np.minimum(length, 1.0)
+            # The chase is faster than the push, so drop the part of it heading back
+            # into the crowd, more the more crowded (all of it at full push) or it always wins
+            chase = step[active]
+            against = np.minimum(np.einsum('ij,ij->i', chase, push), 0.0) / np.maximum(length, 1e-9)
+            step[active] = chase - push * against[:, None] + push * self.separation_strength
+
+        # Float positions so slow diagonal movement accumulates instead of truncating
+        positions += step
+
+        # Straight horizontal or vertical chasing counts as moving too
+        moving = (direction[:, 0] != 0) | (direction[:, 1] != 0)
+
+        # Attack range: enemy rect overlaps the player's rect inflated by the range
+        attack_range = Enemy.ATTACK_RANGE
+        reach = player.rect.inflate(attack_range, attack_range)
+        left = np.floor(positions[:, 0])
+        top = np.floor(positions[:, 1])
+        in_range = ((left < reach.right) & (left + sizes[:, 0] > reach.left) &
+                    (top < reach.bottom) & (top + sizes[:, 1] > reach.top))
+
+        ready = current_time - self.last_attack_times[:n] >= self.attack_cooldowns[:n]
+        attacking = in_range & ready
+        self.last_attack_times[:n][attacking] = current_time
+
+        # Mirror positions into the sprites and set animation state for enemies near
+        # the view; frames are only looked up for enemies that get drawn
+        for enemy, topleft, is_animated, is_moving, is_attacking in zip(
+                self.slots, positions.tolist(), animated.tolist(), moving.tolist(), attacking.tolist()):
+            enemy.rect.topleft = topleft
+            enemy.player = player
+
+            if not is_animated:
+                continue
+
+            if is_moving:
+                enemy.set_animation('move')
+            if is_attacking:
+                enemy.set_animation('bite', restart=True)
+
+        attacks = int(np.count_nonzero(attacking))
+        for _ in range(attacks):
+            player.take_damage(Enemy.ATTACK_DAMAGE)
+        return attacks
+
@@ -0,0 +1,131 @@
+import math
+
+import numpy as np
+
+
+class FlowField:
+    # (dx, dy, step cost) for the eight neighbouring cells
+    NEIGHBOURS = [(dx, dy, math.hypot(dx, dy))
+                  for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+    def __init__(self, cols=48, rows=48, cell_size=32, is_blocked=None):
+        """
+        Shared navigation field that steers every enemy towards the nearest target
+
+        Each target gets an integration field (path cost to the target) over a
+        window of world cells centred on it, recomputed only when that target
+        moves to another cell, so targets any distance apart are all covered.
+        Where windows overlap, the cheaper path (the nearest target) wins. Each
+        cell stores the direction to its cheapest neighbour, so steering is a
+        lookup per enemy per window.
+
+        :param cols: Window width in cells
+        :param rows: Window height in cells
+        :param cell_size: Cell size in pixels
+        :param is_blocked: Optional callable (cell_x, cell_y) -> bool for world obstacles
+        """
+        self.cols = cols
+        self.rows = rows
+        self.cell_size = cell_size
+        self.is_blocked = is_blocked
+
+        self.target_cells = None
+        # target cell -> (origin, integration, directions); origin is the world
+        # cell of the window's top-left corner
+        self.windows = {}
+        self.recomputes = 0
+
+    def world_to_cell(self, position):
+        """
+        Convert a world pixel position to a world cell
+        """
+        return int(position[0] // self.cell_size), int(position[1] // self.cell_size)
+
+    def set_targets(self, positions):
+        """
+        Point the field at one or more targets, recomputing only targets that changed cell
+
+        :param positions: Iterable of world (x, y) target positions, e.g. player centers
+        :return: True if any window was recomputed
+        """
+        target_cells = tuple(sorted(set(self.world_to_cell(position) for position in positions)))
+        if not target_cells or target_cells == self.target_cells:
+            return False
+
+        self.target_cells = target_cells
+        self.windows = {cell: self.windows.get(cell) or self.compute_window(cell) for cell in target_cells}
+        return True
+
+    def compute_window(self, target_cell):
+        """
+        Build the integration field and direction lookup around one target
+
+        :param target_cell: World cell of the target
+        :return: (origin, integration, directions)
+        """
+        self.recomputes += 1
+
+        origin_x, origin_y = target_cell[0] - self.cols // 2, target_cell[1] - self.rows // 2
+
+        blocked = np.zeros((self.cols, self.rows), dtype=bool)
+        if self.is_blocked:
+            for x in range(self.cols):
+                for y in range(self.rows):
+                    blocked[x, y] = self.is_blocked(origin_x + x, origin_y + y)
+
+        cost = np.full((self.cols, self.rows), np.inf)
+        cost[self.cols // 2, self.rows // 2] = 0.0
+
+        # Wavefront relaxation until no cell gets cheaper
+        padded = np.full((self.cols + 2, self.rows + 2), np.inf)
+        while True:
+            padded[1:-1, 1:-1] = cost
+            relaxed = cost.copy()
+            for dx, dy, step in self.NEIGHBOURS:
+                neighbour = padded[1 + dx:self.cols + 1 + dx, 1 + dy:self.rows + 1 + dy]
+                np.minimum(relaxed, neighbour + step, out=relaxed)
+            relaxed[blocked] = np.inf
+            if np.array_equal(relaxed, cost):
+                break
+            cost = relaxed
+
+        # Each cell points at its cheapest neighbour
+        padded[1:-1, 1:-1] = cost
+        best = cost.copy()
+        directions = np.zeros((self.cols, self.rows, 2))
+        for dx, dy, step in self.NEIGHBOURS:
+            neighbour = padded[1 + dx:self.cols + 1 + dx, 1 + dy:self.rows + 1 + dy]
+            better = neighbour < best
+            best[better] = neighbour[better]
+            directions[better] = (dx / step, dy / step)
+
+        return (origin_x, origin_y), cost, directions
+
+    def sample(self, positions):
+        """
+        Look up steering directions for many world positions at once
+
+        :param positions: (N, 2) array of world positions
+        :return: (directions, valid) where valid is False for positions outside every
+                 window, in a target cell or unreachable (callers steer directly there)
+        """
+        world_cells = np.floor_divide(positions, self.cell_size).astype(np.int64)
+        directions = np.zeros((len(positions), 2))
+        best_cost = np.full(len(positions), np.inf)
+
+        for origin, integration, field in self.windows.values():
+            cells = world_cells - origin
+            inside = np.flatnonzero((cells[:, 0] >= 0) & (cells[:, 0] < self.cols) &
+                                    (cells[:, 1] >= 0) & (cells[:, 1] < self.rows))
+            x = cells[inside, 0]
+            y = cells[inside, 1]
+            cost = integration[x, y]
+
+            # Keep the nearest target's direction where windows overlap
+            closer = cost < best_cost[inside]
+            index = inside[closer]
+            best_cost[index] = cost[closer]
+            directions[index] = field[x[closer], y[closer]]
+
+        valid = np.isfinite(best_cost) & (best_cost > 0)
+        return directions, valid
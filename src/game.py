@@ -3,120 +3,260 @@ import random
 from sprite import AnimatedSprite
 from camera import Camera
 from enemy import Enemy
+from enemy_manager import EnemyManager
+from flow_field import FlowField
 from health_bar import HealthBar
+from hud import Hud
+from dirty_renderer import DirtyRectRenderer
+from render_queue import RenderQueue
+from world import World
+from wave_director import WaveDirector
+from input_state import InputState
+from animation import animation_clock
+from spike_watchdog import SpikeWatchdog
+from quality_governor import QualityGovernor
+from send_scheduler import SendScheduler
+from timestep import FixedTimestep
+from debug_overlay import DebugOverlay
+from atlas import TextureAtlas
+from image_cache import images
+from startup import AssetWarmup, StartupTimer
+from weapons.registry import default_registry
+from projectile_registry import ProjectileRegistry
 import asyncio
+import time
 
 
 class Game:
-    def __init__(self, width=800, height=600, network=None):
+    # Sprite sheet configuration
+    PLAYER_SPRITESHEET_CONFIG = {
+        'idle': {
+            'file': './assets/sprites/player_idle.png',
+            'frame_width': 16,
+            'frame_height': 16,
+            'frame_count': 2
+        },
+        'idle_left': {
+            'file': './assets/sprites/player_idle.png',  # Reuse idle animation
+            'frame_width': 16,
+            'frame_height': 16,
+            'frame_count': 2
+        },
+        'run_right': {
+            'file': './assets/sprites/player_run.png',
+            'frame_width': 16,
+            'frame_height': 16,
+            'frame_count': 6
+        },
+        'run_left': {
+            'file': './assets/sprites/player_run.png',
+            'frame_width': 16,
+            'frame_height': 16,
+            'frame_count': 6
+        },
+        'run_up': {
+            'file': './assets/sprites/player_run.png',
+            'frame_width': 16,
+            'frame_height': 16,
+            'frame_count': 6
+        },
+        'run_down': {
+            'file': './assets/sprites/player_run.png',
+            'frame_width': 16,
+            'frame_height': 16,
+            'frame_count': 6
+        }
+    }
+
+    def __init__(self, width=800, height=600, network=None, step_rate=60, max_fps=60, started_at=None,
+                 dirty_rects=False, seed=None, recorder=None, spike_budget_ms=None):
         """
         Initialize Pygame and game window
 
+        Only what the title screen needs is set up here. Assets warm up across
+        title-screen frames and the world is built once they are loaded.
+
         :param width: Window width
         :param height: Window height
+        :param network: Already connected Network (see connect() for connecting in the background)
+        :param step_rate: Fixed simulation steps per second
+        :param max_fps: Render frame rate cap
+        :param started_at: time.perf_counter() at process start, for startup timings
+        :param dirty_rects: Only redraw and present changed screen regions (toggle with F4)
+        :param seed: Seed for every gameplay random choice (random if not given)
+        :param recorder: Optional SessionRecorder that saves each frame's input,
+                         steps and snapshots for replay.py
+        :param spike_budget_ms: Save the stacks of any frame slower than this and
+                                profile the frames after it (see SpikeWatchdog); off when None
         """
+        self.startup = StartupTimer(started_at)
+
         pygame.init()
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("aaronpeli3")
+
+        # Serve frames from the baked atlas when one exists (see build_atlas.py)
+        if images.atlas is None:
+            images.atlas = TextureAtlas.load()
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep(step_rate)
+        self.sim_steps = 0
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.recorder = recorder
+        self.player_name = None  # Name lifetime stats are kept under on the server
+        self.watchdog = SpikeWatchdog(spike_budget_ms) if spike_budget_ms else None
+        self.max_fps = max_fps
         self.font = pygame.font.Font(None, 36)
+        self.renderer = DirtyRectRenderer(self.screen, enabled=dirty_rects)
+        self.render_queue = RenderQueue()
 
-        # Sprite sheet configuration
-        spritesheet_config = {
-            'idle': {
-                'file': './assets/sprites/player_idle.png',
-                'frame_width': 16,
-                'frame_height': 16,
-                'frame_count': 2
-            },
-            'idle_left': {
-                'file': './assets/sprites/player_idle.png',  # Reuse idle animation
-                'frame_width': 16,
-                'frame_height': 16,
-                'frame_count': 2
-            },
-            'run_right': {
-                'file': './assets/sprites/player_run.png',
-                'frame_width': 16,
-                'frame_height': 16,
-                'frame_count': 6
-            },
-            'run_left': {
-                'file': './assets/sprites/player_run.png',
-                'frame_width': 16,
-                'frame_height': 16,
-                'frame_count': 6
-            },
-            'run_up': {
-                'file': './assets/sprites/player_run.png',
-                'frame_width': 16,
-                'frame_height': 16,
-                'frame_count': 6
-            },
-            'run_down': {
-                'file': './assets/sprites/player_run.png',
-                'frame_width': 16,
-                'frame_height': 16,
-                'frame_count': 6
-            }
-        }
+        # Chunked ground under everything; the first chunks build during warm-up
+        self.world = World()
+        self.renderer.backdrop = self.world
 
         self.network = network
+        self.network_connect = None  # Pending background connect, see connect()
         self.other_players = {}
+        self.remote_sprites = {}  # {player id: AnimatedSprite}, reused across snapshots
+        # Sends state on change at an adaptive rate instead of every frame
+        self.send_scheduler = SendScheduler()
+
+        # Profiling stats, toggled with F3
+        self.debug_overlay = DebugOverlay()
+
+        self.play_button = pygame.Rect(350, 400, 100, 50)  # Simple button rect
+        self.title_screen = True  # Flag to show title screen
+        self.title_image = None
+        self.play_text = self.font.render("Play", True, (0, 0, 0))
+        self.hud = Hud(self.font)
+
+        # Waves of enemies under a live-entity budget that follows frame time
+        self.director = WaveDirector(Enemy.DINOSAUR_TYPES, frame_budget_ms=1000 / max_fps,
+                                     prewarm=Enemy.preload, seed=self.seed)
+        # Rendering detail steps down on slow frames and back up with headroom
+        self.quality = QualityGovernor(frame_budget_ms=1000 / max_fps)
+        self.particle_thinning = 1  # Draw 1 in this many particles (see apply_quality)
+        self.particles_hidden = 0
+
+        # Player, weapons and the first wave's dinos load incrementally on the title screen
+        self.warmup = AssetWarmup(self.warmup_tasks())
+        self.player = None
+
+    def warmup_tasks(self):
+        """
+        Asset loading tasks run across title-screen frames, one per asset group
+        """
+        tasks = []
+
+        def load_player():
+            for config in self.PLAYER_SPRITESHEET_CONFIG.values():
+                images.frames(config['file'], config['frame_count'], 2,
+                              (config['frame_width'], config['frame_height']))
+        tasks.append(("player", load_player))
+
+        registry = default_registry()
+        for name in registry.names:
+            tasks.append((f"weapon {name}", lambda name=name: registry.create(name, None)))
+
+        # Only the first wave's dinos; later waves are prewarmed by the director
+        for dino_type in self.director.pending_prewarm:
+            tasks.append((f"dino {dino_type}", lambda dino_type=dino_type: Enemy.preload(dino_type)))
+
+        # Ground under the starting view
+        tasks.append(("world", lambda: self.world.prebuild(self.screen.get_rect())))
+
+        return tasks
+
+    def setup_world(self):
+        """
+        Create the player, enemies and camera once assets are warm
+        """
+        spritesheet_config = self.PLAYER_SPRITESHEET_CONFIG
+
+        # Spreads and other global random draws replay identically from the seed
+        random.seed(self.seed)
 
         # Create player
         self.player = AnimatedSprite((400, 300), spritesheet_config)
-        self.player.network_id = None
+        # Our own entry is dropped from server snapshots (see play_frame)
+        self.player.network_id = self.network.client_id if self.network else None
         self.player.spritesheet_config = spritesheet_config
 
         self.all_sprites = pygame.sprite.Group(self.player)
-        self.enemies = pygame.sprite.Group()
+        self.enemies = EnemyManager()
 
+        # One navigation field shared by every enemy, aimed at all players
+        self.flow_field = FlowField()
+        self.enemies.flow_field = self.flow_field
 
-        for enemy in self.enemies:
-            enemy.health_bar = HealthBar(enemy, max_width=50, height=5, offset_y=-10)
         self.player.health_bar = HealthBar(self.player, max_width=70, height=7, offset_y=-15)
 
-        # Add projectiles group for all game projectiles
-        self.projectiles = pygame.sprite.Group()
-
-        # Set up the enemy spawn timer (e.g., every 5 seconds)
-        self.SPAWN_ENEMY_EVENT = pygame.USEREVENT + 1
-        pygame.time.set_timer(self.SPAWN_ENEMY_EVENT, 5000)  # 5000 ms = 5 seconds
+        # Owns spawn, update, expiry and collision for every projectile
+        self.projectiles = ProjectileRegistry()
 
         self.camera = Camera(self.screen.get_width(), self.screen.get_height(),
             target=self.player, smoothing=0.1)
 
+    def finish_warmup(self):
+        """
+        Load all remaining assets now and build the world (headless runs, tests)
+        """
+        self.warmup.finish()
+        if self.player is None:
+            self.setup_world()
 
-        self.play_button = pygame.Rect(350, 400, 100, 50)  # Simple button rect
-        self.title_screen = True  # Flag to show title screen
-
-    def create_shoot_event(self):
-        """Create a shoot event data structure"""
-        if not self.player.current_weapon:
-            return None
+    def connect(self, network):
+        """
+        Connect to the server in the background; the game attaches the
+        network once the connection succeeds
 
-        return {
-            'weapon_type': self.player.current_weapon.__class__.__name__,
-            'position': self.player.rect.center,
-            'angle': self.player.current_weapon.angle if hasattr(self.player.current_weapon, 'angle') else 0,
-            'timestamp': pygame.time.get_ticks()
-        }
+        :param network: Network to connect
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            self.network_connect = (network, loop.run_in_executor(None, network.connect))
+        except RuntimeError:
+            # No worker threads (e.g. the WebAssembly build): connect inline
+            self.network_connect = None
+            self.attach_network(network, network.connect())
+
+    def attach_network(self, network, connected):
+        """
+        Finish a connection attempt
+        """
+        if connected:
+            self.network = network
+            if self.player is not None:
+                self.player.network_id = network.client_id
+        else:
+            print("Could not connect to server!")
+
+    def poll_network_connect(self):
+        """
+        Attach the network when a background connect has finished
+        """
+        if self.network_connect is None:
+            return
+        network, future = self.network_connect
+        if future.done():
+            self.network_connect = None
+            self.attach_network(network, future.result())
+
+    @property
+    def playable(self):
+        """
+        True once assets are loaded and no connection attempt is pending
+        """
+        return self.player is not None and self.network_connect is None
 
-    def create_enemy(self, position):
+    def create_enemy(self, position, dino_type=None):
         """Create a new enemy at the given position."""
-        enemy = Enemy(position)
+        enemy = Enemy(position, dino_type=dino_type)
         # Add health bar to the enemy immediately when created
         enemy.health_bar = HealthBar(enemy, max_width=50, height=5, offset_y=-10)
         self.all_sprites.add(enemy)
         self.enemies.add(enemy)
 
-    def spawn_random_enemy(self):
-        """Spawn an enemy at a random position."""
-        random_x = random.randint(0, self.screen.get_width())
-        random_y = random.randint(0, self.screen.get_height())
-        self.create_enemy((random_x, random_y))
-
     def handle_player_enemy_collision(self):
         """
         Handle collisions between the player and enemies.
@@ -139,27 +279,34 @@ class Game:
                 # Move sprites apart based on the smallest overlap
                 if abs(overlap_x) < abs(overlap_y):
                     self.player.rect.x -= overlap_x
-                    enemy.rect.x += overlap_x
+                    self.enemies.nudge(enemy, overlap_x, 0)
                 else:
                     self.player.rect.y -= overlap_y
-                    enemy.rect.y += overlap_y
+                    self.enemies.nudge(enemy, 0, overlap_y)
 
     def draw_title_screen(self):
         """
-        Draw the title screen with the play button and idle player sprite.
+        Draw the title screen with the play button and asset loading progress.
         """
         self.screen.fill((0, 0, 0))  # Black background
 
-        # Load the title image
-        title_image = pygame.image.load('./assets/img.png').convert_alpha()
-        title_rect = title_image.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_image, title_rect)
+        # Load the title image once
+        if self.title_image is None:
+            self.title_image = images.load('./assets/img.png')
+        title_rect = self.title_image.get_rect(center=(self.screen.get_width() // 2, 100))
+        self.screen.blit(self.title_image, title_rect)
 
         # Draw the play button
         pygame.draw.rect(self.screen, (255, 255, 255), self.play_button)
-        play_text = self.font.render("Play", True, (0, 0, 0))
-        self.screen.blit(play_text, (self.play_button.x + (self.play_button.width // 2) - (play_text.get_width() // 2),
-                                     self.play_button.y + (self.play_button.height // 2) - (play_text.get_height() // 2)))
+        self.screen.blit(self.play_text, (self.play_button.x + (self.play_button.width // 2) - (self.play_text.get_width() // 2),
+                                          self.play_button.y + (self.play_button.height // 2) - (self.play_text.get_height() // 2)))
+
+        # Loading progress bar under the button
+        if not self.warmup.done:
+            bar = pygame.Rect(self.play_button.x, self.play_button.bottom + 10, self.play_button.width, 6)
+            pygame.draw.rect(self.screen, (50, 50, 50), bar)
+            bar.width = int(bar.width * self.warmup.progress)
+            pygame.draw.rect(self.screen, (255, 255, 255), bar)
 
         pygame.display.flip()
 
@@ -172,136 +319,339 @@ class Game:
                 pygame.quit()
                 return False
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if self.play_button.collidepoint(event.pos):
+                if self.play_button.collidepoint(event.pos) and self.player is not None:
                     self.title_screen = False  # Start the game
         return True
 
-    async def run(self):
+    def store_previous_positions(self):
         """
-        Main game loop
+        Remember where every drawable was before this simulation step,
+        so rendering can interpolate between the last two states.
         """
-        running = True
-        while running:
-            if self.title_screen:
-                if not self.handle_title_screen_events():
-                    return
-                self.draw_title_screen()
-            else:
+        for sprite in self.all_sprites:
+            sprite.previous_position = sprite.rect.topleft
+
+        for projectile in self.projectiles:
+            projectile.previous_position = projectile.rect.topleft
+
+        if self.player.current_weapon:
+            self.player.current_weapon.previous_position = self.player.current_weapon.rect.topleft
+
+    def player_positions(self):
+        """
+        Centers of the local player and every remote player, used as enemy targets
+        """
+        half_width, half_height = self.player.rect.width // 2, self.player.rect.height // 2
+        positions = [self.player.rect.center]
+        for player_state in self.other_players.values():
+            x, y = player_state['position']
+            positions.append((x + half_width, y + half_height))
+        return positions
+
+    @property
+    def sim_time(self):
+        """
+        Simulated time in milliseconds, advanced only by update_simulation()
+        """
+        return self.sim_steps * self.timestep.dt * 1000
+
+    def update_simulation(self):
+        """
+        Advance the game state by exactly one fixed timestep
+        """
+        self.sim_steps += 1
+        self.player.sim_time = self.sim_time
+        self.store_previous_positions()
 
-                current_time = pygame.time.get_ticks()
+        # Update camera and game state
+        self.camera.update()
+        for sprite in self.all_sprites:
+            if not isinstance(sprite, Enemy):
+                sprite.update(self.camera)
 
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                    elif event.type == self.SPAWN_ENEMY_EVENT:
-                        self.spawn_random_enemy()
+        view = self.camera.view_rect()
+        for position, dino_type in self.director.update(self.sim_time, view, len(self.enemies)):
+            self.create_enemy(position, dino_type)
 
-                # Update camera and game state
-                self.camera.update()
-                for sprite in self.all_sprites:
-                    if isinstance(sprite, Enemy):
-                        sprite.update(self.player)
-                        sprite.attack_player(self.player)
-                    else:
-                        sprite.update(self.camera)
+        self.flow_field.set_targets(self.player_positions())
 
-                    if hasattr(sprite, 'health_bar'):
-                        sprite.health_bar.draw(self.screen, self.camera)
+        # Chase, movement, attacks and cooldowns for the whole horde in one pass
+        self.enemies.update(self.player, current_time=self.sim_time, view=view)
 
-                self.handle_player_enemy_collision()
+        self.handle_player_enemy_collision()
 
-                shoot_event = None
-                mouse_buttons = pygame.mouse.get_pressed()
-                if mouse_buttons[0] and self.player.current_weapon:
-                    shoot_event = self.create_shoot_event()
+        self.projectiles.spawn_from(self.player.spawn_requests)
+        self.projectiles.update()
+        self.projectiles.collide(self.enemies)
 
-                if self.player.current_weapon:
-                    self.projectiles.add(self.player.current_weapon.projectiles)
+    def update_debug_stats(self):
+        """
+        Publish this frame's profiling stats to the debug overlay
+        """
+        overlay = self.debug_overlay
+        overlay.set("FPS", f"{self.clock.get_fps():.0f}")
+        overlay.set("Enemies", len(self.enemies))
+        director = self.director
+        frame_ms = director.frame_ms or 0
+        overlay.set("Wave", f"{director.wave} ({director.spawned}/{director.wave_size} spawned), "
+                            f"cap {director.enemy_cap}/{director.max_enemies} at {frame_ms:.1f} ms/frame")
+        overlay.set("Projectiles", len(self.projectiles))
+        overlay.set(f"LOD near (<{self.enemies.lod_near_margin}px off view)",
+                    self.enemies.tier_counts['near'])
+        overlay.set(f"LOD far (every {self.enemies.lod_far_interval} steps)",
+                    self.enemies.tier_counts['far'])
+        renderer = self.renderer
+        overlay.set("Redraw", f"{'dirty rects' if renderer.enabled else 'full'} "
+                              f"({renderer.partial_frames} partial / {renderer.full_frames} full, "
+                              f"{renderer.last_update_area} px updated)")
+        world = self.world
+        overlay.set("World chunks", f"{world.last_visible} drawn, {len(world.chunks)}/{world.max_chunks} "
+                                    f"cached, {world.builds} built, {world.evictions} evicted")
+        overlay.set("Animation frames", f"{animation_clock.computed} computed, "
+                                        f"{animation_clock.shared} shared lookups")
+        quality = self.quality
+        overlay.set("Quality", f"{quality.tier['name']} ({quality.mean_ms:.1f} ms mean, "
+                               f"{self.particles_hidden} particles not drawn)")
+        scheduler = self.send_scheduler
+        overlay.set("Net sends", f"{scheduler.sent}/{scheduler.offered} frames at up to "
+                                 f"{scheduler.rate:.0f}/s, {scheduler.keepalives} keepalives, "
+                                 f"{self.player.confirmed_hits} hits confirmed by the server")
+        queue = self.render_queue
+        per_item = queue.flush_ms * 1000 / queue.items if queue.items else 0
+        overlay.set("Render queue", f"{queue.items} blits in {queue.batches} calls, "
+                                    f"{queue.flush_ms:.2f} ms ({per_item:.1f} us/blit)")
+        for milestone, elapsed in self.startup.milestones.items():
+            overlay.set(f"Startup {milestone}", f"{elapsed:.0f} ms")
+        for projectile_class, pool in self.projectiles.pools.items():
+            overlay.set(f"Pool {projectile_class.__name__}",
+                        f"{pool.allocations} allocs, {pool.hit_rate:.0%} reused, {len(pool.free)} free")
+
+    def render(self, alpha):
+        """
+        Draw the world, blending positions between the last two simulation steps
 
-                for projectile in self.projectiles:
-                    hit_enemies = pygame.sprite.spritecollide(projectile, self.enemies, False)
-                    for enemy in hit_enemies:
-                        enemy.take_damage(projectile.damage)
-                        projectile.kill()
+        World draws are queued and submitted in batched blits calls per layer.
 
-                for enemy in self.enemies:
-                    enemy.update(self.player)
-                    enemy.attack_player(self.player)
+        :param alpha: Interpolation factor from the fixed timestep accumulator
+        """
+        renderer = self.renderer
+        queue = self.render_queue
+        camera_offset = self.camera.offset(alpha)
+        self.world.stream(self.camera.view_rect())
+        renderer.begin_frame(camera_offset)
+
+        # Off-screen enemies never have a frame looked up or a health bar queued
+        margin = self.enemies.animation_margin
+        visible = self.camera.view_rect().inflate(margin * 2, margin * 2)
+        on_screen = [sprite for sprite in self.all_sprites if visible.colliderect(sprite.rect)]
+        for sprite in on_screen:
+            queue.add_sprite(sprite, queue.ENTITIES)
+
+        for sprite in self.remote_sprites.values():
+            if visible.colliderect(sprite.rect):
+                sprite.animate()
+                queue.add_sprite(sprite, queue.ENTITIES)
+
+        for sprite in on_screen:
+            if hasattr(sprite, 'health_bar'):
+                sprite.health_bar.queue(queue, queue.HEALTH_BARS)
+
+        # Draw weapon and projectiles
+        if self.player.current_weapon:
+            queue.add_sprite(self.player.current_weapon, queue.WEAPONS)
+
+        # Only drawing is thinned; every particle is still simulated and hits
+        thinning = self.particle_thinning
+        hidden = 0
+        for projectile in self.projectiles:
+            if thinning > 1 and projectile.PARTICLE and projectile.spawn_index % thinning:
+                hidden += 1
+                continue
+            queue.add_sprite(projectile, queue.PROJECTILES)
+        self.particles_hidden = hidden
+
+        queue.flush(renderer, camera_offset, alpha)
+
+        self.hud.draw(renderer, self.player, self.quality.tier['name'])
+
+        self.update_debug_stats()
+        self.debug_overlay.draw(renderer)
+
+        renderer.end_frame()
+
+    def spike_context(self, steps):
+        """
+        Game state saved alongside a frame-spike profile
+        """
+        return {
+            'simulation steps': steps,
+            'enemies': len(self.enemies),
+            'projectiles': len(self.projectiles),
+            'remote players': len(self.other_players),
+            'wave': self.director.wave,
+            'enemy cap': self.director.enemy_cap,
+            'quality': self.quality.tier['name'],
+            'image cache loads': images.loads,
+        }
 
-                if self.network:
-                    player_state = {
-                        'position': self.player.rect.topleft,
-                        'animation': self.player.current_animation
-                    }
-                    world_state = self.network.send(player_state)
+    def handle_game_events(self, events):
+        """
+        Handle window and debug-key events during play
 
-                    if world_state:
-                        self.update_other_players(world_state)
+        :return: False once the window was closed
+        """
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.debug_overlay.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                self.renderer.toggle()
+        return running
+
+    def play_frame(self, input_state, steps):
+        """
+        Run one frame of play: simulation steps, network exchange and render
 
-                self.screen.fill((0, 0, 0))
+        Everything that affects the simulation comes in through the arguments or
+        the network, so replay.py can drive the same frames from a recording.
 
-                for sprite in self.all_sprites:
-                    self.screen.blit(sprite.image, self.camera.apply(sprite))
+        :param input_state: InputState for this frame
+        :param steps: Fixed simulation steps to run
+        :return: World state received from the server, if any
+        """
+        self.player.input = input_state
+        for _ in range(steps):
+            self.update_simulation()
+
+        # Only shots the weapons fired during these steps, not every frame FIRE is held
+        shots, self.player.shots_fired = self.player.shots_fired, []
+
+        world_state = None
+        if self.network:
+            player_state = {
+                # Shot timestamps are on the same clock, so the server can tell their age
+                'time': self.sim_time,
+                'position': self.player.rect.topleft,
+                'animation': self.player.current_animation,
+                'rtt': getattr(self.network, 'rtt', 0),
+                'kills': self.player.kills,
+                'coins': self.player.coins
+            }
+            if self.player_name:
+                player_state['name'] = self.player_name
+            # Shots ride along with the next send; the server validates hits
+            # with lag compensation (see run_server.py)
+            scheduler = self.send_scheduler
+            scheduler.offer(player_state, shots)
+            scheduler.adapt(getattr(self.network, 'rtt', 0), getattr(self.network, 'backpressure', 0))
+            # Nothing due still reads what the server sent
+            world_state = self.network.send(scheduler.poll(time.perf_counter()))
+
+            if world_state is not None:
+                own_state = world_state.get(self.player.network_id)
+                if own_state:
+                    self.player.confirmed_hits = own_state.get('hits', 0)
+                # Drop our own entry here rather than when drawing, so recordings
+                # (which replay with no connection, see replay.py) see the same players
+                world_state = {player_id: state for player_id, state in world_state.items()
+                               if player_id != self.player.network_id}
+                self.update_other_players(world_state)
+
+        # Animations follow time, blended like positions for this frame
+        animation_clock.set(self.sim_time + self.timestep.alpha * self.timestep.dt * 1000)
+        self.render(self.timestep.alpha)
+        return world_state
 
-                for player_id, player_state in self.other_players.items():
-                    if player_id != self.player.network_id:
-                        pos = player_state['position']
-                        sprite = AnimatedSprite(pos, self.player.spritesheet_config)
-                        sprite.current_animation = player_state['animation']
-                        sprite.animate()
-                        self.screen.blit(sprite.image, self.camera.apply(sprite))
+    async def run(self):
+        """
+        Main game loop
 
-                if hasattr(self.player, 'health_bar'):
-                    self.player.health_bar.draw(self.screen, self.camera)
+        Simulation runs at a fixed rate from an accumulator, rendering runs as
+        fast as allowed and interpolates, so a slow frame never slows the game down.
+        """
+        running = True
+        while running:
+            self.poll_network_connect()
 
-                for enemy in self.enemies:
-                    if hasattr(enemy, 'health_bar'):
-                        enemy.health_bar.draw(self.screen, self.camera)
+            if self.title_screen:
+                if not self.handle_title_screen_events():
+                    return
+                self.draw_title_screen()
+                self.startup.mark("first frame")
 
-                # Draw weapon and projectiles
-                if self.player.current_weapon:
-                    weapon_rect = self.camera.apply_rect(self.player.current_weapon.rect)
-                    self.screen.blit(self.player.current_weapon.image, weapon_rect)
+                # Load a slice of assets per frame, keeping the title screen responsive
+                if not self.warmup.done and self.warmup.step():
+                    self.setup_world()
+                if self.playable:
+                    self.startup.mark("playable")
 
-                for projectile in self.projectiles:
-                    projectile_rect = self.camera.apply_rect(projectile.rect)
-                    self.screen.blit(projectile.image, projectile_rect)
+                self.clock.tick(self.max_fps)
+                self.timestep.reset()
+            else:
+                if self.watchdog:
+                    self.watchdog.begin_frame()
 
-                kills_text = self.font.render(f"Kills: {self.player.kills}", True, (255, 255, 255))
-                coins_text = self.font.render(f"Coins: {self.player.coins}", True, (255, 255, 255))
+                running = self.handle_game_events(pygame.event.get())
 
-                self.screen.blit(kills_text, (10, 10))
-                self.screen.blit(coins_text, (10, 40))
+                input_state = InputState.capture()
+                steps = self.timestep.advance()
+                world_state = self.play_frame(input_state, steps)
 
-                pygame.display.flip()
+                if self.watchdog:
+                    self.watchdog.end_frame(lambda: self.spike_context(steps))
 
-                self.clock.tick(60)
+                self.clock.tick(self.max_fps)
+                # Work time of the frame, without the frame-cap sleep
+                frame_ms = self.clock.get_rawtime()
+                self.record_frame_time(frame_ms)
+                if self.recorder:
+                    self.recorder.record_frame(steps, input_state, world_state, frame_ms)
 
             await asyncio.sleep(0)
 
+        if self.recorder:
+            self.recorder.close()
+        if self.watchdog:
+            self.watchdog.close()
         pygame.quit()
 
+    def record_frame_time(self, frame_ms):
+        """
+        Feed a frame's work time to the wave director and the quality governor
+
+        :param frame_ms: Frame time in milliseconds, without the frame-cap sleep
+        """
+        self.director.record_frame(frame_ms)
+        tier = self.quality.record_frame(frame_ms)
+        if tier:
+            self.apply_quality(tier)
+
+    def apply_quality(self, tier):
+        """
+        Apply a QualityGovernor tier; only what gets drawn changes, never the damage dealt
+        """
+        HealthBar.set_detail(tier['health_bar_detail'])
+        self.particle_thinning = tier['particle_thinning']
+        self.enemies.animation_margin = tier['animation_margin']
+
     def update_other_players(self, world_state):
-        """Update the states of other players"""
-        self.other_players = world_state
+        """
+        Move each remote player's sprite to its snapshot position
 
-class Character:
-    def __init__(self, x, y, image_files):
-        self.x = x
-        self.y = y
-        self.image_files = image_files  # List of images for the idle animation
-        self.frames = [pygame.image.load(img).convert_alpha() for img in image_files]
-        self.current_frame = 0
-        self.frame_rate = 0.2  # Delay between frames (adjust this value for speed)
-        self.time_since_last_frame = 0  # Time accumulator for frame updates
-
-    def update(self, delta_time):
-        """Update the current frame for animation based on time."""
-        self.time_since_last_frame += delta_time
-        if self.time_since_last_frame >= self.frame_rate:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.time_since_last_frame = 0  # Reset the frame update timer
-
-    def draw(self, screen):
-        """Draw the current frame on the screen at its position."""
-        screen.blit(self.frames[self.current_frame], (self.x, self.y))
+        Sprites are kept per player id, so their animations run on instead of
+        restarting every snapshot.
+        """
+        self.other_players = world_state
+        for player_id in [player_id for player_id in self.remote_sprites if player_id not in world_state]:
+            del self.remote_sprites[player_id]
+
+        for player_id, player_state in world_state.items():
+            sprite = self.remote_sprites.get(player_id)
+            if sprite is None:
+                sprite = AnimatedSprite(player_state['position'], self.PLAYER_SPRITESHEET_CONFIG)
+                sprite.network_id = player_id
+                self.remote_sprites[player_id] = sprite
+            sprite.rect.topleft = player_state['position']
+            sprite.current_animation = player_state['animation']
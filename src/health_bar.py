@@ -1,7 +1,21 @@
+import math
+
 import pygame
 
 
 class HealthBar:
+    # (max_width, height, filled width) -> pre-rendered bar, shared by every health bar
+    _surfaces = {}
+
+    # Detail levels (see set_detail): fill steps (None for every pixel), hide full bars
+    DETAIL_LEVELS = {
+        2: (None, False),
+        1: (10, True),
+        0: (4, True),
+    }
+    fill_steps = None
+    hide_full = False
+
     def __init__(self, entity, max_width=50, height=5, offset_y=-10):
         """
         Initialize a health bar for an entity
@@ -19,25 +33,97 @@ class HealthBar:
         # Store the initial max health
         self.max_health = entity.health if hasattr(entity, 'health') else 100
 
-    def draw(self, surface, camera=None):
+    @classmethod
+    def set_detail(cls, level):
+        """
+        Set the detail of every health bar
+
+        :param level: 2 draws every bar to the pixel; 1 hides bars at full health
+                      and fills in tenths; 0 also fills in quarters
+        """
+        cls.fill_steps, cls.hide_full = cls.DETAIL_LEVELS[level]
+
+    @classmethod
+    def bar_surface(cls, max_width, height, current_width):
+        """
+        Get the rendered bar for a filled width, drawing it on first use
+
+        Health is quantized to whole pixels of bar width, so each bar size has
+        at most max_width + 1 cached surfaces.
+        """
+        key = (max_width, height, current_width)
+        bar = cls._surfaces.get(key)
+        if bar is not None:
+            return bar
+
+        health_percentage = current_width / max_width
+
+        # Color gradient from red to green based on health
+        if health_percentage > 0.5:
+            # Green to yellow (fading green)
+            red = int(255 * (1 - (health_percentage - 0.5) * 2))
+            color = (red, 255, 0)
+        else:
+            # Yellow to red (increasing red)
+            green = int(255 * health_percentage * 2)
+            color = (255, green, 0)
+
+        bar = pygame.Surface((max_width, height))
+
+        # Draw background (dark gray)
+        bar.fill((50, 50, 50))
+
+        # Draw health bar
+        bar.fill(color, pygame.Rect(0, 0, current_width, height))
+
+        cls._surfaces[key] = bar
+        return bar
+
+    def current_surface(self):
+        """
+        Get the pre-rendered bar matching the entity's current health
+        """
+        health_percentage = min(1, max(0, self.entity.health / self.max_health))
+        if self.fill_steps:
+            # Round up so a live entity never shows an empty bar
+            current_width = self.max_width * math.ceil(health_percentage * self.fill_steps) // self.fill_steps
+        else:
+            current_width = int(self.max_width * health_percentage)
+        return self.bar_surface(self.max_width, self.height, current_width)
+
+    def queue(self, render_queue, layer):
+        """
+        Queue the bar above the entity in a RenderQueue
+
+        :param render_queue: RenderQueue for this frame
+        :param layer: Draw layer
+        """
+        if not hasattr(self.entity, 'health'):
+            return
+        if self.hide_full and self.entity.health >= self.max_health:
+            return
+
+        offset = (self.entity.rect.width // 2 - self.max_width // 2, self.offset_y)
+        render_queue.add_sprite(self.entity, layer, self.current_surface(), offset)
+
+    def draw(self, surface, camera=None, alpha=None):
         """
         Draw the health bar on the given surface
 
         :param surface: Pygame surface to draw on
         :param camera: Optional camera for offset calculation
+        :param alpha: Optional render interpolation factor passed to the camera
         """
         # Ensure the entity has a health attribute
         if not hasattr(self.entity, 'health'):
             return
-
-        # Calculate current health percentage
-        health_percentage = max(0, self.entity.health / self.max_health)
-        current_width = int(self.max_width * health_percentage)
+        if self.hide_full and self.entity.health >= self.max_health:
+            return
 
         # Determine position
         if camera:
             # Use camera's apply method to get the correct screen position
-            entity_rect = camera.apply(self.entity)
+            entity_rect = camera.apply(self.entity, alpha)
             x = entity_rect.centerx - self.max_width // 2
             y = entity_rect.top + self.offset_y
         else:
@@ -45,20 +131,4 @@ class HealthBar:
             x = self.entity.rect.centerx - self.max_width // 2
             y = self.entity.rect.top + self.offset_y
 
-        # Color gradient from red to green based on health
-        if health_percentage > 0.5:
-            # Green to yellow (fading green)
-            red = int(255 * (1 - (health_percentage - 0.5) * 2))
-            color = (red, 255, 0)
-        else:
-            # Yellow to red (increasing red)
-            green = int(255 * health_percentage * 2)
-            color = (255, green, 0)
-
-        # Draw background (dark gray)
-        bg_rect = pygame.Rect(x, y, self.max_width, self.height)
-        pygame.draw.rect(surface, (50, 50, 50), bg_rect)
-
-        # Draw health bar
-        health_rect = pygame.Rect(x, y, current_width, self.height)
-        pygame.draw.rect(surface, color, health_rect)
\ No newline at end of file
+        surface.blit(self.current_surface(), (x, y))
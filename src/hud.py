@@ -0,0 +1,54 @@
+class TextCache:
+    def __init__(self, font, color=(255, 255, 255)):
+        """
+        Keeps rendered text surfaces and only re-renders text that changed
+
+        :param font: Font used for rendering
+        :param color: Text color
+        """
+        self.font = font
+        self.color = color
+        self.entries = {}  # slot -> (text, surface)
+
+        # Stats
+        self.renders = 0
+
+    def get(self, slot, text):
+        """
+        Get the surface for a text slot, rendering only if its text changed
+
+        :param slot: Stable name of the text element, e.g. 'kills'
+        :param text: Current text
+        :return: Rendered surface
+        """
+        entry = self.entries.get(slot)
+        if entry is not None and entry[0] == text:
+            return entry[1]
+
+        surface = self.font.render(text, True, self.color)
+        self.entries[slot] = (text, surface)
+        self.renders += 1
+        return surface
+
+
+class Hud:
+    def __init__(self, font):
+        """
+        Heads-up display for the local player's stats
+
+        :param font: Font used for the HUD text
+        """
+        self.text = TextCache(font)
+
+    def draw(self, surface, player, quality=None):
+        """
+        Draw kills and coins, re-rendering text only when the numbers change
+
+        :param surface: Pygame surface to draw on
+        :param player: Local player sprite
+        :param quality: Name of the current quality tier, shown below the stats
+        """
+        surface.blit(self.text.get('kills', f"Kills: {player.kills}"), (10, 10))
+        surface.blit(self.text.get('coins', f"Coins: {player.coins}"), (10, 40))
+        if quality:
+            surface.blit(self.text.get('quality', f"Quality: {quality}"), (10, 70))
@@ -0,0 +1,124 @@
+import pygame
+
+
+def normalize_path(path):
+    """
+    Strip a leading './' so the same file always maps to the same cache/atlas key
+    """
+    return path[2:] if path.startswith('./') else path
+
+
+def image_key(path, size=None):
+    """
+    Atlas key of a (optionally scaled) single image
+    """
+    path = normalize_path(path)
+    return f"{path}@{size[0]}x{size[1]}" if size else path
+
+
+def frame_key(path, frame_count, scale, index):
+    """
+    Atlas key of one scaled frame from a horizontal sprite sheet
+    """
+    return f"{normalize_path(path)}#{frame_count}x{scale}:{index}"
+
+
+class ImageCache:
+    def __init__(self, atlas=None):
+        """
+        Loads each image from disk once and shares the surface between sprites
+
+        When a TextureAtlas is attached, images and frames baked into it are
+        served from the atlas pages instead of opening the individual files.
+
+        :param atlas: Optional TextureAtlas
+        """
+        self.atlas = atlas
+        self.images = {}  # atlas key -> Surface
+        self.sheet_keys = set()  # Sprite sheets only loaded to be sliced into frames
+
+        # Stats
+        self.loads = 0
+        self.hits = 0
+        self.atlas_hits = 0
+
+    def _lookup(self, key):
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        if self.atlas is not None and key in self.atlas:
+            self.atlas_hits += 1
+            image = self.images[key] = self.atlas.get(key)
+            return image
+        return None
+
+    def load(self, path, size=None):
+        """
+        Get an image, loading (and optionally scaling) it on first use
+
+        The returned surface is shared, callers must treat it as read-only.
+
+        :param path: Image path
+        :param size: Optional (width, height) to scale to
+        :return: Converted (alpha) surface
+        """
+        key = image_key(path, size)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+
+        if size is None:
+            self.loads += 1
+            image = pygame.image.load(path).convert_alpha()
+        else:
+            image = pygame.transform.scale(self.load(path), size)
+
+        self.images[key] = image
+        return image
+
+    def frames(self, path, frame_count, scale=1, frame_size=None):
+        """
+        Get the scaled frames of a horizontal sprite sheet
+
+        :param path: Sprite sheet path
+        :param frame_count: Number of frames in the sheet
+        :param scale: Scaling factor for every frame
+        :param frame_size: Optional (width, height) of one frame; defaults to
+                           the sheet split evenly into frame_count columns
+        :return: List of shared frame surfaces
+        """
+        keys = [frame_key(path, frame_count, scale, i) for i in range(frame_count)]
+        frames = [self._lookup(key) for key in keys]
+        if all(frame is not None for frame in frames):
+            return frames
+
+        spritesheet = self.load(path)
+        self.sheet_keys.add(image_key(path))
+        if frame_size is None:
+            frame_size = (spritesheet.get_width() // frame_count, spritesheet.get_height())
+        frame_width, frame_height = frame_size
+
+        frames = []
+        for i, key in enumerate(keys):
+            frame = spritesheet.subsurface((i * frame_width, 0, frame_width, frame_height))
+
+            # Scale the frame
+            scaled_frame = pygame.transform.scale(
+                frame,
+                (frame_width * scale, frame_height * scale)
+            )
+            self.images[key] = scaled_frame
+            frames.append(scaled_frame)
+        return frames
+
+    def clear(self):
+        """
+        Drop every cached image
+        """
+        self.images.clear()
+
+
+# Shared by the whole game
+images = ImageCache()
@@ -0,0 +1,68 @@
+import struct
+
+import pygame
+
+
+class InputState:
+    # Button bits
+    LEFT = 1
+    RIGHT = 2
+    UP = 4
+    DOWN = 8
+    SWITCH_WEAPON = 16
+    FIRE = 32
+
+    KEY_BINDINGS = (
+        (pygame.K_a, LEFT),
+        (pygame.K_d, RIGHT),
+        (pygame.K_w, UP),
+        (pygame.K_s, DOWN),
+        (pygame.K_f, SWITCH_WEAPON),
+    )
+
+    # buttons, mouse x, mouse y
+    FORMAT = struct.Struct('<Bhh')
+
+    def __init__(self, buttons=0, mouse_pos=(0, 0)):
+        """
+        One frame of player input, sampled once and shared by the frame's simulation steps
+
+        The player and weapons read this instead of pygame.key and pygame.mouse, so a
+        recorded session can be fed back through the same code (see replay.py).
+
+        :param buttons: Bitmask of the button constants
+        :param mouse_pos: Mouse position in screen coordinates
+        """
+        self.buttons = buttons
+        self.mouse_pos = mouse_pos
+
+    @classmethod
+    def capture(cls):
+        """
+        Sample the keyboard and mouse
+        """
+        keys = pygame.key.get_pressed()
+        buttons = 0
+        for key, bit in cls.KEY_BINDINGS:
+            if keys[key]:
+                buttons |= bit
+        if pygame.mouse.get_pressed()[0]:
+            buttons |= cls.FIRE
+        return cls(buttons, pygame.mouse.get_pos())
+
+    def pressed(self, button):
+        """
+        Check whether a button bit is held
+        """
+        return bool(self.buttons & button)
+
+    def pack(self):
+        """
+        Encode as 5 bytes
+        """
+        return self.FORMAT.pack(self.buttons, *self.mouse_pos)
+
+    @classmethod
+    def unpack(cls, data):
+        buttons, mouse_x, mouse_y = cls.FORMAT.unpack(data)
+        return cls(buttons, (mouse_x, mouse_y))
@@ -0,0 +1,235 @@
+import json
+import math
+import os
+import time
+
+import numpy as np
+
+WEAPONS_PATH = os.path.join(os.path.dirname(__file__), 'weapons', 'weapons.json')
+
+
+class PositionHistory:
+    def __init__(self, max_entities=64, samples=64):
+        """
+        Recent positions of every tracked entity in fixed-size ring buffers
+
+        Each entity owns one row of preallocated (samples,) time and (samples, 2)
+        position arrays and overwrites its oldest sample, so recording is O(1).
+        At 60 updates a second, 64 samples hold about a second. Rows double when
+        more entities than max_entities are tracked.
+
+        :param max_entities: Entities tracked before the arrays grow
+        :param samples: Samples kept per entity
+        """
+        self.samples = samples
+        self.capacity = max_entities
+        self.times = np.full((max_entities, samples), -np.inf)
+        self.positions = np.zeros((max_entities, samples, 2))
+        self.heads = np.zeros(max_entities, dtype=np.int64)
+
+        self.rows = {}  # entity id -> row
+        self.free_rows = list(range(max_entities - 1, -1, -1))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def record(self, entity_id, timestamp, position):
+        """
+        Store an entity's position, starting to track it if needed
+
+        :param entity_id: Entity key (e.g. client id)
+        :param timestamp: Time of the sample in milliseconds
+        :param position: (x, y) position
+        """
+        row = self.rows.get(entity_id)
+        if row is None:
+            if not self.free_rows:
+                self._grow()
+            row = self.rows[entity_id] = self.free_rows.pop()
+
+        head = self.heads[row]
+        self.times[row, head] = timestamp
+        self.positions[row, head] = position
+        self.heads[row] = (head + 1) % self.samples
+
+    def _grow(self):
+        """
+        Double the number of rows
+        """
+        old = self.capacity
+        self.capacity *= 2
+        times = np.full((self.capacity, self.samples), -np.inf)
+        times[:old] = self.times
+        positions = np.zeros((self.capacity, self.samples, 2))
+        positions[:old] = self.positions
+        heads = np.zeros(self.capacity, dtype=np.int64)
+        heads[:old] = self.heads
+        self.times, self.positions, self.heads = times, positions, heads
+        self.free_rows.extend(range(self.capacity - 1, old - 1, -1))
+
+    def remove(self, entity_id):
+        """
+        Stop tracking an entity and free its row
+        """
+        row = self.rows.pop(entity_id, None)
+        if row is not None:
+            self.times[row] = -np.inf
+            self.heads[row] = 0
+            self.free_rows.append(row)
+
+    def rewind(self, timestamp):
+        """
+        Get every tracked entity's position at a past time
+
+        Positions are interpolated between the samples either side of the time.
+        Times newer than an entity's last sample use that sample, and times older
+        than its history use the oldest one.
+
+        :param timestamp: Time in milliseconds
+        :return: (entity ids, (n, 2) positions)
+        """
+        ids = list(self.rows)
+        rows = np.fromiter(self.rows.values(), dtype=np.int64, count=len(ids))
+        times = self.times[rows]
+        index = np.arange(len(rows))
+
+        before = np.where(times <= timestamp, times, -np.inf)
+        after = np.where(times > timestamp, times, np.inf)
+        i0 = before.argmax(axis=1)
+        i1 = after.argmin(axis=1)
+        t0 = before[index, i0]
+        t1 = after[index, i1]
+        p0 = self.positions[rows, i0]
+        p1 = self.positions[rows, i1]
+
+        has_before = np.isfinite(t0)
+        has_after = np.isfinite(t1)
+        both = has_before & has_after
+        fraction = np.zeros(len(rows))
+        fraction[both] = (timestamp - t0[both]) / (t1[both] - t0[both])
+        fraction[~has_before] = 1.0
+
+        return ids, p0 + (p1 - p0) * fraction[:, None]
+
+
+class LagCompensator:
+    def __init__(self, weapons=None, history=None, max_rewind=250, hit_radius=16, center_offset=(16, 16)):
+        """
+        Server-side hit validation against where entities were when the shooter fired
+
+        A client sees the world about one round trip late, so a shot is checked
+        against positions rewound to now - rtt (capped at max_rewind) instead of
+        the current ones. Each shot is a segment from its position along its angle,
+        as long as the weapon's range (speed * lifetime), and widens with the
+        weapon's spread. Shots sharing a view time share one rewind, so a burst of
+        flamethrower particles costs one rewind and one vectorized test.
+
+        :param weapons: Dict of weapon definitions (defaults to weapons.json)
+        :param history: PositionHistory to rewind (a new one by default)
+        :param max_rewind: Longest rewind in milliseconds, limits what high-latency
+                           clients can claim
+        :param hit_radius: Radius of an entity's hit circle
+        :param center_offset: Offset from a recorded position (top-left) to the entity centre
+        """
+        if weapons is None:
+            with open(WEAPONS_PATH) as file:
+                weapons = json.load(file)
+        self.weapons = weapons
+        self.history = history or PositionHistory()
+        self.max_rewind = max_rewind
+        self.hit_radius = hit_radius
+        self.center_offset = np.array(center_offset, dtype=np.float64)
+
+        # Stats
+        self.validated = 0
+        self.rejected = 0
+        self.rewinds = 0
+        self.last_ms = 0.0
+
+    def view_time(self, now, rtt):
+        """
+        Estimate when the world looked the way the shooter saw it
+
+        :param now: Server time in milliseconds
+        :param rtt: Shooter's round-trip time in milliseconds
+        """
+        return now - min(max(rtt, 0), self.max_rewind)
+
+    def weapon_for(self, shot):
+        """
+        Get the definition of a well-formed shot's weapon
+
+        :return: Weapon definition, or None when the shot can't be tested
+        """
+        if not isinstance(shot, dict):
+            return None
+        try:
+            x, y = shot['position']
+            float(x), float(y), float(shot['angle'])
+        except (KeyError, TypeError, ValueError):
+            return None
+        weapon_type = shot.get('weapon_type')
+        return self.weapons.get(weapon_type) if isinstance(weapon_type, str) else None
+
+    def validate(self, shots, view_times, shooter_ids):
+        """
+        Decide which shots hit, each against its own rewound world
+
+        :param shots: Shot events with weapon_type, position, angle and timestamp
+                      (see BaseWeapon.shoot)
+        :param view_times: Rewind time per shot in milliseconds (see view_time())
+        :param shooter_ids: Entity id of each shot's shooter, never hit by its own shot
+        :return: List of (shot index, hit entity id), the nearest entity along each shot;
+                 malformed shots and unknown weapons never hit
+        """
+        start = time.perf_counter()
+        hits = []
+
+        if shots and len(self.history):
+            groups = {}
+            for index, view_time in enumerate(view_times):
+                if self.weapon_for(shots[index]) is None:
+                    self.rejected += 1
+                    continue
+                groups.setdefault(round(view_time), []).append(index)
+
+            for view_time, indices in groups.items():
+                ids, positions = self.history.rewind(view_time)
+                self.rewinds += 1
+                hits.extend(self.test_shots([shots[i] for i in indices], indices, [shooter_ids[i] for i in indices],
+                                            ids, positions + self.center_offset))
+
+        self.validated += len(shots)
+        self.last_ms = (time.perf_counter() - start) * 1000
+        return hits
+
+    def test_shots(self, shots, indices, shooter_ids, ids, centers):
+        """
+        Segment-vs-circle test of many shots against one set of entity centres
+        """
+        origins = np.array([shot['position'] for shot in shots], dtype=np.float64)
+        angles = np.radians([shot['angle'] for shot in shots])
+        directions = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+
+        ranges = []
+        spreads = []
+        for shot in shots:
+            weapon = self.weapons[shot['weapon_type']]  # Checked by validate()
+            ranges.append(weapon.get('speed', 10) * weapon.get('lifetime', 60))
+            spreads.append(math.tan(math.radians(weapon.get('spread', 0))))
+        ranges = np.array(ranges)[:, None]
+        spreads = np.array(spreads)[:, None]
+
+        # (shots, entities) distance along and across each shot's line
+        offsets = centers[None, :, :] - origins[:, None, :]
+        along = (offsets * directions[:, None, :]).sum(axis=2)
+        across = np.abs(offsets[:, :, 0] * directions[:, None, 1] - offsets[:, :, 1] * directions[:, None, 0])
+
+        tolerance = self.hit_radius + np.clip(along, 0, None) * spreads
+        hit = (along >= -self.hit_radius) & (along <= ranges + self.hit_radius) & (across <= tolerance)
+        hit &= np.array(ids, dtype=object)[None, :] != np.array(shooter_ids, dtype=object)[:, None]
+
+        # Nearest hit along each shot
+        along = np.where(hit, along, np.inf)
+        nearest = along.argmin(axis=1)
+        return [(indices[i], ids[nearest[i]]) for i in np.flatnonzero(hit.any(axis=1))]
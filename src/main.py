@@ -1,17 +1,44 @@
+import time
+
+started_at = time.perf_counter()
+
 from game import Game
 from network import Network
+from relay import parse_address
+from replay import SessionRecorder
+from spectator import SpectatorGame
 import asyncio
+import sys
 
 
 async def main():
-    network = Network()
+    # Show the title screen right away; connect and warm up assets behind it
+    # The WebAssembly build renders in software, so only present changed regions there
+    # --spike-budget MS saves the stacks of frames slower than MS and profiles the next ones (rate limited)
+    spike_budget_ms = None
+    if '--spike-budget' in sys.argv:
+        spike_budget_ms = float(sys.argv[sys.argv.index('--spike-budget') + 1])
 
-    if not network.connect():
-        print("Could not connect to server!")
-        return
+    # --spectate watches the match read-only, e.g. through a relay (see relay.py)
+    game_class = SpectatorGame if '--spectate' in sys.argv else Game
+    game = game_class(started_at=started_at, dirty_rects=sys.platform == 'emscripten',
+                      spike_budget_ms=spike_budget_ms)
 
-    game = Game(network=network)
+    # --name NAME keeps lifetime stats under that name on the server (none are kept without one)
+    if '--name' in sys.argv:
+        game.player_name = sys.argv[sys.argv.index('--name') + 1]
+
+    # --record FILE saves the session for replay.py
+    if '--record' in sys.argv:
+        path = sys.argv[sys.argv.index('--record') + 1]
+        game.recorder = SessionRecorder(path, game.seed, game.timestep.step_rate)
+
+    # --server HOST:PORT connects to another server or relay
+    network = Network()
+    if '--server' in sys.argv:
+        network = Network(*parse_address(sys.argv[sys.argv.index('--server') + 1]))
+    game.connect(network)
     await game.run()
 
 
-asyncio.run(main())
\ No newline at end of file
+asyncio.run(main())
@@ -1,5 +1,8 @@
 import socket
 import pickle
+import time
+
+from protocol import FrameReader, FLAG_BACKPRESSURE, encode, parse_snapshot
 
 class Network:
     def __init__(self, host='aaronpeli3-production.up.railway.app', port=5000):
@@ -8,13 +11,30 @@ class Network:
         self.port = port
         self.addr = (host, port)
         self.client_id = None
+        self.rtt = 0.0  # Smoothed round-trip time in milliseconds
+
+        self.reader = FrameReader()
+        self.outgoing = b''  # Bytes the socket couldn't take yet
+        self.sequence = 0
+        self.sent_times = {}  # {sequence: perf_counter at send} awaiting an ack
+        self.last_tick = 0
+        self.backpressure = 0  # Snapshots the server had to drop for us
 
     def connect(self):
         try:
             self.client.connect(self.addr)
             # Receive initial data including client ID
-            initial_data = pickle.loads(self.client.recv(2048))
+            initial_data = None
+            while initial_data is None:
+                data = self.client.recv(4096)
+                if not data:
+                    raise ConnectionError("Server closed the connection")
+                frames = self.reader.feed(data)
+                if frames:
+                    initial_data = pickle.loads(frames[0])
             self.client_id = initial_data["client_id"]
+            self.client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.client.setblocking(False)
             print(f"Connected to server with ID: {self.client_id}")
             return True
         except Exception as e:
@@ -22,12 +42,70 @@ class Network:
             return False
 
     def send(self, data):
+        """
+        Send a state update without waiting for a reply
+
+        :param data: Player state dict, or None to only read what arrived
+        :return: The newest world state received since the last call, or None
+        """
         try:
-            self.client.send(pickle.dumps(data))
-            return pickle.loads(self.client.recv(2048))
+            if data is not None:
+                self.sequence += 1
+                self.sent_times[self.sequence] = time.perf_counter()
+                self.outgoing += encode(dict(data, seq=self.sequence))
+            self.flush()
+            return self.receive()
         except socket.error as e:
             print(f"Network error: {e}")
             return None
 
+    def flush(self):
+        """
+        Write as much of the outgoing buffer as the socket accepts
+        """
+        if self.outgoing:
+            try:
+                sent = self.client.send(self.outgoing)
+            except BlockingIOError:
+                return
+            self.outgoing = self.outgoing[sent:]
+
+    def receive(self):
+        """
+        Read every snapshot that has arrived, keeping only the newest
+
+        :return: World state, or None if nothing new arrived
+        """
+        latest = None
+        while True:
+            try:
+                data = self.client.recv(65536)
+            except BlockingIOError:
+                break
+            if not data:
+                raise ConnectionError("Server closed the connection")
+            for payload in self.reader.feed(data):
+                client_id, ack, tick, flags, snapshot = parse_snapshot(payload)
+                if tick > self.last_tick:
+                    self.last_tick = tick
+                    latest = snapshot
+                if flags & FLAG_BACKPRESSURE:
+                    self.backpressure += 1
+                self.acknowledge(ack)
+
+        return pickle.loads(latest) if latest is not None else None
+
+    def acknowledge(self, ack):
+        """
+        Measure round-trip time from the server echoing our latest sequence number
+        """
+        sent_at = self.sent_times.pop(ack, None)
+        if sent_at is None:
+            return
+        for sequence in [sequence for sequence in self.sent_times if sequence < ack]:
+            del self.sent_times[sequence]
+        rtt = (time.perf_counter() - sent_at) * 1000
+        self.rtt = rtt if not self.rtt else self.rtt + (rtt - self.rtt) * 0.1
+
     def close(self):
-        self.client.close()
\ No newline at end of file
+        self.client.close()
@@ -0,0 +1,115 @@
+import numpy as np
+import pygame
+
+from spatial_grid import SweepGrid
+from weapons.projectile import ProjectilePool
+
+
+class ProjectileRegistry:
+    def __init__(self, max_active=1500):
+        """
+        Single owner of every live projectile in the game
+
+        Weapons never hold projectiles; they append spawn requests to their
+        owner's spawn_requests list. The registry turns those into pooled
+        projectiles and handles update, expiry and collisions for all of them,
+        whichever weapon fired them, so switching weapons never strands bullets.
+
+        :param max_active: Hard cap on live projectiles; the oldest are expired
+                           first when it is exceeded
+        """
+        self.active = pygame.sprite.Group()
+        self.pools = {}  # projectile class -> ProjectilePool
+        self.max_active = max_active
+
+        # Hits are found along each projectile's path this step, not only where it ends
+        self.sweep_grid = SweepGrid()
+
+        # Stats
+        self.spawned = 0
+        self.capped = 0
+        self.hits = 0
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def pool_for(self, projectile_class):
+        """
+        Get (or create) the pool for a projectile type
+        """
+        pool = self.pools.get(projectile_class)
+        if pool is None:
+            pool = self.pools[projectile_class] = ProjectilePool(projectile_class)
+        return pool
+
+    def spawn_from(self, spawn_requests):
+        """
+        Create projectiles for queued spawn requests and clear the queue
+
+        :param spawn_requests: List of (projectile_class, x, y, angle, stats) tuples
+        """
+        for projectile_class, x, y, angle, stats in spawn_requests:
+            projectile = self.pool_for(projectile_class).acquire(x, y, angle, stats)
+            # Stable per projectile, so drawing can thin particles without flicker
+            projectile.spawn_index = self.spawned
+            self.active.add(projectile)
+            self.spawned += 1
+        spawn_requests.clear()
+
+        # Keep memory and collision cost bounded: drop the oldest first
+        excess = len(self.active) - self.max_active
+        if excess > 0:
+            self.capped += excess
+            for projectile in self.active.sprites()[:excess]:
+                projectile.expire()
+
+    def update(self):
+        """
+        Move every projectile and expire the ones past their lifetime
+        """
+        self.active.update()
+
+    def find_hits(self, enemies):
+        """
+        Sweep each projectile from its previous position to its current one
+
+        Fast or small projectiles can't tunnel through an enemy between steps:
+        every enemy along the path is considered and the first one reached wins.
+
+        :param enemies: EnemyManager holding the enemies' rects in arrays
+        :return: List of (projectile, enemy) pairs, at most one per projectile
+        """
+        count = enemies.count
+        projectiles = self.active.sprites()
+        if not count or not projectiles:
+            return []
+
+        # Box centres at the start and end of the step (spawned this step: from the muzzle)
+        ends = np.array([projectile.rect.center for projectile in projectiles], dtype=np.float64)
+        half_sizes = np.array([projectile.rect.size for projectile in projectiles], dtype=np.float64) * 0.5
+        starts = np.array([projectile.previous_position for projectile in projectiles],
+                          dtype=np.float64) + half_sizes
+        rects = np.column_stack((enemies.positions[:count], enemies.sizes[:count]))
+
+        hit_projectiles, hit_enemies, _ = self.sweep_grid.sweep(rects, starts, ends, half_sizes)
+        slots = enemies.slots
+        return [(projectiles[index], slots[slot])
+                for index, slot in zip(hit_projectiles.tolist(), hit_enemies.tolist())]
+
+    def collide(self, enemies):
+        """
+        Damage the first enemy each projectile reached this step and expire it
+
+        :param enemies: EnemyManager holding the enemies' rects in arrays
+        """
+        # Sprites are resolved before any damage: kills reshuffle the manager's slots
+        hits = self.find_hits(enemies)
+        for projectile, enemy in hits:
+            # Several projectiles can reach the same enemy in one step
+            if enemy.alive():
+                enemy.take_damage(projectile.damage)
+            projectile.expire()
+        self.hits += len(hits)
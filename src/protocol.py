@@ -0,0 +1,180 @@
+"""
+Wire format shared by the server, relays and clients
+
+Every message is a frame: a 4-byte big-endian length, then the payload.
+Client to server payloads are a pickled player state. Server to client frames
+carry a small per-client header followed by the tick's snapshot, which is the
+same pickled bytes for every receiver, so it is encoded once per tick.
+"""
+import pickle
+import struct
+
+LENGTH = struct.Struct('>I')
+# client id, last input sequence received from this client, tick, flags
+SNAPSHOT_HEADER = struct.Struct('>IIIB')
+
+# Snapshot header flags
+FLAG_BACKPRESSURE = 1  # Snapshots were dropped for this client since its last one
+
+
+def encode(message):
+    """
+    Pickle an object into one length-prefixed frame
+    """
+    payload = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    return LENGTH.pack(len(payload)) + payload
+
+
+def snapshot_header(snapshot_size, client_id, ack, tick, flags=0):
+    """
+    Length prefix and header that go in front of a shared snapshot
+
+    :param snapshot_size: Size of the encoded snapshot in bytes
+    """
+    return (LENGTH.pack(SNAPSHOT_HEADER.size + snapshot_size) +
+            SNAPSHOT_HEADER.pack(client_id or 0, ack, tick, flags))
+
+
+def parse_snapshot(payload):
+    """
+    Split a snapshot frame's payload
+
+    :return: (client_id, ack, tick, flags, snapshot bytes)
+    """
+    client_id, ack, tick, flags = SNAPSHOT_HEADER.unpack_from(payload)
+    return client_id, ack, tick, flags, payload[SNAPSHOT_HEADER.size:]
+
+
+def send_parts(conn, parts):
+    """
+    Write several buffers in one call without joining them (sendmsg where available)
+
+    :return: Bytes sent
+    """
+    if hasattr(conn, 'sendmsg'):
+        return conn.sendmsg(parts)
+    return conn.send(b''.join(parts))
+
+
+class FrameReader:
+    def __init__(self):
+        """
+        Reassembles length-prefixed frames from a byte stream
+        """
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """
+        Add received bytes
+
+        :return: List of complete frame payloads
+        """
+        self.buffer += data
+        frames = []
+        offset = 0
+        while len(self.buffer) - offset >= LENGTH.size:
+            length, = LENGTH.unpack_from(self.buffer, offset)
+            end = offset + LENGTH.size + length
+            if len(self.buffer) < end:
+                break
+            frames.append(bytes(self.buffer[offset + LENGTH.size:end]))
+            offset = end
+        del self.buffer[:offset]
+        return frames
+
+
+class Subscriber:
+    def __init__(self, conn, client_id):
+        """
+        Server-side end of one client connection (non-blocking socket)
+
+        :param conn: Connected socket
+        :param client_id: Id assigned to the client
+        """
+        self.conn = conn
+        self.client_id = client_id
+        self.reader = FrameReader()
+        self.ack = 0  # Last input sequence number received
+        self.pending = None  # Unsent tail of a partially written frame
+        self.dropped = 0  # Snapshots skipped because the client fell behind
+
+    def fileno(self):
+        return self.conn.fileno()
+
+    def flush_pending(self):
+        """
+        Try to finish a partially written frame
+
+        :return: True when nothing is left pending
+        """
+        if self.pending is not None:
+            try:
+                sent = self.conn.send(self.pending)
+            except BlockingIOError:
+                return False
+            self.pending = self.pending[sent:] if sent < len(self.pending) else None
+        return self.pending is None
+
+
+class Broadcaster:
+    def __init__(self):
+        """
+        Encodes each tick's snapshot once and fans it out to every subscriber
+
+        The snapshot bytes are shared: each subscriber gets its own few-byte
+        header and a memoryview of the same buffer in one sendmsg() call, so
+        nothing is re-pickled or copied per client. A subscriber that can't take
+        a whole frame keeps only the unsent tail; while that tail is pending it
+        skips snapshots (newer ones supersede them) and the next header it gets
+        carries FLAG_BACKPRESSURE.
+        """
+        self.tick = 0
+
+        # Stats for the last broadcast
+        self.last_size = 0
+        self.last_sent = 0
+        self.last_dropped = 0
+
+    def encode(self, snapshot):
+        """
+        Pickle a snapshot once for all subscribers
+        """
+        return pickle.dumps(snapshot, pickle.HIGHEST_PROTOCOL)
+
+    def broadcast(self, subscribers, snapshot):
+        """
+        Send one tick's snapshot to every subscriber
+
+        :param subscribers: Iterable of Subscriber
+        :param snapshot: Object to send (encoded once) or already encoded bytes
+        :return: List of subscribers whose connection failed
+        """
+        self.tick += 1
+        data = snapshot if isinstance(snapshot, (bytes, bytearray)) else self.encode(snapshot)
+        view = memoryview(data)
+        self.last_size = len(data)
+        self.last_sent = self.last_dropped = 0
+
+        failed = []
+        for subscriber in subscribers:
+            try:
+                if not subscriber.flush_pending():
+                    subscriber.dropped += 1
+                    self.last_dropped += 1
+                    continue
+
+                flags = FLAG_BACKPRESSURE if subscriber.dropped else 0
+                header = snapshot_header(len(data), subscriber.client_id, subscriber.ack, self.tick, flags)
+                total = len(header) + len(data)
+                try:
+                    sent = send_parts(subscriber.conn, [header, view])
+                except BlockingIOError:
+                    sent = 0
+                if sent < total:
+                    # Keep only the tail; the frame must be finished before the next one
+                    subscriber.pending = (header + data)[sent:]
+                subscriber.dropped = 0
+                self.last_sent += 1
+            except OSError:
+                failed.append(subscriber)
+        return failed
@@ -0,0 +1,90 @@
+from collections import deque
+
+
+class QualityGovernor:
+    # Rendering-only settings per tier, best first
+    #   particle_thinning: draw 1 in N visual particles (every one is still simulated)
+    #   health_bar_detail: see HealthBar.set_detail
+    #   animation_margin: pixels around the view in which enemies get animation updates
+    #                     (EnemyManager.animation_margin; movement LOD is left alone)
+    TIERS = (
+        {'name': 'high', 'particle_thinning': 1, 'health_bar_detail': 2, 'animation_margin': 200},
+        {'name': 'medium', 'particle_thinning': 2, 'health_bar_detail': 1, 'animation_margin': 100},
+        {'name': 'low', 'particle_thinning': 3, 'health_bar_detail': 1, 'animation_margin': 64},
+        {'name': 'minimal', 'particle_thinning': 5, 'health_bar_detail': 0, 'animation_margin': 32},
+    )
+
+    def __init__(self, frame_budget_ms=1000 / 60, window=30, headroom=0.7, downgrade_after=15,
+                 upgrade_after=180):
+        """
+        Steps rendering quality down when frames run over budget and back up with headroom
+
+        The rolling mean of the last `window` frame times is compared with the
+        budget. After downgrade_after frames over budget the governor drops one
+        tier; after upgrade_after frames under headroom * budget it climbs one.
+        Both counters restart on every change, so a tier gets time to take
+        effect before the next one. Counting frames rather than seconds keeps
+        replays of the same frame times on the same tiers.
+
+        :param frame_budget_ms: Target frame time (excluding the frame-cap sleep)
+        :param window: Frames in the rolling mean
+        :param headroom: Fraction of the budget the mean must stay under to upgrade
+        :param downgrade_after: Consecutive over-budget frames before dropping a tier
+        :param upgrade_after: Consecutive frames with headroom before raising a tier
+        """
+        self.frame_budget_ms = frame_budget_ms
+        self.headroom = headroom
+        self.downgrade_after = downgrade_after
+        self.upgrade_after = upgrade_after
+
+        self.frame_times = deque(maxlen=window)
+        self.total_ms = 0.0
+        self.level = 0
+        self.over = 0
+        self.under = 0
+
+        # Stats
+        self.changes = 0
+
+    @property
+    def tier(self):
+        return self.TIERS[self.level]
+
+    @property
+    def mean_ms(self):
+        return self.total_ms / len(self.frame_times) if self.frame_times else 0.0
+
+    def record_frame(self, frame_ms):
+        """
+        Feed the time spent on the last frame
+
+        :param frame_ms: Frame time in milliseconds
+        :return: The new tier when it changed, otherwise None
+        """
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self.total_ms -= self.frame_times[0]
+        self.frame_times.append(frame_ms)
+        self.total_ms += frame_ms
+
+        mean = self.mean_ms
+        if mean > self.frame_budget_ms:
+            self.over += 1
+            self.under = 0
+        elif mean < self.frame_budget_ms * self.headroom:
+            self.under += 1
+            self.over = 0
+        else:
+            self.over = self.under = 0
+
+        if self.over >= self.downgrade_after and self.level < len(self.TIERS) - 1:
+            return self.change(self.level + 1, mean)
+        if self.under >= self.upgrade_after and self.level > 0:
+            return self.change(self.level - 1, mean)
+        return None
+
+    def change(self, level, mean):
+        self.level = level
+        self.over = self.under = 0
+        self.changes += 1
+        print(f"Quality: {self.tier['name']} (frames {mean:.1f} ms, budget {self.frame_budget_ms:.1f} ms)")
+        return self.tier
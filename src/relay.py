@@ -0,0 +1,187 @@
+"""
+Read-only relay: fans a game server's snapshot stream out to spectators
+
+A relay connects to a game server (or to another relay) like any client,
+except it never sends a player state, so it never appears in the match. Each
+snapshot it receives is forwarded to its own spectators as the same bytes,
+without unpickling (see protocol.Broadcaster). Relays speak the server's
+protocol downstream too, so they chain:
+
+    python src/run_server.py                                   # PORT=5000
+    python src/relay.py --upstream 127.0.0.1:5000 --port 5001
+    python src/relay.py --upstream 127.0.0.1:5001 --port 5002
+    python src/main.py --spectate --server 127.0.0.1:5002
+"""
+import argparse
+import pickle
+import selectors
+import socket
+
+from protocol import Broadcaster, FrameReader, Subscriber, encode, parse_snapshot
+
+
+class Relay:
+    def __init__(self, upstream, host='0.0.0.0', port=0):
+        """
+        Listen for spectators and connect to the upstream server
+
+        :param upstream: (host, port) of the game server or relay to follow
+        :param host: Interface to listen on
+        :param port: Port to listen on (0 picks a free one, see self.port)
+        """
+        self.upstream_addr = upstream
+        self.upstream = None
+        self.upstream_reader = FrameReader()
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((host, port))
+        self.server.listen()
+        self.server.setblocking(False)
+        self.port = self.server.getsockname()[1]
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.server, selectors.EVENT_READ)
+        self.subscribers = {}  # {spectator id: Subscriber}
+        self.broadcaster = Broadcaster()
+        self.spectator_count = 0
+
+        # Stats
+        self.received = 0
+        self.forwarded = 0
+
+        print(f"Relay listening on {host}:{self.port}")
+
+    def connect_upstream(self):
+        """
+        Connect to the upstream server and wait for its handshake
+        """
+        self.upstream = socket.create_connection(self.upstream_addr)
+        handshake = []
+        while not handshake:
+            data = self.upstream.recv(4096)
+            if not data:
+                raise ConnectionError("Upstream closed the connection")
+            handshake = self.upstream_reader.feed(data)
+        client_id = pickle.loads(handshake[0])["client_id"]
+        self.upstream.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.upstream.setblocking(False)
+        self.selector.register(self.upstream, selectors.EVENT_READ)
+        print(f"Relaying {self.upstream_addr[0]}:{self.upstream_addr[1]} (upstream id {client_id})")
+
+    def accept(self):
+        """
+        Accept a spectator and send it its ID
+        """
+        conn, addr = self.server.accept()
+        self.spectator_count += 1
+        spectator_id = self.spectator_count
+        print(f"New spectator from {addr}, assigned ID: {spectator_id}")
+
+        conn.setblocking(True)
+        conn.sendall(encode({"client_id": spectator_id}))
+        conn.setblocking(False)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        subscriber = Subscriber(conn, spectator_id)
+        self.subscribers[spectator_id] = subscriber
+        self.selector.register(conn, selectors.EVENT_READ, subscriber)
+
+    def receive(self, subscriber):
+        """
+        Spectators only send keepalives; read them to notice disconnects
+        """
+        try:
+            data = subscriber.conn.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self.disconnect(subscriber)
+
+    def receive_upstream(self):
+        """
+        Read snapshot frames from upstream
+
+        :return: Bytes of the newest snapshot received, or None
+        """
+        try:
+            data = self.upstream.recv(65536)
+        except BlockingIOError:
+            return None
+        if not data:
+            raise ConnectionError("Upstream closed the connection")
+
+        latest = None
+        for payload in self.upstream_reader.feed(data):
+            latest = parse_snapshot(payload)[4]
+            self.received += 1
+        return latest
+
+    def disconnect(self, subscriber):
+        print(f"Lost spectator {subscriber.client_id}")
+        self.selector.unregister(subscriber.conn)
+        subscriber.conn.close()
+        del self.subscribers[subscriber.client_id]
+
+    def forward(self, snapshot):
+        """
+        Send snapshot bytes to every spectator, as received
+        """
+        self.forwarded += 1
+        for subscriber in self.broadcaster.broadcast(list(self.subscribers.values()), snapshot):
+            self.disconnect(subscriber)
+
+    def run(self):
+        self.connect_upstream()
+        while True:
+            latest = None
+            for key, _ in self.selector.select():
+                if key.fileobj is self.server:
+                    self.accept()
+                elif key.fileobj is self.upstream:
+                    latest = self.receive_upstream() or latest
+                else:
+                    self.receive(key.data)
+
+            # Several snapshots in one read: only the newest is worth sending on
+            if latest is not None:
+                self.forward(latest)
+
+    def close(self):
+        for subscriber in list(self.subscribers.values()):
+            self.disconnect(subscriber)
+        if self.upstream is not None:
+            self.upstream.close()
+        self.server.close()
+
+
+def parse_address(address, default_port=5000):
+    """
+    Split 'host:port' (port optional) into (host, port)
+    """
+    host, _, port = address.partition(':')
+    return host, int(port) if port else default_port
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relay a game server's snapshots to spectators")
+    parser.add_argument('--upstream', default='127.0.0.1:5000', help="Server or relay to follow, host:port")
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=5001)
+    args = parser.parse_args()
+
+    relay = Relay(parse_address(args.upstream), args.host, args.port)
+    try:
+        relay.run()
+    except KeyboardInterrupt:
+        print("\nRelay shutting down...")
+    except ConnectionError as e:
+        print(f"Relay stopped: {e}")
+    finally:
+        relay.close()
+
+
+if __name__ == "__main__":
+    main()
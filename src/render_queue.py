@@ -0,0 +1,88 @@
+import time
+
+import numpy as np
+
+
+class RenderQueue:
+    # Draw order, lowest first
+    ENTITIES = 0
+    HEALTH_BARS = 1
+    WEAPONS = 2
+    PROJECTILES = 3
+    LAYER_COUNT = 4
+
+    def __init__(self):
+        """
+        Collects a frame's world-space draws and submits them in batched blits calls
+
+        Callers queue surfaces with their previous and current simulation positions.
+        flush() interpolates, applies the camera offset to every item at once with
+        NumPy and hands each layer to the renderer as one blits() sequence, instead
+        of a Python-level camera.apply() and blit() per sprite.
+        """
+        self.surfaces = [[] for _ in range(self.LAYER_COUNT)]
+        self.positions = [[] for _ in range(self.LAYER_COUNT)]
+
+        # Stats for the last flush
+        self.items = 0
+        self.batches = 0
+        self.flush_ms = 0.0
+
+    def add(self, surface, previous, current, layer):
+        """
+        Queue a surface at a world position
+
+        :param surface: Surface to draw
+        :param previous: World top-left at the previous simulation step
+        :param current: World top-left at the current simulation step
+        :param layer: Draw order (see the layer constants)
+        """
+        self.surfaces[layer].append(surface)
+        self.positions[layer].extend((previous[0], previous[1], current[0], current[1]))
+
+    def add_sprite(self, sprite, layer, surface=None, offset=(0, 0)):
+        """
+        Queue a sprite (or a surface attached to it, like a health bar)
+
+        :param sprite: Sprite with rect and optional previous_position
+        :param layer: Draw order
+        :param surface: Surface to draw (defaults to sprite.image)
+        :param offset: Offset of the surface from the sprite's top-left
+        """
+        x, y = sprite.rect.topleft
+        previous = getattr(sprite, 'previous_position', None) or (x, y)
+        dx, dy = offset
+        self.surfaces[layer].append(sprite.image if surface is None else surface)
+        self.positions[layer].extend((previous[0] + dx, previous[1] + dy, x + dx, y + dy))
+
+    def flush(self, renderer, camera_offset, alpha=None):
+        """
+        Draw everything queued, layer by layer, and empty the queue
+
+        :param renderer: Object with a blits(sequence) method (DirtyRectRenderer)
+        :param camera_offset: Integer (x, y) camera offset for this frame
+        :param alpha: Interpolation factor between previous and current positions
+        """
+        start = time.perf_counter()
+        self.items = 0
+        self.batches = 0
+
+        for surfaces, positions in zip(self.surfaces, self.positions):
+            if not surfaces:
+                continue
+
+            # Flat previous x, y, current x, y per item
+            coords = np.array(positions, dtype=np.float64).reshape(-1, 4)
+            if alpha is None:
+                screen = coords[:, 2:]
+            else:
+                screen = coords[:, :2] + (coords[:, 2:] - coords[:, :2]) * alpha
+            screen = np.rint(screen - camera_offset).astype(np.int64).tolist()
+
+            renderer.blits(zip(surfaces, screen))
+            self.items += len(surfaces)
+            self.batches += 1
+            surfaces.clear()
+            positions.clear()
+
+        self.flush_ms = (time.perf_counter() - start) * 1000
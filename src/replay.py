@@ -0,0 +1,212 @@
+"""
+Session recording and deterministic headless replay
+
+Record a session from the project root:
+    python src/main.py --record session.rec
+
+Replay it as fast as possible and report frame times:
+    python src/replay.py session.rec
+    python src/replay.py session.rec --profile replay.prof
+
+A recording holds the seed, and per frame the simulation step count, the
+InputState, the frame's work time and any world state received from the server,
+zlib-compressed. Replaying feeds these back through Game.play_frame, so the
+simulation, spawns and damage match the original session exactly.
+"""
+import argparse
+import os
+import pickle
+import struct
+import zlib
+
+MAGIC = b'DREC'
+VERSION = 1
+
+# magic, version, seed, step rate
+HEADER = struct.Struct('<4sBIH')
+# steps, snapshot flag, frame time in 0.1 ms
+FRAME = struct.Struct('<BBH')
+SNAPSHOT_LENGTH = struct.Struct('<I')
+
+# Snapshot flags
+NO_SNAPSHOT = 0
+NEW_SNAPSHOT = 1
+SAME_SNAPSHOT = 2
+
+
+class SessionRecorder:
+    def __init__(self, path, seed, step_rate=60):
+        """
+        Streams a compact, compressed record of every played frame to a file
+
+        :param path: Output file
+        :param seed: The game's seed
+        :param step_rate: The game's fixed simulation rate
+        """
+        self.file = open(path, 'wb')
+        self.compressor = zlib.compressobj(6)
+        self.last_snapshot = None
+        self.frames = 0
+        self.write(HEADER.pack(MAGIC, VERSION, seed, step_rate))
+
+    def write(self, data):
+        self.file.write(self.compressor.compress(data))
+
+    def record_frame(self, steps, input_state, snapshot, frame_ms):
+        """
+        Append one frame
+
+        :param steps: Simulation steps run this frame
+        :param input_state: InputState used for the frame
+        :param snapshot: World state received from the server, or None
+        :param frame_ms: Frame work time in milliseconds
+        """
+        if snapshot is None:
+            flag, payload = NO_SNAPSHOT, b''
+        else:
+            data = pickle.dumps(snapshot)
+            if data == self.last_snapshot:
+                flag, payload = SAME_SNAPSHOT, b''
+            else:
+                flag, payload = NEW_SNAPSHOT, SNAPSHOT_LENGTH.pack(len(data)) + data
+                self.last_snapshot = data
+
+        frame_time = min(int(frame_ms * 10), 0xFFFF)
+        self.write(FRAME.pack(steps, flag, frame_time) + input_state.pack() + payload)
+        self.frames += 1
+
+    def close(self):
+        """
+        Flush and close the file
+        """
+        if self.file.closed:
+            return
+        self.file.write(self.compressor.flush())
+        self.file.close()
+        print(f"Recorded {self.frames} frames to {self.file.name}")
+
+
+class Recording:
+    def __init__(self, seed, step_rate, frames):
+        """
+        A loaded session
+
+        :param seed: The recorded game's seed
+        :param step_rate: The recorded game's simulation rate
+        :param frames: List of (steps, input_state, snapshot, frame_ms)
+        """
+        self.seed = seed
+        self.step_rate = step_rate
+        self.frames = frames
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a file written by SessionRecorder
+        """
+        from input_state import InputState
+
+        with open(path, 'rb') as file:
+            data = zlib.decompress(file.read())
+
+        magic, version, seed, step_rate = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} session recording")
+
+        frames = []
+        snapshot_data = None
+        offset = HEADER.size
+        input_size = InputState.FORMAT.size
+        while offset < len(data):
+            steps, flag, frame_time = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            input_state = InputState.unpack(data[offset:offset + input_size])
+            offset += input_size
+
+            if flag == NEW_SNAPSHOT:
+                length, = SNAPSHOT_LENGTH.unpack_from(data, offset)
+                offset += SNAPSHOT_LENGTH.size
+                snapshot_data = data[offset:offset + length]
+                offset += length
+            # Unpickled per frame: the game may keep and mutate what it receives
+            snapshot = pickle.loads(snapshot_data) if flag != NO_SNAPSHOT else None
+            frames.append((steps, input_state, snapshot, frame_time / 10))
+
+        return cls(seed, step_rate, frames)
+
+
+class ReplayNetwork:
+    def __init__(self):
+        """
+        Stand-in for Network that hands back the recorded world state of the current frame
+        """
+        self.client_id = None
+        self.snapshot = None
+
+    def send(self, data):
+        return self.snapshot
+
+
+def replay(recording, profile_path=None):
+    """
+    Play a recording through a headless Game as fast as possible
+
+    :param recording: Recording to play
+    :param profile_path: Optional file for cProfile stats of the replay
+    :return: List of per-frame durations in seconds
+    """
+    import time
+
+    from game import Game
+
+    network = ReplayNetwork()
+    game = Game(network=network, step_rate=recording.step_rate, seed=recording.seed)
+    game.finish_warmup()
+    game.title_screen = False
+
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    samples = []
+    for steps, input_state, snapshot, frame_ms in recording.frames:
+        start = time.perf_counter()
+        network.snapshot = snapshot
+        game.play_frame(input_state, steps)
+        samples.append(time.perf_counter() - start)
+        # The live game's frame times steer the enemy cap and quality tier
+        game.record_frame_time(frame_ms)
+
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+        print(f"Profile written to {profile_path}")
+
+    print(f"Final state: wave {game.director.wave}, {len(game.enemies)} enemies, "
+          f"kills {game.player.kills}, coins {game.player.coins}, health {game.player.health}")
+    return samples
+
+
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from benchmark import report
+
+    parser = argparse.ArgumentParser(description="Replay a recorded session headlessly")
+    parser.add_argument('recording')
+    parser.add_argument('--profile', help="Write cProfile stats to this file")
+    args = parser.parse_args()
+
+    recording = Recording.load(args.recording)
+    print(f"{args.recording}: {len(recording.frames)} frames, seed {recording.seed}")
+
+    recorded = [frame_ms / 1000 for _, _, _, frame_ms in recording.frames]
+    report("recorded frames", recorded)
+    report("replayed frames", replay(recording, args.profile))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,75 +1,214 @@
+import selectors
 import socket
 import pickle
-import threading
 import os
+import time
+
+from lag_compensation import LagCompensator
+from protocol import Broadcaster, Subscriber, encode
+from stats_store import StatsStore
 
 class GameServer:
-    def __init__(self, host='0.0.0.0'):
-        port = int(os.getenv('PORT', default=5000))
+    def __init__(self, host='0.0.0.0', port=None, tick_rate=60):
+        """
+        Authoritative game server: collects player states and broadcasts snapshots
+
+        One thread multiplexes every connection with a selector. Client updates are
+        applied as they arrive, and tick_rate times a second the combined state is
+        encoded once and fanned out to all clients (see protocol.Broadcaster).
+
+        :param host: Interface to listen on
+        :param port: Port (defaults to the PORT environment variable, then 5000)
+        :param tick_rate: Snapshot broadcasts per second
+        """
+        if port is None:
+            port = int(os.getenv('PORT', default=5000))
 
         self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server.bind((host, port))
         self.server.listen()
+        self.server.setblocking(False)
+        self.port = self.server.getsockname()[1]
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.server, selectors.EVENT_READ)
+        self.subscribers = {}  # {client_id: Subscriber}
+        self.broadcaster = Broadcaster()
+        self.tick_interval = 1.0 / tick_rate
 
         self.players = {}  # {client_id: {'position': (x,y), 'animation': state}}
         self.player_count = 0
 
-        print(f"Server started on {host}:{port}")
-
-    def handle_client(self, conn, client_id):
-        print(f"Starting to handle client {client_id}")
-        while True:
-            try:
-                data = pickle.loads(conn.recv(2048))
-                if not data:
-                    break
-
-                # Update this player's state
-                self.players[client_id] = data
-
-                # Send everyone's state back to this client
-                conn.send(pickle.dumps(self.players))
-            except Exception as e:
-                print(f"Error handling client {client_id}: {e}")
-                break
-
+        # Recent player positions, so shots are checked against what the shooter saw
+        self.lag_compensation = LagCompensator()
+        self.hits = {}  # {client_id: confirmed hits}, reported back in the shooter's state
+
+        # Lifetime kills and coins, persisted in the background
+        self.stats = StatsStore(os.getenv('STATS_DB', default='stats.db'))
+        self.reported = {}  # {client_id: (kills, coins) last reported this session}
+
+        print(f"Server started on {host}:{self.port}")
+
+    def handle_update(self, client_id, data):
+        """
+        Record the player's position and validate the shots it reported
+        """
+        now = time.monotonic() * 1000
+        self.lag_compensation.history.record(client_id, now, data['position'])
+
+        self.record_stats(client_id, data)
+
+        # Shots fired since the client's last send, each rewound to when it was fired
+        shots = data.pop('shots', None)
+        sent_at = data.pop('time', None)
+        if isinstance(shots, list) and shots:
+            rtt = data.get('rtt', 0)
+            view_times = [self.lag_compensation.view_time(now, rtt + self.shot_age(shot, sent_at)) for shot in shots]
+            hits = self.lag_compensation.validate(shots, view_times, [client_id] * len(shots))
+            self.hits[client_id] = self.hits.get(client_id, 0) + len(hits)
+        data['hits'] = self.hits.get(client_id, 0)
+
+    def shot_age(self, shot, sent_at):
+        """
+        How long before the packet was sent a coalesced shot was fired, in milliseconds
+
+        :param shot: Shot event with the client's timestamp
+        :param sent_at: Client time the packet was sent at
+        """
+        timestamp = shot.get('timestamp') if isinstance(shot, dict) else None
+        if not isinstance(timestamp, (int, float)) or not isinstance(sent_at, (int, float)):
+            return 0
+        return max(0, sent_at - timestamp)
+
+    def player_name(self, data):
+        """
+        Name a player's lifetime stats are kept under, or None when it didn't give one
+
+        Client ids restart with the server, so they can't stand in for a name.
+        """
+        name = data.get('name')
+        return name if isinstance(name, str) and name else None
+
+    def record_stats(self, client_id, data):
+        """
+        Turn the session kill and coin counters a named client reports into lifetime gains
+        """
+        name = self.player_name(data)
+        if name is None:
+            return
+        kills, coins = data.get('kills', 0), data.get('coins', 0)
+        last_kills, last_coins = self.reported.get(client_id, (0, 0))
+        # Counters going down means a new session on this connection
+        gained_kills = kills - last_kills if kills >= last_kills else kills
+        gained_coins = coins - last_coins if coins >= last_coins else coins
+        self.reported[client_id] = (kills, coins)
+        self.stats.add(name, gained_kills, gained_coins)
+
+    def accept(self):
+        """
+        Accept a connection, send the client its ID and start listening to it
+        """
+        conn, addr = self.server.accept()
+        self.player_count += 1
+        client_id = self.player_count
+
+        # Players join the snapshot with their first update, so connections
+        # that never send one (relays, see relay.py) stay out of the match
+        print(f"New connection from {addr}, assigned ID: {client_id}")
+
+        # Send the client their ID
+        conn.setblocking(True)
+        conn.sendall(encode({"client_id": client_id}))
+        conn.setblocking(False)
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        subscriber = Subscriber(conn, client_id)
+        self.subscribers[client_id] = subscriber
+        self.selector.register(conn, selectors.EVENT_READ, subscriber)
+
+    def receive(self, subscriber):
+        """
+        Read whatever a client sent and apply each complete player update
+        """
+        client_id = subscriber.client_id
+        try:
+            data = subscriber.conn.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            print(f"Error handling client {client_id}: {e}")
+            data = b''
+
+        if not data:
+            self.disconnect(subscriber)
+            return
+
+        for payload in subscriber.reader.feed(data):
+            state = pickle.loads(payload)
+            subscriber.ack = state.pop('seq', subscriber.ack)
+            if 'position' not in state:
+                continue  # Keepalive
+
+            # Update this player's state
+            self.players[client_id] = state
+            self.handle_update(client_id, state)
+
+    def disconnect(self, subscriber):
+        client_id = subscriber.client_id
         print(f"Lost connection to client {client_id}")
+        self.selector.unregister(subscriber.conn)
+        subscriber.conn.close()
+        del self.subscribers[client_id]
+
+        name = self.player_name(self.players.get(client_id) or {})
+        if name is not None:
+            self.stats.forget(name)
         if client_id in self.players:
             del self.players[client_id]
-        conn.close()
+        self.lag_compensation.history.remove(client_id)
+        self.reported.pop(client_id, None)
+        self.hits.pop(client_id, None)
+
+    def broadcast(self):
+        """
+        Send this tick's snapshot of every player to every client
+        """
+        for subscriber in self.broadcaster.broadcast(list(self.subscribers.values()), self.players):
+            self.disconnect(subscriber)
 
     def run(self):
         print("Server is running and waiting for connections...")
+        next_tick = time.monotonic()
         while True:
-            try:
-                conn, addr = self.server.accept()
-                self.player_count += 1
-                client_id = self.player_count
-
-                self.players[client_id] = {
-                    'position': (400, 300),
-                    'animation': 'idle'
-                }
-
-                print(f"New connection from {addr}, assigned ID: {client_id}")
-
-                # Send the client their ID
-                conn.send(pickle.dumps({"client_id": client_id}))
-
-                thread = threading.Thread(target=self.handle_client, args=(conn, client_id))
-                thread.daemon = True
-                thread.start()
-
-            except Exception as e:
-                print(f"Error accepting connection: {e}")
-                continue
+            timeout = max(0.0, next_tick - time.monotonic())
+            for key, _ in self.selector.select(timeout):
+                try:
+                    if key.fileobj is self.server:
+                        self.accept()
+                    else:
+                        self.receive(key.data)
+                except Exception as e:
+                    print(f"Error handling connection: {e}")
+                    subscriber = key.data
+                    if subscriber is not None and subscriber.client_id in self.subscribers:
+                        self.disconnect(subscriber)
+
+            now = time.monotonic()
+            if now >= next_tick:
+                self.broadcast()
+                # Skip missed ticks instead of bursting to catch up
+                next_tick = max(next_tick + self.tick_interval, now)
 
 
 if __name__ == "__main__":
+    server = GameServer()
     try:
-        server = GameServer()
         server.run()
     except KeyboardInterrupt:
         print("\nServer shutting down...")
     except Exception as e:
         print(f"Server error: {e}")
+    finally:
+        # Write out stats still waiting for the next flush
+        server.stats.close()
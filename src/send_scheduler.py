@@ -0,0 +1,98 @@
+class SendScheduler:
+    # Fields that change every frame without the player doing anything
+    VOLATILE = ('rtt', 'time')
+
+    def __init__(self, max_rate=30, min_rate=5, keepalive_interval=1.0, rtt_target=100):
+        """
+        Decides when the client sends its state instead of sending every frame
+
+        States are offered every frame and only sent when something changed,
+        at most `rate` times a second. Shots fired between sends are coalesced
+        into the next packet, so capping the rate never loses one. An idle
+        client sends a bare keepalive every keepalive_interval seconds.
+
+        The rate backs off when the server reports backpressure (halved) or the
+        round trip is slower than rtt_target (scaled down with it), and creeps
+        back up towards max_rate while the connection is healthy.
+
+        :param max_rate: Sends per second at most
+        :param min_rate: Sends per second the rate never adapts below
+        :param keepalive_interval: Seconds between sends while idle
+        :param rtt_target: Round-trip time (ms) above which the rate is reduced
+        """
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.keepalive_interval = keepalive_interval
+        self.rtt_target = rtt_target
+
+        self.rate = max_rate
+        self.last_send = None
+        self.last_sent_state = None
+        self.state = None  # Latest offered state
+        self.shots = []  # Shots offered since the last send
+        self.backpressure = 0
+
+        # Stats
+        self.offered = 0
+        self.sent = 0
+        self.keepalives = 0
+
+    def offer(self, state, shots=()):
+        """
+        Give the scheduler this frame's state
+
+        :param state: Player state dict
+        :param shots: Shot events fired this frame
+        """
+        self.offered += 1
+        self.state = state
+        self.shots.extend(shots)
+
+    def adapt(self, rtt, backpressure):
+        """
+        Adjust the send rate to the connection
+
+        :param rtt: Smoothed round-trip time in milliseconds
+        :param backpressure: Server backpressure counter (see Network.backpressure)
+        """
+        if backpressure > self.backpressure:
+            self.rate /= 2
+        elif rtt > self.rtt_target:
+            self.rate = min(self.rate, self.max_rate * self.rtt_target / rtt)
+        else:
+            self.rate += 0.5
+        self.backpressure = backpressure
+        self.rate = max(self.min_rate, min(self.max_rate, self.rate))
+
+    def changed(self):
+        if self.last_sent_state is None:
+            return True
+        return any(value != self.last_sent_state.get(key)
+                   for key, value in self.state.items() if key not in self.VOLATILE)
+
+    def poll(self, now):
+        """
+        Get the packet to send now, if one is due
+
+        :param now: Current time in seconds
+        :return: State dict (with coalesced 'shots'), keepalive {} or None
+        """
+        if self.state is None:
+            return None
+        elapsed = float('inf') if self.last_send is None else now - self.last_send
+
+        if (self.shots or self.changed()) and elapsed >= 1 / self.rate:
+            packet = dict(self.state)
+            if self.shots:
+                packet['shots'] = self.shots
+                self.shots = []
+            self.last_sent_state = self.state
+        elif elapsed >= self.keepalive_interval:
+            packet = {}
+            self.keepalives += 1
+        else:
+            return None
+
+        self.last_send = now
+        self.sent += 1
+        return packet
@@ -0,0 +1,282 @@
+import numpy as np
+
+
+class NeighbourGrid:
+    # Packs (cell_x, cell_y) into one sortable integer key
+    KEY_STRIDE = 1 << 21
+    KEY_BIAS = 1 << 20
+
+    NEIGHBOUR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+    def __init__(self, cell_size=40, max_per_cell=16):
+        """
+        Uniform cell grid over a set of points, rebuilt every frame
+
+        Points are bucketed by sorting their cell keys, so each point only looks
+        at the points in its own and the eight surrounding cells. Work per point
+        is bounded by max_per_cell, keeping neighbour queries O(N) overall.
+
+        :param cell_size: Cell width and height in pixels (use the query radius)
+        :param max_per_cell: Neighbours considered per cell; in very crowded cells
+                             a different run of points is picked each frame, so
+                             every point is seen (and stacks split) over a few frames
+        """
+        self.cell_size = cell_size
+        self.max_per_cell = max_per_cell
+
+        self.count = 0
+        self.keys = None
+        self.order = None
+        self.sorted_keys = None
+        self.builds = 0
+
+    def cell_keys(self, cells):
+        """
+        Turn integer (cell_x, cell_y) rows into packed keys
+        """
+        return (cells[:, 0] + self.KEY_BIAS) * self.KEY_STRIDE + (cells[:, 1] + self.KEY_BIAS)
+
+    def build(self, points):
+        """
+        Bucket points into cells
+
+        :param points: (N, 2) float array of positions
+        """
+        self.count = len(points)
+        cells = np.floor_divide(points, self.cell_size).astype(np.int64)
+        self.keys = self.cell_keys(cells)
+        self.order = np.argsort(self.keys, kind='stable')
+        self.sorted_keys = self.keys[self.order]
+        self.builds += 1
+
+    def pairs(self):
+        """
+        Collect candidate neighbour pairs for every point
+
+        :return: (points, others) index arrays; others[k] lies in a cell next to
+                 points[k]. Each point is also paired with itself, callers filter that out.
+        """
+        n = self.count
+        if n == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        point_chunks = []
+        other_chunks = []
+        indices = np.arange(n)
+        for dx, dy in self.NEIGHBOUR_OFFSETS:
+            neighbour_keys = self.keys + dx * self.KEY_STRIDE + dy
+            starts = np.searchsorted(self.sorted_keys, neighbour_keys, side='left')
+            ends = np.searchsorted(self.sorted_keys, neighbour_keys, side='right')
+            run_lengths = ends - starts
+            counts = np.minimum(run_lengths, self.max_per_cell)
+
+            total = int(counts.sum())
+            if total == 0:
+                continue
+
+            # Expand every (point, cell run) into one row per candidate
+            points = np.repeat(indices, counts)
+            run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            # Crowded cells start their run somewhere else every build
+            run_offsets = (run_offsets + self.builds * self.max_per_cell) % run_lengths[points]
+            point_chunks.append(points)
+            other_chunks.append(self.order[starts[points] + run_offsets])
+
+        if not point_chunks:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(point_chunks), np.concatenate(other_chunks)
+
+    def separation(self, points, radius):
+        """
+        Compute a push-apart vector for every point from nearby points
+
+        :param points: (N, 2) float array of positions
+        :param radius: Points closer than this push each other away
+        :return: (N, 2) array of offsets, strongest when points overlap
+        """
+        self.build(points)
+        push = np.zeros_like(points)
+
+        mine, others = self.pairs()
+        keep = mine != others
+        mine = mine[keep]
+        others = others[keep]
+
+        delta = points[mine] - points[others]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        close = distance < radius
+        if not close.any():
+            return push
+
+        mine = mine[close]
+        delta = delta[close]
+        distance = distance[close]
+
+        # Points sharing a position get a fixed per-index direction so stacks can break up
+        stacked = distance == 0
+        if stacked.any():
+            angles = mine[stacked] * 2.399963  # golden angle
+            delta[stacked, 0] = np.cos(angles)
+            delta[stacked, 1] = np.sin(angles)
+            distance[stacked] = 1.0
+
+        weight = (radius - distance) / (radius * distance)
+        push[:, 0] = np.bincount(mine, weights=delta[:, 0] * weight, minlength=len(points))
+        push[:, 1] = np.bincount(mine, weights=delta[:, 1] * weight, minlength=len(points))
+        return push
+
+
+class SweepGrid:
+    KEY_STRIDE = NeighbourGrid.KEY_STRIDE
+    KEY_BIAS = NeighbourGrid.KEY_BIAS
+
+    def __init__(self, cell_size=64):
+        """
+        Uniform cell grid of rects for swept segment tests (continuous collision)
+
+        Rects are bucketed into every cell they overlap, then each segment walks
+        only the cells its path crosses (Amanatides-Woo grid traversal), so a fast
+        projectile is tested against the rects along its whole path instead of
+        just where it ends up, without substeps. Everything runs as array passes
+        over all segments at once.
+
+        :param cell_size: Cell width and height in pixels (about the size of a rect)
+        """
+        self.cell_size = cell_size
+
+        self.sorted_keys = None
+        self.order = None  # Rect index per sorted key
+
+        # Stats for the last sweep
+        self.cells_visited = 0
+        self.candidates = 0
+
+    def cell_keys(self, cell_x, cell_y):
+        return (cell_x + self.KEY_BIAS) * self.KEY_STRIDE + (cell_y + self.KEY_BIAS)
+
+    def build(self, rects):
+        """
+        Bucket rects into every cell they overlap
+
+        :param rects: (N, 4) float array of x, y, width, height
+        """
+        size = self.cell_size
+        first_x = np.floor_divide(rects[:, 0], size).astype(np.int64)
+        first_y = np.floor_divide(rects[:, 1], size).astype(np.int64)
+        span_x = np.floor_divide(rects[:, 0] + rects[:, 2], size).astype(np.int64) - first_x + 1
+        span_y = np.floor_divide(rects[:, 1] + rects[:, 3], size).astype(np.int64) - first_y + 1
+        counts = span_x * span_y
+
+        # One row per (rect, covered cell)
+        total = int(counts.sum())
+        owners = np.repeat(np.arange(len(rects)), counts)
+        local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        keys = self.cell_keys(first_x[owners] + local % span_x[owners],
+                              first_y[owners] + local // span_x[owners])
+
+        order = np.argsort(keys, kind='stable')
+        self.sorted_keys = keys[order]
+        self.order = owners[order]
+
+    def traverse(self, starts, ends):
+        """
+        List the cells each segment passes through
+
+        :param starts: (M, 2) float array of segment starts
+        :param ends: (M, 2) float array of segment ends
+        :return: (segments, keys) arrays, one row per visited cell
+        """
+        size = self.cell_size
+        cells = np.floor_divide(starts, size).astype(np.int64)
+        last_cells = np.floor_divide(ends, size).astype(np.int64)
+        steps = np.abs(last_cells - cells).sum(axis=1) + 1
+
+        delta = ends - starts
+        step = np.sign(delta).astype(np.int64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Segment fraction to cross one cell, and to reach the next cell boundary
+            t_delta = np.where(delta != 0, size / np.abs(delta), np.inf)
+            boundary = (cells + (step > 0)) * size
+            t_max = np.where(delta != 0, (boundary - starts) / delta, np.inf)
+
+        indices = np.arange(len(starts))
+        segment_chunks = []
+        key_chunks = []
+        for visit in range(int(steps.max()) if len(starts) else 0):
+            active = visit < steps
+            segment_chunks.append(indices[active])
+            key_chunks.append(self.cell_keys(cells[active, 0], cells[active, 1]))
+
+            # Step along whichever axis reaches its next boundary first
+            along_x = t_max[:, 0] < t_max[:, 1]
+            axis = np.where(along_x, 0, 1)
+            cells[indices, axis] += step[indices, axis]
+            t_max[indices, axis] += t_delta[indices, axis]
+
+        if not segment_chunks:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(segment_chunks), np.concatenate(key_chunks)
+
+    def sweep(self, rects, starts, ends, half_sizes):
+        """
+        Find the first rect each moving box touches along its segment
+
+        :param rects: (N, 4) float array of x, y, width, height to hit
+        :param starts: (M, 2) float array of box centres at the start of the step
+        :param ends: (M, 2) float array of box centres at the end of the step
+        :param half_sizes: (M, 2) float array of box half extents
+        :return: (segments, rect indices, t) arrays with at most one hit per
+                 segment, t being the fraction of the segment travelled at contact
+        """
+        empty = np.zeros(0, dtype=np.int64)
+        self.cells_visited = self.candidates = 0
+        if len(rects) == 0 or len(starts) == 0:
+            return empty, empty, np.zeros(0)
+
+        # Grow rects by the largest box so the traversal of box centres finds them
+        pad = half_sizes.max(axis=0)
+        self.build(np.column_stack((rects[:, :2] - pad, rects[:, 2:] + pad * 2)))
+        segments, keys = self.traverse(starts, ends)
+        self.cells_visited = len(keys)
+
+        # Expand every visited cell into its rects
+        first = np.searchsorted(self.sorted_keys, keys, side='left')
+        counts = np.searchsorted(self.sorted_keys, keys, side='right') - first
+        total = int(counts.sum())
+        self.candidates = total
+        if total == 0:
+            return empty, empty, np.zeros(0)
+        segments = np.repeat(segments, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        targets = self.order[np.repeat(first, counts) + offsets]
+
+        # Slab test of each centre segment against its rect grown by the box half size
+        origin = starts[segments]
+        delta = ends[segments] - origin
+        low = rects[targets, :2] - half_sizes[segments]
+        high = rects[targets, :2] + rects[targets, 2:] + half_sizes[segments]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_low = (low - origin) / delta
+            t_high = (high - origin) / delta
+        axis_enter = np.minimum(t_low, t_high)
+        axis_exit = np.maximum(t_low, t_high)
+        # Not moving on an axis: inside the slab for the whole step, or never
+        still = delta == 0
+        inside = (origin >= low) & (origin <= high)
+        axis_enter = np.where(still, np.where(inside, -np.inf, np.inf), axis_enter)
+        axis_exit = np.where(still, np.where(inside, np.inf, -np.inf), axis_exit)
+
+        t_enter = axis_enter.max(axis=1)
+        t_exit = axis_exit.min(axis=1)
+        hit = (t_enter <= t_exit) & (t_exit >= 0) & (t_enter <= 1)
+        segments, targets, t = segments[hit], targets[hit], np.maximum(t_enter[hit], 0)
+
+        # Keep the earliest contact per segment
+        order = np.lexsort((t, segments))
+        segments, targets, t = segments[order], targets[order], t[order]
+        first_hit = np.ones(len(segments), dtype=bool)
+        first_hit[1:] = segments[1:] != segments[:-1]
+        return segments[first_hit], targets[first_hit], t[first_hit]
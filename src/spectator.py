@@ -0,0 +1,162 @@
+import pygame
+
+from animation import animation_clock
+from camera import Camera
+from game import Game
+from hud import TextCache
+from image_cache import images
+
+
+class SpectatorGame(Game):
+    def __init__(self, **kwargs):
+        """
+        Read-only view of a match: draws the players in the server's snapshots
+
+        There is no local player, no weapons and no simulation of enemies; the
+        camera follows one of the remote players (TAB switches). Connect it to
+        the game server or, for large audiences, to a relay (see relay.py).
+
+        :param kwargs: Game arguments
+        """
+        super().__init__(**kwargs)
+        self.camera = None
+        self.watched_id = None
+        self.play_text = self.font.render("Watch", True, (0, 0, 0))
+        self.status_text = TextCache(self.font)
+
+    def warmup_tasks(self):
+        """
+        Only remote player frames and the ground are needed to watch
+        """
+        def load_player():
+            for config in self.PLAYER_SPRITESHEET_CONFIG.values():
+                images.frames(config['file'], config['frame_count'], 2,
+                              (config['frame_width'], config['frame_height']))
+
+        return [("player", load_player),
+                ("world", lambda: self.world.prebuild(self.screen.get_rect()))]
+
+    def setup_world(self):
+        self.camera = Camera(self.screen.get_width(), self.screen.get_height(), smoothing=0.1)
+
+    def finish_warmup(self):
+        self.warmup.finish()
+        if self.camera is None:
+            self.setup_world()
+
+    @property
+    def playable(self):
+        return self.camera is not None and self.network_connect is None
+
+    def handle_title_screen_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return False
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if self.play_button.collidepoint(event.pos) and self.camera is not None:
+                    self.title_screen = False
+        return True
+
+    def handle_game_events(self, events):
+        running = super().handle_game_events(events)
+        for event in events:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+                self.watch_next()
+        return running
+
+    def watch_next(self):
+        """
+        Follow the next player in the snapshot
+        """
+        ids = sorted(self.remote_sprites)
+        if not ids:
+            return
+        later = [player_id for player_id in ids if self.watched_id is None or player_id > self.watched_id]
+        self.watch(later[0] if later else ids[0])
+
+    def watch(self, player_id):
+        self.watched_id = player_id
+        self.camera.set_target(self.remote_sprites.get(player_id))
+
+    def update_other_players(self, world_state):
+        """
+        Move the remote players' sprites and keep following someone still there
+        """
+        super().update_other_players(world_state)
+        if self.watched_id not in self.remote_sprites:
+            self.watched_id = None
+            self.watch_next()
+
+    def update_simulation(self):
+        """
+        Advance the view one fixed timestep (camera only; the server owns the match)
+        """
+        self.sim_steps += 1
+        for sprite in self.remote_sprites.values():
+            sprite.previous_position = sprite.rect.topleft
+        self.camera.update()
+
+    def play_frame(self, input_state, steps):
+        """
+        Run one frame of spectating: camera steps, read snapshots, render
+
+        :param input_state: Ignored; spectators only switch players (TAB)
+        :param steps: Fixed steps to run
+        :return: World state received, if any
+        """
+        for _ in range(steps):
+            self.update_simulation()
+
+        world_state = self.network.send(None) if self.network else None
+        if world_state is not None:
+            self.update_other_players(world_state)
+
+        animation_clock.set(self.sim_time + self.timestep.alpha * self.timestep.dt * 1000)
+        self.render(self.timestep.alpha)
+        return world_state
+
+    def render(self, alpha):
+        renderer = self.renderer
+        queue = self.render_queue
+        camera_offset = self.camera.offset(alpha)
+        self.world.stream(self.camera.view_rect())
+        renderer.begin_frame(camera_offset)
+
+        for sprite in self.remote_sprites.values():
+            sprite.animate()
+            queue.add_sprite(sprite, queue.ENTITIES)
+        queue.flush(renderer, camera_offset, alpha)
+
+        if self.watched_id is None:
+            status = "Waiting for players..."
+        else:
+            status = f"Watching player {self.watched_id} of {len(self.remote_sprites)} (TAB to switch)"
+        renderer.blit(self.status_text.get('status', status), (10, 10))
+
+        self.update_debug_stats()
+        self.debug_overlay.draw(renderer)
+
+        renderer.end_frame()
+
+    def update_debug_stats(self):
+        overlay = self.debug_overlay
+        overlay.set("FPS", f"{self.clock.get_fps():.0f}")
+        overlay.set("Players", len(self.remote_sprites))
+        if self.network:
+            overlay.set("Snapshots", f"tick {getattr(self.network, 'last_tick', 0)}, "
+                                     f"{getattr(self.network, 'backpressure', 0)} backpressure")
+        world = self.world
+        overlay.set("World chunks", f"{world.last_visible} drawn, {len(world.chunks)}/{world.max_chunks} "
+                                    f"cached, {world.builds} built, {world.evictions} evicted")
+
+    def apply_quality(self, tier):
+        """
+        Nothing to scale: spectators draw no particles, health bars or enemies
+        """
+
+    def spike_context(self, steps):
+        return {
+            'simulation steps': steps,
+            'remote players': len(self.remote_sprites),
+        }
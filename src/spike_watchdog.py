@@ -0,0 +1,222 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+
+class StackSampler:
+    def __init__(self, interval=0.002, max_depth=40):
+        """
+        Samples the calling thread's stack from a background thread
+
+        Each sample is a tuple of (filename, first line, function name) per
+        function on the stack, outermost first. The game thread runs no extra
+        code per call, so leaving the sampler on costs a wake-up every interval
+        instead of profiler overhead.
+
+        :param interval: Seconds between samples
+        :param max_depth: Innermost frames kept per sample
+        """
+        self.interval = interval
+        self.max_depth = max_depth
+        self.thread_id = threading.get_ident()
+        self.samples = []
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name='stack-sampler', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while self.running:
+            time.sleep(self.interval)
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.samples.append(tuple(reversed(stack)))
+
+    def take(self):
+        """
+        Get the samples since the last take() and start collecting anew
+        """
+        samples, self.samples = self.samples, []
+        return samples
+
+    def stop(self):
+        self.running = False
+
+
+class SpikeWatchdog:
+    def __init__(self, budget_ms=50, directory='profiles', window_frames=120, min_interval=30.0,
+                 max_captures=20, sample_interval=0.002):
+        """
+        Catches the frame that blows its budget, then profiles a window of frames after it
+
+        Every frame is timed and its game-thread stack sampled every
+        sample_interval seconds by a StackSampler; the samples are thrown away
+        when the frame stays in budget. When a frame takes longer than budget_ms,
+        its own samples are written straight away as a .txt with the game
+        context, the hottest functions and stacks, so one-off spikes (a disk
+        load, a GC pause, a chunk build) are caught.
+
+        Spikes that come back (panning, a crowded wave, a weapon) are then
+        covered in detail: the next window_frames frames run under one
+        cProfile.Profile, saved as a -window.prof (open with pstats or snakeviz)
+        next to a -window.txt with the frame times and top functions. Spikes are
+        judged on unprofiled frames only, so profiler overhead never triggers or
+        inflates one. Captures start at least min_interval seconds apart, at
+        most max_captures per session.
+
+        :param budget_ms: Frame time (excluding the frame-cap sleep) that counts as a spike
+        :param directory: Where captures are written
+        :param window_frames: Frames profiled after a spike (0 only saves the spike frame)
+        :param min_interval: Seconds between captures
+        :param max_captures: Captures per session
+        :param sample_interval: Seconds between stack samples
+        """
+        self.budget_ms = budget_ms
+        self.directory = directory
+        self.window_frames = window_frames
+        self.min_interval = min_interval
+        self.max_captures = max_captures
+        self.sampler = StackSampler(sample_interval)
+
+        self.frame_start = None
+        self.last_capture = None
+
+        # Capture window in progress
+        self.profiler = None
+        self.window_left = 0
+        self.window_times = []
+        self.capture_name = None
+
+        # Stats
+        self.frames = 0
+        self.spikes = 0
+        self.captures = 0
+        self.last_frame_ms = 0.0
+
+    def begin_frame(self):
+        """
+        Start timing and sampling (and, inside a capture window, profiling) a frame
+        """
+        self.frame_start = time.perf_counter()
+        self.sampler.take()
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def end_frame(self, context=None):
+        """
+        Stop timing the frame; save it if it was a spike and run the capture window
+
+        :param context: Callable returning a dict of game state worth keeping with
+                        a capture (entity and projectile counts, wave, ...); only
+                        called when a spike is saved
+        :return: Path of the profile or spike report saved, or None
+        """
+        if self.frame_start is None:
+            return None
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        samples = self.sampler.take()
+        self.frame_start = None
+        self.frames += 1
+
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.window_times.append(frame_ms)
+            self.window_left -= 1
+            if self.window_left > 0:
+                return None
+            profiler, self.profiler = self.profiler, None
+            return self.save_window(profiler)
+
+        self.last_frame_ms = frame_ms
+        if frame_ms <= self.budget_ms:
+            return None
+
+        self.spikes += 1
+        now = time.monotonic()
+        if self.captures >= self.max_captures:
+            return None
+        if self.last_capture is not None and now - self.last_capture < self.min_interval:
+            return None
+        self.last_capture = now
+        self.captures += 1
+        path = self.save_spike(frame_ms, samples, context() if context else {})
+
+        if self.window_frames > 0:
+            self.window_times = []
+            self.window_left = self.window_frames
+            self.profiler = cProfile.Profile()
+        return path
+
+    def save_spike(self, frame_ms, samples, context):
+        """
+        Write the spike frame's sampled stacks as a .txt report
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.capture_name = f"spike-{time.strftime('%Y%m%d-%H%M%S')}-{self.captures}-{frame_ms:.0f}ms"
+        path = os.path.join(self.directory, self.capture_name + '.txt')
+
+        summary = io.StringIO()
+        summary.write(f"Spike: {frame_ms:.1f} ms (budget {self.budget_ms} ms)\n")
+        for key, value in context.items():
+            summary.write(f"{key}: {value}\n")
+        summary.write(f"\n{len(samples)} stack samples, every {self.sampler.interval * 1000:.0f} ms\n")
+
+        if samples:
+            # Functions on the stack (inclusive) and at the top of it (self)
+            inclusive = Counter(function for stack in samples for function in set(stack))
+            own = Counter(stack[-1] for stack in samples)
+            summary.write("\n  total    self  function\n")
+            for function, count in inclusive.most_common(25):
+                summary.write(f"{count / len(samples):6.0%} {own[function] / len(samples):7.0%}  "
+                              f"{self.describe(function)}\n")
+
+            summary.write("\nHottest stacks:\n")
+            for stack, count in Counter(samples).most_common(5):
+                summary.write(f"\n{count / len(samples):.0%} of samples\n")
+                for function in stack:
+                    summary.write(f"    {self.describe(function)}\n")
+
+        with open(path, 'w') as file:
+            file.write(summary.getvalue())
+        print(f"Frame spike: {frame_ms:.0f} ms, sampled stacks saved to {path}")
+        return path
+
+    @staticmethod
+    def describe(function):
+        filename, line, name = function
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def save_window(self, profiler):
+        """
+        Write the capture window's .prof and .txt summary
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, self.capture_name + '-window.prof')
+        profiler.dump_stats(path)
+
+        summary = io.StringIO()
+        # Profiled frames run slower than they would unprofiled
+        over = sum(1 for frame_ms in self.window_times if frame_ms > self.budget_ms)
+        summary.write(f"Profiled {len(self.window_times)} frames after the spike: "
+                      f"slowest {max(self.window_times):.1f} ms, {over} over budget (with profiler overhead)\n\n")
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(25)
+        with open(os.path.join(self.directory, self.capture_name + '-window.txt'), 'w') as file:
+            file.write(summary.getvalue())
+
+        print(f"Profile of the {len(self.window_times)} frames after the spike saved to {path}")
+        return path
+
+    def close(self):
+        """
+        Stop the stack sampler
+        """
+        self.sampler.stop()
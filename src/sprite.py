@@ -1,11 +1,20 @@
 import pygame
 
-from weapons.flamethrower import Flamethrower
-from weapons.laser_gun import LaserGun
-from weapons.pistol import Pistol
-from weapons.shotgun import Shotgun
+from animation import animation_clock
+from image_cache import images
+from input_state import InputState
+from weapons.registry import default_registry
 
 class AnimatedSprite(pygame.sprite.Sprite):
+    ANIMATION_FPS = 12
+
+    # Animations drawn mirrored, and those mirrored only while facing left
+    FLIPPED_ANIMATIONS = ('run_left', 'idle_left')
+    FLIPPED_WHEN_FACING_LEFT = ('run_up', 'run_down')
+
+    # Mirrored frame lists shared by every sprite, keyed by the source frames
+    _flipped_frames = {}
+
     def __init__(self, position, spritesheet_config, scale=2):
         """
         Initialize an animated sprite with configurable sprite sheets and animation logic
@@ -21,8 +30,6 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.network_id = None
         self.animations = {}
         self.current_animation = 'idle'
-        self.frame_index = 0
-        self.animation_speed = 0.2  # Controls animation speed
         self.scale = scale  # Scaling factor
 
         # Load sprite sheets and configure animations
@@ -37,18 +44,30 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.velocity = pygame.math.Vector2(0, 0)
         self.last_facing_direction = 'right'
 
-        # Weapon management
+        # Weapon management: names in inventory order, built on first use
+        self.weapon_registry = default_registry()
         self.weapons = []
-        self.current_weapon = None
+        self.weapon_instances = {}
+        self.current_weapon_index = None
+
+        # (projectile_class, x, y, angle, stats) requests from weapons, drained by the game
+        self.spawn_requests = []
+        # Shot events from weapons that actually fired, drained by the game and
+        # sent to the server, which reports back how many it confirmed as hits
+        self.shots_fired = []
+        self.confirmed_hits = 0
 
         self.weapon_switch_cooldown = 300  # Milliseconds
         self.last_weapon_switch_time = 0
 
-        # Initialize default weapon
-        self.add_weapon('flamethrower')
-        self.add_weapon('shotgun')
-        self.add_weapon('pistol')
-        self.add_weapon('laser_gun')
+        # Set by the game every step: this frame's input (None reads pygame directly)
+        # and the simulation time in milliseconds, used for cooldowns
+        self.input = None
+        self.sim_time = 0
+
+        # Initialize default weapons
+        for weapon_type in self.weapon_registry.names:
+            self.add_weapon(weapon_type)
 
         self.health = 100
 
@@ -64,79 +83,76 @@ class AnimatedSprite(pygame.sprite.Sprite):
         :param spritesheet_config: Dictionary with animation configurations
         """
         for animation_name, config in spritesheet_config.items():
-            spritesheet = pygame.image.load(config['file']).convert_alpha()
-            frame_width = config['frame_width']
-            frame_height = config['frame_height']
-
-            frames = []
-            for i in range(config['frame_count']):
-                frame = spritesheet.subsurface(
-                    (i * frame_width, 0, frame_width, frame_height)
-                )
-                # Scale frame
-                scaled_frame = pygame.transform.scale(
-                    frame,
-                    (frame_width * self.scale, frame_height * self.scale)
-                )
-                frames.append(scaled_frame)
-
-            self.animations[animation_name] = frames
+            self.animations[animation_name] = images.frames(
+                config['file'],
+                config['frame_count'],
+                self.scale,
+                (config['frame_width'], config['frame_height'])
+            )
+
+    @classmethod
+    def flipped(cls, frames):
+        """
+        Get the mirrored version of a frame list, built once per list
+        """
+        key = tuple(frames)
+        flipped = cls._flipped_frames.get(key)
+        if flipped is None:
+            flipped = [pygame.transform.flip(frame, True, False) for frame in frames]
+            cls._flipped_frames[key] = flipped
+        return flipped
 
     def animate(self):
         """
-        Handle sprite animation cycling
+        Show the current animation's frame for the shared animation clock
         """
-        # Get current animation frames
         animation_frames = self.animations[self.current_animation]
 
-        # Increment frame index
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(animation_frames):
-            self.frame_index = 0
-
-        # Update current image
-        self.image = animation_frames[int(self.frame_index)]
-
-        if self.current_animation == 'run_left':
-            self.image = pygame.transform.flip(self.image, True, False)
+        flip = (self.current_animation in self.FLIPPED_ANIMATIONS or
+                (self.current_animation in self.FLIPPED_WHEN_FACING_LEFT and self.last_facing_direction == 'left'))
+        if flip:
+            animation_frames = self.flipped(animation_frames)
 
-        if self.current_animation == 'idle_left':
-            self.image = pygame.transform.flip(self.image, True, False)
-
-        if self.current_animation == 'run_up' and self.last_facing_direction == 'left':
-            self.image = pygame.transform.flip(self.image, True, False)
-
-        if self.current_animation == 'run_down' and self.last_facing_direction == 'left':
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = animation_frames[animation_clock.frame(0, self.ANIMATION_FPS, len(animation_frames))]
 
     def add_weapon(self, weapon_type):
         """
         Add a new weapon to the player's inventory
 
-        :param weapon_type: Type of weapon to add ('flamethrower' or 'shotgun')
-        """
-        if weapon_type == 'flamethrower':
-            weapon = Flamethrower(self)
-        elif weapon_type == 'shotgun':
-            weapon = Shotgun(self)
-        elif weapon_type == 'pistol':
-            weapon = Pistol(self)
-        elif weapon_type == "laser_gun":
-            weapon = LaserGun(self)
-        else:
+        The weapon (and its image) is only built the first time it is selected,
+        so sprites that never fire, like remote players, cost nothing.
+
+        :param weapon_type: Weapon name from the weapon registry
+        """
+        if weapon_type not in self.weapon_registry.definitions:
             raise ValueError(f"Unknown weapon type: {weapon_type}")
 
-        self.weapons.append(weapon)
+        self.weapons.append(weapon_type)
 
         # Set as current weapon if none exists
-        if self.current_weapon is None:
-            self.current_weapon = weapon
+        if self.current_weapon_index is None:
+            self.current_weapon_index = len(self.weapons) - 1
+
+    @property
+    def current_weapon(self):
+        """
+        The selected weapon, instantiated on first access
+        """
+        if self.current_weapon_index is None:
+            return None
+
+        weapon_type = self.weapons[self.current_weapon_index]
+        weapon = self.weapon_instances.get(weapon_type)
+        if weapon is None:
+            weapon = self.weapon_registry.create(weapon_type, self)
+            self.weapon_instances[weapon_type] = weapon
+        return weapon
 
     def switch_weapon(self):
         """
         Cycle through available weapons with a cooldown
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_time
 
         # Check if enough time has passed since last switch
         if current_time - self.last_weapon_switch_time < self.weapon_switch_cooldown:
@@ -149,9 +165,7 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.last_weapon_switch_time = current_time
 
         # Cycle to next weapon
-        current_index = self.weapons.index(self.current_weapon)
-        next_index = (current_index + 1) % len(self.weapons)
-        self.current_weapon = self.weapons[next_index]
+        self.current_weapon_index = (self.current_weapon_index + 1) % len(self.weapons)
 
     def handle_input(self, camera=None):
         """
@@ -159,26 +173,26 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
         :param camera: Optional camera object
         """
-        keys = pygame.key.get_pressed()
+        state = self.input or InputState.capture()
 
         # Reset velocity
         self.velocity.x = 0
         self.velocity.y = 0
 
         # Movement and animation logic
-        if keys[pygame.K_a]:
+        if state.pressed(InputState.LEFT):
             self.velocity.x = -self.speed
             self.current_animation = 'run_left'
             self.last_facing_direction = 'left'
-        elif keys[pygame.K_d]:
+        elif state.pressed(InputState.RIGHT):
             self.velocity.x = self.speed
             self.current_animation = 'run_right'
             self.last_facing_direction = 'right'
 
-        if keys[pygame.K_w]:
+        if state.pressed(InputState.UP):
             self.velocity.y = -self.speed
             self.current_animation = 'run_up'
-        elif keys[pygame.K_s]:
+        elif state.pressed(InputState.DOWN):
             self.velocity.y = self.speed
             self.current_animation = 'run_down'
 
@@ -189,14 +203,13 @@ class AnimatedSprite(pygame.sprite.Sprite):
             else:
                 self.current_animation = 'idle'
 
-        if keys[pygame.K_f]:
-            current_time = pygame.time.get_ticks()
+        if state.pressed(InputState.SWITCH_WEAPON):
+            current_time = self.sim_time
             if current_time - self.last_weapon_switch_time >= self.weapon_switch_cooldown:
                 self.switch_weapon()
 
         # Shooting
-        mouse_buttons = pygame.mouse.get_pressed()
-        if mouse_buttons[0] and self.current_weapon:
+        if state.pressed(InputState.FIRE) and self.current_weapon:
             self.current_weapon.shoot()
 
 
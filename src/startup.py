@@ -0,0 +1,77 @@
+import time
+
+
+class AssetWarmup:
+    def __init__(self, tasks):
+        """
+        Runs asset loading tasks a few at a time across frames
+
+        :param tasks: List of (label, callable) pairs, run in order
+        """
+        self.tasks = list(tasks)
+        self.completed = 0
+
+    @property
+    def done(self):
+        return self.completed >= len(self.tasks)
+
+    @property
+    def progress(self):
+        """
+        Fraction of tasks completed (0-1)
+        """
+        return self.completed / len(self.tasks) if self.tasks else 1.0
+
+    @property
+    def current_label(self):
+        """
+        Label of the next task to run, for progress text
+        """
+        return None if self.done else self.tasks[self.completed][0]
+
+    def step(self, budget_ms=8):
+        """
+        Run tasks until the frame's time budget is spent (always runs at least one)
+
+        :param budget_ms: Milliseconds of loading allowed this frame
+        :return: True once every task has run
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        while not self.done:
+            label, task = self.tasks[self.completed]
+            task()
+            self.completed += 1
+            if time.perf_counter() >= deadline:
+                break
+        return self.done
+
+    def finish(self):
+        """
+        Run every remaining task now
+        """
+        while not self.done:
+            self.step(budget_ms=float('inf'))
+
+
+class StartupTimer:
+    def __init__(self, started_at=None):
+        """
+        Records named startup milestones relative to process start
+
+        :param started_at: time.perf_counter() value when startup began
+                           (defaults to now)
+        """
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.milestones = {}
+
+    def mark(self, name):
+        """
+        Record a milestone the first time it is reached and report it
+
+        :param name: Milestone name, e.g. 'first frame'
+        :return: Milliseconds since start
+        """
+        if name not in self.milestones:
+            self.milestones[name] = (time.perf_counter() - self.started_at) * 1000
+            print(f"Startup: {name} after {self.milestones[name]:.0f} ms")
+        return self.milestones[name]
@@ -0,0 +1,167 @@
+import sqlite3
+import threading
+import time
+
+
+class StatsStore:
+    def __init__(self, path='stats.db', flush_interval=2.0, top_n=10):
+        """
+        Lifetime kills and coins per player in SQLite, written behind the game
+
+        add() only merges deltas into an in-memory dict, so the caller never waits
+        on disk. A background thread swaps that dict out every flush_interval
+        seconds and writes it in one transaction, however many updates it
+        coalesced. The leaderboard and the lifetime totals of recently active
+        players are refreshed after each flush and served from memory.
+
+        :param path: SQLite database file
+        :param flush_interval: Seconds between background flushes
+        :param top_n: Players kept in the leaderboard
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        self.top_n = top_n
+
+        self.lock = threading.Lock()
+        self.pending = {}  # name -> [kills, coins] not yet written
+        self.in_flight = {}  # pending gains of the flush being written
+        self.totals = {}  # name -> (kills, coins) as of the last flush
+        self.top = []  # [(name, kills, coins)], most kills first
+
+        # Stats
+        self.updates = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.rows_written = 0
+        self.last_flush_ms = 0.0
+
+        self.stopping = threading.Event()
+        self.ready = threading.Event()
+        self.error = None  # Why the writer couldn't open the database
+        self.thread = threading.Thread(target=self.writer, daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def add(self, name, kills=0, coins=0):
+        """
+        Record gains for a player (cheap, never touches the database)
+        """
+        if not kills and not coins:
+            return
+        with self.lock:
+            entry = self.pending.setdefault(name, [0, 0])
+            entry[0] += kills
+            entry[1] += coins
+            self.updates += 1
+
+    def lifetime(self, name):
+        """
+        A player's lifetime (kills, coins), including gains not yet flushed
+        """
+        with self.lock:
+            kills, coins = self.totals.get(name, (0, 0))
+            for gains in (self.in_flight, self.pending):
+                gained_kills, gained_coins = gains.get(name, (0, 0))
+                kills += gained_kills
+                coins += gained_coins
+        return kills, coins
+
+    def forget(self, name):
+        """
+        Drop a player's cached totals (e.g. on disconnect); pending gains still flush
+        """
+        with self.lock:
+            self.totals.pop(name, None)
+
+    def leaderboard(self):
+        """
+        Top players by kills as of the last flush
+        """
+        return self.top
+
+    def writer(self):
+        """
+        Background thread: owns the connection and flushes on an interval
+        """
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute("CREATE TABLE IF NOT EXISTS player_stats ("
+                               "name TEXT PRIMARY KEY, kills INTEGER NOT NULL, coins INTEGER NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS player_stats_kills ON player_stats (kills DESC)")
+            connection.commit()
+            self.refresh_top(connection)
+        except sqlite3.Error as e:
+            # Reported by __init__
+            self.error = e
+            return
+        finally:
+            self.ready.set()
+
+        while not self.stopping.wait(self.flush_interval):
+            self.flush(connection)
+        self.flush(connection)
+        connection.close()
+
+    def flush(self, connection):
+        """
+        Write every coalesced update in one transaction
+
+        If the write fails the gains go back into pending and are retried on
+        the next flush, so the writer thread keeps running.
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.in_flight = pending
+        if not pending:
+            return
+
+        start = time.perf_counter()
+        rows = [(name, kills, coins) for name, (kills, coins) in pending.items()]
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO player_stats (name, kills, coins) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET kills = kills + excluded.kills, "
+                    "coins = coins + excluded.coins", rows)
+        except sqlite3.Error as e:
+            with self.lock:
+                for name, (kills, coins) in pending.items():
+                    entry = self.pending.setdefault(name, [0, 0])
+                    entry[0] += kills
+                    entry[1] += coins
+                self.in_flight = {}
+            self.failed_flushes += 1
+            print(f"Stats flush failed, retrying next interval: {e}")
+            return
+
+        names = list(pending)
+        placeholders = ','.join('?' * len(names))
+        try:
+            updated = connection.execute(
+                f"SELECT name, kills, coins FROM player_stats WHERE name IN ({placeholders})", names).fetchall()
+            self.refresh_top(connection)
+        except sqlite3.Error as e:
+            # The gains are written; only the cached totals miss them until the next flush
+            print(f"Stats written, but reading totals back failed: {e}")
+            updated = []
+        with self.lock:
+            for name, kills, coins in updated:
+                self.totals[name] = (kills, coins)
+            self.in_flight = {}
+
+        self.flushes += 1
+        self.rows_written += len(rows)
+        self.last_flush_ms = (time.perf_counter() - start) * 1000
+
+    def refresh_top(self, connection):
+        self.top = connection.execute(
+            "SELECT name, kills, coins FROM player_stats ORDER BY kills DESC LIMIT ?", (self.top_n,)).fetchall()
+
+    def close(self):
+        """
+        Stop the writer after a final flush
+        """
+        self.stopping.set()
+        self.thread.join()
@@ -0,0 +1,81 @@
+import time
+
+
+class FixedTimestep:
+    def __init__(self, step_rate=60, max_frame_time=0.25):
+        """
+        Fixed-timestep accumulator that decouples simulation rate from render rate.
+
+        The simulation always advances in steps of exactly 1 / step_rate seconds,
+        so per-step speeds and lifetimes stay valid however fast frames are drawn.
+        Pure Python so the server can drive the same step.
+
+        :param step_rate: Simulation steps per second
+        :param max_frame_time: Longest frame (in seconds) fed into the accumulator,
+                               prevents a spiral of death after a long stall
+        """
+        self.step_rate = step_rate
+        self.dt = 1.0 / step_rate
+        self.max_frame_time = max_frame_time
+
+        self.accumulator = 0.0
+        self.last_time = None
+        self.step_count = 0
+
+    def reset(self):
+        """
+        Forget accumulated time, e.g. after leaving the title screen
+        """
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self, now=None):
+        """
+        Add the elapsed real time since the last call to the accumulator
+
+        :param now: Current time in seconds (defaults to time.perf_counter())
+        :return: Number of simulation steps to run this frame
+        """
+        if now is None:
+            now = time.perf_counter()
+
+        if self.last_time is None:
+            self.last_time = now
+            return 0
+
+        frame_time = min(now - self.last_time, self.max_frame_time)
+        self.last_time = now
+        self.accumulator += frame_time
+
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        self.step_count += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """
+        Fraction of a step left in the accumulator, used to blend the
+        previous and current simulation states when rendering
+        """
+        return self.accumulator / self.dt
+
+    @property
+    def sim_time(self):
+        """
+        Total simulated time in milliseconds
+        """
+        return self.step_count * self.dt * 1000
+
+
+def lerp_position(previous, current, alpha):
+    """
+    Linearly interpolate between two (x, y) positions
+
+    :param previous: Position at the previous simulation step
+    :param current: Position at the current simulation step
+    :param alpha: Blend factor (0 = previous, 1 = current)
+    :return: Interpolated (x, y) tuple
+    """
+    return (previous[0] + (current[0] - previous[0]) * alpha,
+            previous[1] + (current[1] - previous[1]) * alpha)
@@ -0,0 +1,176 @@
+import random
+
+
+class WaveDirector:
+    def __init__(self, dino_types, max_enemies=250, min_enemies=40, first_wave_size=10, wave_growth=6,
+                 types_per_wave=2, spawn_interval=200, wave_break=4000, clear_fraction=0.25,
+                 frame_budget_ms=1000 / 60, spawn_margin=64, prewarm=None, seed=None):
+        """
+        Spawns enemies in waves under a live-entity budget that follows frame time
+
+        Each wave has a size and a few dino types. Its enemies trickle in every
+        spawn_interval ms just outside the camera view. The next wave starts
+        wave_break ms after the current one has finished spawning and most of it
+        has been killed. Spawning never exceeds the cap, which starts at
+        max_enemies, shrinks while frames run over frame_budget_ms and grows back
+        when there is headroom. The next wave's dino types are planned a wave
+        ahead and passed to prewarm, one type per update, so their sprite sheets
+        are loaded before any of them spawn.
+
+        :param dino_types: Dino types waves pick from
+        :param max_enemies: Hard limit on live enemies
+        :param min_enemies: Lowest the adaptive cap may go
+        :param first_wave_size: Enemies in the first wave
+        :param wave_growth: Extra enemies per wave after the first
+        :param types_per_wave: Dino types mixed in each wave
+        :param spawn_interval: Milliseconds between spawns within a wave
+        :param wave_break: Milliseconds of quiet before the next wave
+        :param clear_fraction: Fraction of a wave still alive at which the break may start
+        :param frame_budget_ms: Target frame time the cap adapts to
+        :param spawn_margin: Distance outside the view (pixels) at which enemies appear
+        :param prewarm: Callable(dino_type) that loads a type's assets
+        :param seed: Seed for wave composition and spawn positions
+        """
+        self.dino_types = list(dino_types)
+        self.max_enemies = max_enemies
+        self.min_enemies = min_enemies
+        self.first_wave_size = first_wave_size
+        self.wave_growth = wave_growth
+        self.types_per_wave = types_per_wave
+        self.spawn_interval = spawn_interval
+        self.wave_break = wave_break
+        self.clear_fraction = clear_fraction
+        self.frame_budget_ms = frame_budget_ms
+        self.spawn_margin = spawn_margin
+        self.prewarm = prewarm
+        self.rng = random.Random(seed)
+
+        self.wave = 0
+        self.wave_types = []
+        self.spawned = 0
+        self.next_spawn_time = 0
+        self.break_until = None  # Set once the current wave has cleared enough
+        self.enemy_cap = max_enemies
+        self.frame_ms = None  # Smoothed frame time
+
+        self.next_types = self.pick_types()
+        self.pending_prewarm = list(self.next_types)
+
+    @property
+    def wave_size(self):
+        """
+        Number of enemies in the current wave
+        """
+        return self.first_wave_size + (self.wave - 1) * self.wave_growth
+
+    def pick_types(self):
+        """
+        Choose the dino types for an upcoming wave
+        """
+        count = min(self.types_per_wave, len(self.dino_types))
+        return self.rng.sample(self.dino_types, count)
+
+    def prewarm_all(self):
+        """
+        Load every pending dino type now (title screen, or a wave starting early)
+        """
+        while self.pending_prewarm:
+            self.prewarm_step()
+
+    def prewarm_step(self):
+        """
+        Load the assets of one dino type of the next wave
+        """
+        dino_type = self.pending_prewarm.pop(0)
+        if self.prewarm:
+            self.prewarm(dino_type)
+
+    def start_wave(self, now):
+        """
+        Begin the next wave and plan the one after it
+        """
+        self.prewarm_all()
+        self.wave += 1
+        self.wave_types = self.next_types
+        self.spawned = 0
+        self.next_spawn_time = now
+        self.break_until = None
+        print(f"Wave {self.wave}: {self.wave_size} x {', '.join(self.wave_types)}")
+
+        self.next_types = self.pick_types()
+        self.pending_prewarm = [dino_type for dino_type in self.next_types
+                                if dino_type not in self.wave_types]
+
+    def record_frame(self, frame_ms):
+        """
+        Feed the time spent on the last frame (excluding the frame-cap sleep)
+
+        The cap drops 10% per frame while the smoothed frame time is over budget,
+        and grows by one enemy per frame while it is below 80% of the budget.
+
+        :param frame_ms: Frame time in milliseconds
+        """
+        if self.frame_ms is None:
+            self.frame_ms = frame_ms
+        else:
+            self.frame_ms += (frame_ms - self.frame_ms) * 0.1
+
+        if self.frame_ms > self.frame_budget_ms:
+            self.enemy_cap = max(self.min_enemies, int(self.enemy_cap * 0.9))
+        elif self.frame_ms < self.frame_budget_ms * 0.8:
+            self.enemy_cap = min(self.max_enemies, self.enemy_cap + 1)
+
+    def spawn_position(self, view):
+        """
+        Pick a point on a ring just outside the camera view
+
+        :param view: Camera view rect in world coordinates
+        :return: (x, y) world position
+        """
+        area = view.inflate(self.spawn_margin * 2, self.spawn_margin * 2)
+        # Choose an edge in proportion to its length, then a point along it
+        distance = self.rng.uniform(0, 2 * (area.width + area.height))
+        if distance < area.width:
+            return area.left + distance, area.top
+        distance -= area.width
+        if distance < area.width:
+            return area.left + distance, area.bottom
+        distance -= area.width
+        if distance < area.height:
+            return area.left, area.top + distance
+        return area.right, area.top + distance - area.height
+
+    def update(self, now, view, live_enemies):
+        """
+        Advance the director and get the enemies to spawn this step
+
+        :param now: Simulation time in milliseconds
+        :param view: Camera view rect in world coordinates
+        :param live_enemies: Enemies currently alive
+        :return: List of (position, dino_type) to spawn
+        """
+        if self.pending_prewarm:
+            self.prewarm_step()
+
+        if self.wave == 0:
+            self.start_wave(now)
+
+        if self.spawned >= self.wave_size:
+            # Wave fully spawned: wait for it to thin out, then take a break
+            if self.break_until is None:
+                if live_enemies <= self.wave_size * self.clear_fraction:
+                    self.break_until = now + self.wave_break
+            elif now >= self.break_until:
+                self.start_wave(now)
+            return []
+
+        spawns = []
+        while (now >= self.next_spawn_time and self.spawned < self.wave_size and
+               live_enemies + len(spawns) < self.enemy_cap):
+            dino_type = self.rng.choice(self.wave_types)
+            spawns.append((self.spawn_position(view), dino_type))
+            self.spawned += 1
+            self.next_spawn_time += self.spawn_interval
+        # Don't bank spawns while the cap holds them back
+        self.next_spawn_time = max(self.next_spawn_time, now)
+        return spawns
@@ -1,40 +1,53 @@
 import pygame
 import math
 
+from image_cache import images
+from input_state import InputState
+
 class BaseWeapon(pygame.sprite.Sprite):
-    def __init__(self, image_path, owner, scale=1, offset=(0, 0)):
+    def __init__(self, name, definition, owner):
         """
-        Base weapon class for all weapon types
+        Weapon configured from a declarative definition (see weapons.json)
 
-        :param image_path: Path to weapon image
+        :param name: Weapon name from the definition file
+        :param definition: Dict with image, scale, offset, fire_rate, projectile,
+                           count, spread, speed, lifetime and damage
         :param owner: Player sprite that holds the weapon
-        :param scale: Scale factor for the weapon image (default 1)
-        :param offset: Tuple (x_offset, y_offset) to adjust weapon position relative to owner
         """
         super().__init__()
+        self.name = name
+        self.definition = definition
 
-        # Load weapon image
-        original_image = pygame.image.load(image_path).convert_alpha()
+        # Load weapon image once, shared by every owner through the image cache
+        original_image = images.load(definition['image'])
 
         # Scale the image
-        original_width = original_image.get_width()
-        original_height = original_image.get_height()
-        new_width = int(original_width / scale)
-        new_height = int(original_height / scale)
+        scale = definition.get('scale', 1)
+        new_width = int(original_image.get_width() / scale)
+        new_height = int(original_image.get_height() / scale)
 
-        self.original_image = pygame.transform.scale(original_image, (new_width, new_height))
+        self.original_image = images.load(definition['image'], (new_width, new_height))
         self.image = self.original_image
         self.rect = self.image.get_rect()
+        self.angle = 0
 
         # Weapon properties
         self.owner = owner
-        self.offset = offset
-        self.damage = 10
-        self.fire_rate = 500  # Milliseconds between shots
+        self.offset = tuple(definition.get('offset', (0, 0)))
+        self.damage = definition['damage']
+        self.fire_rate = definition['fire_rate']  # Milliseconds between shots
         self.last_shot_time = 0
 
         # Projectile properties
-        self.projectiles = pygame.sprite.Group()
+        self.projectile_class = definition['projectile_class']
+        self.projectile_count = definition.get('count', 1)
+
+    def mouse_position(self):
+        """
+        Mouse position in screen coordinates from the owner's input for this frame
+        """
+        state = self.owner.input or InputState.capture()
+        return state.mouse_pos
 
     def rotate_to_mouse(self, camera=None):
         """
@@ -43,7 +56,7 @@ class BaseWeapon(pygame.sprite.Sprite):
         :param camera: Optional camera object to account for screen offset
         """
         # Get mouse position
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = self.mouse_position()
 
         # If camera is provided, adjust mouse position
         if camera:
@@ -56,6 +69,7 @@ class BaseWeapon(pygame.sprite.Sprite):
 
         # Calculate the angle to the mouse
         angle = math.degrees(math.atan2(mouse_y - weapon_y, mouse_x - weapon_x))
+        self.angle = angle
 
         # Determine if the weapon should be flipped
         flip = angle > 90 or angle < -90
@@ -71,13 +85,13 @@ class BaseWeapon(pygame.sprite.Sprite):
         self.image = rotated_image
         self.rect = self.image.get_rect(center=(weapon_x, weapon_y))
 
-    def shoot(self):
+    def can_fire(self):
         """
-        Base shooting method to be overridden by specific weapon types
+        Check the fire rate and start the cooldown if a shot is allowed
 
-        :return: True if shot successful, False otherwise
+        :return: True if the weapon may fire now
         """
-        current_time = pygame.time.get_ticks()
+        current_time = self.owner.sim_time
 
         # Check fire rate
         if current_time - self.last_shot_time < self.fire_rate:
@@ -86,24 +100,58 @@ class BaseWeapon(pygame.sprite.Sprite):
         self.last_shot_time = current_time
         return True
 
+    def shoot(self):
+        """
+        Fire the definition's projectiles towards the mouse cursor
+
+        :return: True if shot successful, False otherwise
+        """
+        if not self.can_fire():
+            return False
+
+        mouse_x, mouse_y = self.mouse_position()
+
+        if self.owner.camera:
+            mouse_x += int(self.owner.camera.camera.x)
+            mouse_y += int(self.owner.camera.camera.y)
+
+        weapon_x = self.owner.rect.centerx
+        weapon_y = self.owner.rect.centery
+
+        angle = math.degrees(math.atan2(mouse_y - weapon_y, mouse_x - weapon_x))
+
+        for _ in range(self.projectile_count):
+            self.emit(weapon_x, weapon_y, angle)
+
+        # The server validates this shot with lag compensation (see run_server.py)
+        self.owner.shots_fired.append({
+            'weapon_type': self.name,
+            'position': (weapon_x, weapon_y),
+            'angle': angle,
+            'timestamp': self.owner.sim_time
+        })
+        return True
+
+    def emit(self, x, y, angle):
+        """
+        Request a projectile; the game's ProjectileRegistry spawns and owns it
+
+        :param x: Spawn x position
+        :param y: Spawn y position
+        :param angle: Firing angle in degrees
+        """
+        self.owner.spawn_requests.append((self.projectile_class, x, y, angle, self.definition))
+
     def update(self, camera=None):
         """
         Update weapon position and rotation
         """
-        self.rotate_to_mouse()
-
         self.rotate_to_mouse(camera)
 
-        # Update any active projectiles
-        self.projectiles.update()
-
     def draw(self, surface):
         """
-        Draw weapon and its projectiles
+        Draw weapon
 
         :param surface: Pygame surface to draw on
         """
-
-
-        surface.blit(self.image, self.rect)
-        self.projectiles.draw(surface)
\ No newline at end of file
+        surface.blit(self.image, self.rect)
\ No newline at end of file
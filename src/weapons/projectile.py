@@ -0,0 +1,191 @@
+import math
+import random
+
+import pygame
+
+
+class ProjectilePool:
+    def __init__(self, projectile_class, max_free=1024):
+        """
+        Free list of expired projectiles of one type, reused instead of reallocated
+
+        :param projectile_class: Projectile subclass this pool hands out
+        :param max_free: Most expired projectiles kept around for reuse
+        """
+        self.projectile_class = projectile_class
+        self.max_free = max_free
+        self.free = []
+
+        # Stats
+        self.allocations = 0
+        self.acquires = 0
+        self.reuses = 0
+
+    def acquire(self, x, y, angle, stats=None):
+        """
+        Get a live projectile, reusing an expired one when possible
+
+        :param x: Spawn x position
+        :param y: Spawn y position
+        :param angle: Firing angle in degrees
+        :param stats: Optional dict overriding speed, spread, lifetime and damage
+        :return: Projectile ready to be added to groups
+        """
+        self.acquires += 1
+        if self.free:
+            self.reuses += 1
+            projectile = self.free.pop()
+            projectile.reset(x, y, angle, stats)
+            return projectile
+
+        self.allocations += 1
+        projectile = self.projectile_class(x, y, angle, stats)
+        projectile.pool = self
+        return projectile
+
+    def release(self, projectile):
+        """
+        Return an expired projectile to the free list
+        """
+        if len(self.free) < self.max_free:
+            self.free.append(projectile)
+
+    @property
+    def hit_rate(self):
+        """
+        Fraction of acquires served from the free list
+        """
+        return self.reuses / self.acquires if self.acquires else 0.0
+
+
+class Projectile(pygame.sprite.Sprite):
+    SPEED = 10
+    DAMAGE = 10
+    SPREAD = 0  # Random spread in degrees either side of the aim
+    LIFETIME = 30  # Frames
+    # Visual particle: fewer are drawn at low quality (all of them still hit)
+    PARTICLE = False
+
+    def __init__(self, x, y, angle, stats=None):
+        """
+        Base projectile with a shared pre-rendered image and pool-friendly reset
+
+        :param x: Spawn x position
+        :param y: Spawn y position
+        :param angle: Firing angle in degrees
+        :param stats: Optional dict overriding speed, spread, lifetime and damage
+        """
+        super().__init__()
+        self.image = self.shared_image()
+        self.rect = self.image.get_rect()
+        self.pool = None
+        self.reset(x, y, angle, stats)
+
+    @classmethod
+    def render_image(cls):
+        """
+        Draw this projectile type's image, called once per type
+
+        The default is a small bullet; particle types draw their own.
+        """
+        image = pygame.Surface((3, 3))
+        image.fill((50, 50, 50))
+        return image
+
+    @classmethod
+    def shared_image(cls):
+        """
+        Get the image shared by every projectile of this type
+        """
+        image = cls.__dict__.get('_image')
+        if image is None:
+            image = cls.render_image()
+            cls._image = image
+        return image
+
+    def reset(self, x, y, angle, stats=None):
+        """
+        (Re)initialise state for a new shot
+
+        :param stats: Optional dict (usually the weapon definition) with speed,
+                      spread, lifetime and damage; class defaults fill the gaps
+        """
+        stats = stats or {}
+        speed = stats.get('speed', self.SPEED)
+        spread = stats.get('spread', self.SPREAD)
+
+        self.rect.center = (x, y)
+        # The first step is swept (and drawn) from the muzzle
+        self.previous_position = self.rect.topleft
+        self.damage = stats.get('damage', self.DAMAGE)
+        self.lifetime = stats.get('lifetime', self.LIFETIME)
+
+        radians = math.radians(angle + random.uniform(-spread, spread))
+        self.vx = math.cos(radians) * speed
+        self.vy = math.sin(radians) * speed
+
+    def update(self):
+        self.rect.x += self.vx
+        self.rect.y += self.vy
+
+        # Remove after lifetime
+        self.lifetime -= 1
+        if self.lifetime <= 0:
+            self.expire()
+
+    def expire(self):
+        """
+        Remove the projectile from all groups and hand it back to its pool
+        """
+        if not self.alive():
+            return
+        self.kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class FlameParticle(Projectile):
+    SPEED = 10
+    DAMAGE = 1
+    SPREAD = 15
+    LIFETIME = 30  # Frames
+    PARTICLE = True
+
+    @classmethod
+    def render_image(cls):
+        image = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 128, 0, 200), (10, 10), 5)
+        return image
+
+
+class LaserBeam(Projectile):
+    SPEED = 10
+    DAMAGE = 15
+    SPREAD = 1
+    LIFETIME = 30  # Frames
+
+    @classmethod
+    def render_image(cls):
+        image = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.circle(image, (224, 70, 62, 200), (10, 10), 5)
+        return image
+
+
+class Ammo(Projectile):
+    SPEED = 15
+    DAMAGE = 30
+    SPREAD = 0
+    LIFETIME = 60  # Frames
+
+
+class Pellet(Projectile):
+    SPEED = 15
+    DAMAGE = 10
+    SPREAD = 10  # Spread of the pellets
+    LIFETIME = 60  # Frames
+
+
+# Projectile types that weapon definitions can refer to by name
+PROJECTILE_TYPES = {
+    cls.__name__: cls for cls in (FlameParticle, LaserBeam, Ammo, Pellet)
+}
@@ -0,0 +1,68 @@
+import json
+import os
+
+from .base_weapon import BaseWeapon
+from .projectile import PROJECTILE_TYPES
+
+DEFINITIONS_PATH = os.path.join(os.path.dirname(__file__), 'weapons.json')
+
+REQUIRED_FIELDS = ('image', 'fire_rate', 'projectile', 'damage')
+
+
+class WeaponRegistry:
+    def __init__(self, definitions):
+        """
+        Weapon definitions by name, used to build weapons on demand
+
+        :param definitions: Dict of name -> definition dict (see weapons.json)
+        """
+        self.definitions = {}
+        for name, definition in definitions.items():
+            missing = [field for field in REQUIRED_FIELDS if field not in definition]
+            if missing:
+                raise ValueError(f"Weapon '{name}' is missing {', '.join(missing)}")
+
+            projectile_class = PROJECTILE_TYPES.get(definition['projectile'])
+            if projectile_class is None:
+                raise ValueError(f"Weapon '{name}' uses unknown projectile {definition['projectile']}")
+
+            self.definitions[name] = dict(definition, projectile_class=projectile_class)
+
+    @classmethod
+    def from_file(cls, path=DEFINITIONS_PATH):
+        """
+        Load definitions from a JSON file
+        """
+        with open(path) as file:
+            return cls(json.load(file))
+
+    @property
+    def names(self):
+        """
+        Weapon names in definition order
+        """
+        return list(self.definitions)
+
+    def create(self, name, owner):
+        """
+        Build a weapon from its definition
+
+        :param name: Weapon name
+        :param owner: Player sprite that holds the weapon
+        """
+        if name not in self.definitions:
+            raise ValueError(f"Unknown weapon type: {name}")
+        return BaseWeapon(name, self.definitions[name], owner)
+
+
+_default_registry = None
+
+
+def default_registry():
+    """
+    Get the registry for the bundled weapons.json, loading it on first use
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = WeaponRegistry.from_file()
+    return _default_registry
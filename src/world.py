@@ -0,0 +1,195 @@
+import random
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+
+class TileSet:
+    # Base colors for each tile type
+    TILE_COLORS = (
+        (58, 110, 48),   # grass
+        (64, 120, 52),   # light grass
+        (52, 98, 44),    # dark grass
+        (112, 88, 58),   # dirt
+        (96, 96, 90),    # stone
+    )
+
+    def __init__(self, tile_size=32, seed=0):
+        """
+        Procedurally drawn ground tiles, rendered once and shared by every chunk
+
+        :param tile_size: Tile width and height in pixels
+        :param seed: Seed for the speckle pattern on each tile
+        """
+        self.tile_size = tile_size
+        rng = random.Random(seed)
+        self.tiles = [self.render_tile(color, rng) for color in self.TILE_COLORS]
+
+    def render_tile(self, color, rng):
+        """
+        Draw one tile: a flat base color with lighter and darker speckles
+        """
+        size = self.tile_size
+        tile = pygame.Surface((size, size))
+        tile.fill(color)
+        for _ in range(size // 2):
+            shade = rng.choice((-14, 12))
+            speckle = tuple(max(0, min(255, channel + shade)) for channel in color)
+            x, y = rng.randrange(size), rng.randrange(size)
+            tile.fill(speckle, pygame.Rect(x, y, 2, 2))
+        return tile
+
+
+class World:
+    def __init__(self, tile_size=32, chunk_tiles=16, max_chunks=16, prefetch_margin=96,
+                 builds_per_frame=1, seed=0):
+        """
+        Endless tilemap background, pre-rendered into chunk surfaces and streamed by view
+
+        The ground is split into chunks of chunk_tiles x chunk_tiles tiles. Each chunk
+        is drawn once into its own surface, so a frame blits only the chunks touching
+        the view (4-9 with chunks at least half a screen in size) instead of every
+        tile. Chunks live in an LRU cache of max_chunks surfaces, so memory stays
+        bounded however far players travel.
+
+        :param tile_size: Tile width and height in pixels
+        :param chunk_tiles: Tiles along each side of a chunk
+        :param max_chunks: Chunk surfaces kept before the least recently used is evicted
+        :param prefetch_margin: Distance beyond the view (pixels) at which chunks are
+                                built ahead of time
+        :param builds_per_frame: Prefetch builds allowed per stream() call
+        :param seed: World seed; the same seed always produces the same ground
+        """
+        self.tile_size = tile_size
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = tile_size * chunk_tiles
+        self.max_chunks = max_chunks
+        self.prefetch_margin = prefetch_margin
+        self.builds_per_frame = builds_per_frame
+        self.seed = seed
+
+        self.tileset = TileSet(tile_size, seed)
+        self.chunks = OrderedDict()  # (cx, cy) -> surface, least recently used first
+
+        # Stats
+        self.builds = 0
+        self.evictions = 0
+        self.last_visible = 0
+
+    def chunk_range(self, rect):
+        """
+        Get the chunk coordinates overlapping a world rect
+
+        :param rect: Rect in world coordinates
+        :return: List of (cx, cy)
+        """
+        size = self.chunk_size
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        return [(cx, cy) for cy in range(top, bottom + 1) for cx in range(left, right + 1)]
+
+    def tile_indices(self, cx, cy):
+        """
+        Pick the tile type for every tile in a chunk, deterministically from the seed
+
+        Mostly grass variants, with dirt and stone patches from a coarse random grid.
+
+        :return: (chunk_tiles, chunk_tiles) array of tile indices, indexed [row, col]
+        """
+        rng = np.random.default_rng((self.seed, cx & 0xFFFFFFFF, cy & 0xFFFFFFFF))
+        count = self.chunk_tiles
+        indices = rng.choice(3, size=(count, count), p=(0.6, 0.25, 0.15))
+
+        # Patches: a 4x4 coarse grid upscaled to the chunk, thresholded
+        coarse = rng.random((4, 4))
+        patches = np.kron(coarse, np.ones((count // 4 + 1, count // 4 + 1)))[:count, :count]
+        indices[patches > 0.85] = 3
+        indices[patches < 0.05] = 4
+        return indices
+
+    def build_chunk(self, cx, cy):
+        """
+        Render one chunk's tiles into a single surface
+        """
+        size = self.tile_size
+        tiles = self.tileset.tiles
+        indices = self.tile_indices(cx, cy).tolist()
+
+        surface = pygame.Surface((self.chunk_size, self.chunk_size))
+        surface.blits([(tiles[index], (col * size, row * size))
+                       for row, line in enumerate(indices)
+                       for col, index in enumerate(line)], doreturn=False)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+
+        self.builds += 1
+        return surface
+
+    def chunk(self, cx, cy):
+        """
+        Get a chunk surface, building it and evicting the least recently used if needed
+        """
+        key = (cx, cy)
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = self.build_chunk(cx, cy)
+            self.chunks[key] = surface
+            while len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.chunks.move_to_end(key)
+        return surface
+
+    def prebuild(self, rect):
+        """
+        Build every chunk overlapping a world rect now (loading screens)
+
+        :param rect: Rect in world coordinates
+        """
+        for cx, cy in self.chunk_range(rect):
+            self.chunk(cx, cy)
+
+    def stream(self, view):
+        """
+        Build chunks the view is about to reach, a few per call
+
+        :param view: Camera view rect in world coordinates
+        """
+        area = view.inflate(self.prefetch_margin * 2, self.prefetch_margin * 2)
+        missing = [key for key in self.chunk_range(area) if key not in self.chunks]
+
+        # Nearest to the view centre first
+        center_x, center_y = view.center
+        half = self.chunk_size // 2
+        missing.sort(key=lambda key: (key[0] * self.chunk_size + half - center_x) ** 2 +
+                                     (key[1] * self.chunk_size + half - center_y) ** 2)
+        for cx, cy in missing[:self.builds_per_frame]:
+            self.chunk(cx, cy)
+
+    def draw(self, surface, camera_offset, clip=None):
+        """
+        Draw the ground under the camera
+
+        :param surface: Surface to draw on (the screen)
+        :param camera_offset: Integer (x, y) camera offset
+        :param clip: Optional screen rect to restrict drawing to (dirty-rect clears)
+        """
+        offset_x, offset_y = camera_offset
+        if clip is None:
+            area = pygame.Rect(offset_x, offset_y, *surface.get_size())
+        else:
+            area = clip.move(offset_x, offset_y)
+
+        size = self.chunk_size
+        sequence = []
+        for cx, cy in self.chunk_range(area):
+            chunk_rect = pygame.Rect(cx * size, cy * size, size, size)
+            part = chunk_rect.clip(area)
+            sequence.append((self.chunk(cx, cy), (part.x - offset_x, part.y - offset_y),
+                             part.move(-chunk_rect.x, -chunk_rect.y)))
+        surface.blits(sequence, doreturn=False)
+
+        if clip is None:
+            self.last_visible = len(sequence)
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import numpy as np
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from enemy_manager import EnemyManager
+
+
+class StubEnemy(pygame.sprite.Sprite):
+    """
+    The state EnemyManager copies into its arrays, without loading sprite sheets
+    """
+    def __init__(self, position):
+        super().__init__()
+        self.rect = pygame.Rect(position, (32, 32))
+        self.speed = 4
+        self.health = 100
+        self.attack_cooldown = 1000
+        self.last_attack_time = 0
+
+    def set_animation(self, name, restart=False):
+        pass
+
+
+class StubPlayer:
+    def __init__(self):
+        self.rect = pygame.Rect(400, 300, 16, 16)
+
+    def take_damage(self, amount):
+        pass
+
+
+def crowd_around_still_player(separation_strength, enemies=200, steps=600):
+    """
+    Let a horde chase a player who never moves
+
+    :return: Distance from each enemy to its nearest neighbour at the end
+    """
+    rng = np.random.default_rng(1)
+    manager = EnemyManager(separation_strength=separation_strength)
+    for position in rng.uniform(-1000, 1800, (enemies, 2)):
+        manager.add(StubEnemy(position))
+
+    player = StubPlayer()
+    for step in range(steps):
+        manager.update(player, current_time=step * 16)
+
+    positions = manager.positions[:manager.count]
+    delta = positions[:, None] - positions[None]
+    distance = np.hypot(delta[..., 0], delta[..., 1])
+    np.fill_diagonal(distance, np.inf)
+    return distance.min(axis=1)
+
+
+def test_separation_spreads_the_crowd():
+    nearest = crowd_around_still_player(EnemyManager().separation_strength)
+    assert np.median(nearest) > 10
+    assert np.count_nonzero(nearest < 5) <= 5
+
+
+def test_without_separation_the_crowd_stacks():
+    nearest = crowd_around_still_player(0)
+    assert np.median(nearest) < 1
@@ -0,0 +1,40 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from flow_field import FlowField
+
+
+def test_far_apart_targets_each_steer_their_own_enemies():
+    field = FlowField()
+    targets = [(0.0, 0.0), (3000.0, 0.0)]
+    field.set_targets(targets)
+
+    # Enemies 200 px beyond each target, on the far side from the other one
+    positions = np.array([[-200.0, 0.0], [3200.0, 0.0]])
+    directions, valid = field.sample(positions)
+
+    assert valid.all()
+    assert directions[0, 0] > 0 and directions[1, 0] < 0
+
+
+def test_overlapping_windows_steer_towards_the_nearest_target():
+    field = FlowField()
+    field.set_targets([(0.0, 0.0), (320.0, 0.0)])
+
+    directions, valid = field.sample(np.array([[100.0, 0.0], [250.0, 0.0]]))
+
+    assert valid.all()
+    assert directions[0, 0] < 0 and directions[1, 0] > 0
+
+
+def test_only_targets_that_changed_cell_are_recomputed():
+    field = FlowField()
+    field.set_targets([(0.0, 0.0), (3000.0, 0.0)])
+    assert field.recomputes == 2
+
+    field.set_targets([(5.0, 5.0), (3100.0, 0.0)])
+    assert field.recomputes == 3
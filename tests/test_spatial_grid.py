@@ -0,0 +1,86 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from spatial_grid import SweepGrid
+
+
+def first_hits(rects, starts, ends, half_sizes):
+    """
+    Brute-force oracle: test every segment against every rect
+
+    :return: {segment: (t, rect)} for the earliest contact of each segment
+    """
+    hits = {}
+    for segment, (start, end, half) in enumerate(zip(starts, ends, half_sizes)):
+        for index, (x, y, width, height) in enumerate(rects):
+            low = np.array([x, y]) - half
+            high = np.array([x + width, y + height]) + half
+            t_enter, t_exit = 0.0, 1.0
+            for axis in range(2):
+                delta = end[axis] - start[axis]
+                if delta == 0:
+                    if not low[axis] <= start[axis] <= high[axis]:
+                        t_enter, t_exit = 1.0, 0.0
+                    continue
+                t_low = (low[axis] - start[axis]) / delta
+                t_high = (high[axis] - start[axis]) / delta
+                t_enter = max(t_enter, min(t_low, t_high))
+                t_exit = min(t_exit, max(t_low, t_high))
+            if t_enter <= t_exit and (segment not in hits or t_enter < hits[segment][0]):
+                hits[segment] = (t_enter, index)
+    return hits
+
+
+def check_against_oracle(rects, starts, ends, half_sizes):
+    segments, targets, t = SweepGrid().sweep(rects, starts, ends, half_sizes)
+    expected = first_hits(rects, starts, ends, half_sizes)
+
+    assert sorted(segments.tolist()) == sorted(expected)
+    for segment, target, contact in zip(segments, targets, t):
+        expected_t, expected_target = expected[segment]
+        assert contact == expected_t
+        # Ties may pick either rect, but at the same contact time
+        if target != expected_target:
+            assert first_hits(rects[[target]], starts[[segment]], ends[[segment]],
+                              half_sizes[[segment]])[0][0] == expected_t
+
+
+def test_stationary_box_does_not_hit_distant_rect():
+    rects = np.array([[140.0, 140.0, 48.0, 48.0]])
+    starts = np.array([[250.0, 250.0]])
+    half_sizes = np.array([[10.0, 10.0]])
+    segments, _, _ = SweepGrid().sweep(rects, starts, starts.copy(), half_sizes)
+    assert len(segments) == 0
+
+
+def test_fast_box_does_not_tunnel():
+    rects = np.array([[100.0, 100.0, 4.0, 40.0]])
+    starts = np.array([[80.0, 120.0]])
+    ends = np.array([[130.0, 120.0]])
+    segments, targets, t = SweepGrid().sweep(rects, starts, ends, np.array([[1.5, 1.5]]))
+    assert segments.tolist() == [0] and targets.tolist() == [0]
+    assert abs(t[0] - (100 - 1.5 - 80) / 50) < 1e-12
+
+
+def test_axis_aligned_and_zero_length_segments_match_oracle():
+    rng = np.random.default_rng(3)
+    rects = np.column_stack((rng.uniform(-300, 300, (80, 2)), rng.uniform(4, 64, (80, 2))))
+    starts = rng.uniform(-300, 300, (600, 2))
+    moves = rng.uniform(-40, 40, (600, 2))
+    moves[:200, 0] = 0  # Vertical
+    moves[200:400, 1] = 0  # Horizontal
+    moves[400:] = 0  # Not moving at all
+    half_sizes = rng.choice([1.5, 10.0], (600, 1)).repeat(2, axis=1)
+    check_against_oracle(rects, starts, starts + moves, half_sizes)
+
+
+def test_diagonal_segments_match_oracle():
+    rng = np.random.default_rng(4)
+    rects = np.column_stack((rng.uniform(-300, 300, (80, 2)), rng.uniform(4, 64, (80, 2))))
+    starts = rng.uniform(-300, 300, (600, 2))
+    ends = starts + rng.uniform(-40, 40, (600, 2))
+    check_against_oracle(rects, starts, ends, np.full((600, 2), 1.5))